@@ -0,0 +1,56 @@
+"""
+수집 가능 기술 수 캐시
+
+마지막 탐색 결과(새로 수집할 수 있는 기술 수)를 작은 JSON 파일로 보관합니다.
+GUI는 무거운 모듈을 import하지 않고 이 파일만 읽어 즉시 표시하며,
+결과가 오래되었을 때만 백그라운드에서 다시 확인합니다.
+"""
+
+import datetime
+import json
+import os
+
+DEFAULT_PATH = os.path.join(os.environ.get('STACKLOAD_STATE_DIR', '.stackload'), 'availability.json')
+DEFAULT_MAX_AGE = 6 * 60 * 60  # 6시간
+
+
+def save_availability(count, path=DEFAULT_PATH):
+    """수집 가능 기술 수와 확인 시각 저장"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({
+            'available': int(count),
+            'checked_at': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        }, f)
+    os.replace(tmp_path, path)
+
+
+def load_availability(path=DEFAULT_PATH):
+    """캐시된 결과 반환 ({'available', 'checked_at', 'age'}), 없으면 None"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            entry = json.load(f)
+        checked_at = datetime.datetime.fromisoformat(entry['checked_at'])
+    except (FileNotFoundError, json.JSONDecodeError, KeyError, ValueError):
+        return None
+    entry['age'] = (datetime.datetime.now(datetime.timezone.utc) - checked_at).total_seconds()
+    return entry
+
+
+def is_stale(entry, max_age=DEFAULT_MAX_AGE):
+    return entry is None or entry['age'] > max_age
+
+
+def format_age(seconds):
+    """'just now', '12m ago', '3h ago', '2d ago' 형식의 경과 시간"""
+    seconds = max(0, int(seconds))
+    if seconds < 60:
+        return 'just now'
+    if seconds < 3600:
+        return f"{seconds // 60}m ago"
+    if seconds < 86400:
+        return f"{seconds // 3600}h ago"
+    return f"{seconds // 86400}d ago"
@@ -0,0 +1,469 @@
+"""
+오프라인 수집 파이프라인 벤치마크
+
+API 할당량을 쓰지 않고 실제 DiscoveryPipeline을 로컬 대체 서버에 대해 실행합니다.
+
+- 가짜 Gemini 엔드포인트 (GEMINI_BASE_URL): 프롬프트 종류별로 결정적인 응답
+- 로컬 웹 서버: 합성 홈페이지 + Devicon / Simple Icons CDN (DEVICON_BASE_URL 등)
+- 가짜 PostgREST 엔드포인트 (SUPABASE_URL): techs 조회 / 일괄 upsert / RPC
+
+세 서버 모두 지연 시간, 오류율, 429 비율을 설정할 수 있습니다. 기술 수마다 별도 프로세스에서
+파이프라인을 실행해 처리량, 기술별 지연 백분위수, 단계별 p50/p95, 최대 RSS를 출력합니다.
+
+    python benchmarks/discovery_bench.py
+    python benchmarks/discovery_bench.py --sizes 10,100 --gemini-latency-ms 300 --gemini-429-rate 0.02
+    python benchmarks/discovery_bench.py --sizes 100 --json bench.json
+"""
+
+import argparse
+import contextlib
+import hashlib
+import json
+import os
+import random
+import re
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+try:
+    import resource  # Unix 전용 (Windows에서는 RSS를 n/a로 표시)
+except ImportError:
+    resource = None
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_SIZES = '10,100,1000'
+# supabase-py는 JWT 형식의 키만 허용
+FAKE_SUPABASE_KEY = 'bench.eyJyb2xlIjoiYmVuY2gifQ.signature'
+
+
+def synthetic_name(i):
+    return f"SynthTech{i:04d}"
+
+
+def _stable_int(text, modulo):
+    return int(hashlib.sha256(text.encode('utf-8')).hexdigest()[:8], 16) % modulo
+
+
+# --- Local stand-ins ---
+class FaultInjector:
+    """요청마다 지연 / 오류 / 429를 주입 (seed 고정으로 재현 가능)"""
+
+    def __init__(self, latency_ms=0, jitter_ms=0, error_rate=0.0, throttle_rate=0.0, seed=0):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.requests = 0
+        self.errors = 0
+        self.throttles = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def next_fault(self):
+        """지연을 적용하고 'error' / 'throttle' / None 중 하나 반환"""
+        with self._lock:
+            self.requests += 1
+            delay = self.latency_ms + (self._random.uniform(0, self.jitter_ms) if self.jitter_ms else 0)
+            roll = self._random.random()
+        if delay:
+            time.sleep(delay / 1000)
+        with self._lock:
+            if roll < self.throttle_rate:
+                self.throttles += 1
+                return 'throttle'
+            if roll < self.throttle_rate + self.error_rate:
+                self.errors += 1
+                return 'error'
+        return None
+
+    def counters(self):
+        with self._lock:
+            return {'requests': self.requests, 'errors': self.errors, 'throttles': self.throttles}
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    server_version = 'StackLoadBench/1.0'
+
+    def log_message(self, format, *args):
+        pass
+
+    def _read_body(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        return self.rfile.read(length) if length else b''
+
+    def _send(self, status, body, content_type='application/json', head=False):
+        if not isinstance(body, bytes):
+            body = (body if isinstance(body, str) else json.dumps(body)).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if not head:
+            self.wfile.write(body)
+
+
+class FakeGeminiHandler(StandInHandler):
+    """generateContent 호환 엔드포인트 (프롬프트 종류별 고정 응답)"""
+
+    def do_POST(self):
+        body = json.loads(self._read_body() or b'{}')
+        fault = self.server.faults.next_fault()
+        if fault == 'throttle':
+            return self._send(429, {'error': {
+                'code': 429, 'status': 'RESOURCE_EXHAUSTED',
+                'message': f"Quota exceeded (bench). retryDelay: '{self.server.retry_delay}s'",
+            }})
+        if fault == 'error':
+            return self._send(500, {'error': {'code': 500, 'status': 'INTERNAL', 'message': 'injected error'}})
+
+        prompt = ' '.join(
+            part.get('text', '')
+            for content in body.get('contents', [])
+            for part in content.get('parts', [])
+        )
+        self._send(200, {
+            'candidates': [{
+                'content': {'role': 'model', 'parts': [{'text': self.server.answer(prompt)}]},
+                'finishReason': 'STOP',
+                'index': 0,
+            }],
+        })
+
+
+class FakeGeminiServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, faults, tech_count, site_url, retry_delay=1):
+        super().__init__(address, FakeGeminiHandler)
+        self.faults = faults
+        self.tech_count = tech_count
+        self.site_url = site_url
+        self.retry_delay = retry_delay
+
+    def answer(self, prompt):
+        if 'Technologies:' in prompt:
+            match = re.search(r'Technologies: (\[.*?\])\s*$', prompt, re.MULTILINE)
+            names = json.loads(match.group(1)) if match else []
+            return json.dumps({name: 30 + _stable_int(name, 70) for name in names})
+        if 'trending' in prompt:
+            return json.dumps([synthetic_name(i) for i in range(self.tech_count)])
+        if 'homepage URL' in prompt:
+            name = re.search(r"for '(.+?)'", prompt).group(1)
+            slug = name.lower()
+            return json.dumps({'homepage': f"{self.site_url}/site/{slug}", 'repo': f"https://github.com/bench/{slug}"})
+        if 'SVG logo' in prompt:
+            name = re.search(r"of '(.+?)'", prompt).group(1)
+            return f"{self.site_url}/logos/{name.lower()}.svg"
+        if 'popularity score of' in prompt:
+            name = re.search(r"of '(.+?)'", prompt).group(1)
+            return str(30 + _stable_int(name, 70))
+        name = re.search(r"기술명: (.+)", prompt)
+        name = name.group(1).strip() if name else 'unknown'
+        return json.dumps({
+            'description': f"{name} 벤치마크용 합성 기술",
+            'category': ['frontend', 'backend', 'database', 'devops', 'tool'][_stable_int(name, 5)],
+            'ai_explanation': f"{name}은(는) 벤치마크를 위해 생성된 합성 기술입니다. " * 4,
+            'project_suitability': ['합성 프로젝트 A', '합성 프로젝트 B', '합성 프로젝트 C'],
+            'learning_difficulty': {'label': '중급', 'stars': [True, True, True, False, False], 'description': '합성 데이터'},
+            'logoUrl': None,
+            'learningResources': [{'url': f"{self.site_url}/site/{name.lower()}", 'type': 'documentation', 'title': '공식 문서'}],
+        }, ensure_ascii=False)
+
+
+class FakeSiteHandler(StandInHandler):
+    """합성 홈페이지 + Devicon / Simple Icons CDN"""
+
+    def do_HEAD(self):
+        self._route(head=True)
+
+    def do_GET(self):
+        self._route(head=False)
+
+    def _route(self, head):
+        fault = self.server.faults.next_fault()
+        if fault == 'throttle':
+            return self._send(429, 'Too Many Requests', 'text/plain', head)
+        if fault == 'error':
+            return self._send(503, 'Service Unavailable', 'text/plain', head)
+
+        path = self.path.split('?', 1)[0]
+        icon_slugs = self.server.icon_slugs
+        if path.startswith('/site/'):
+            return self._send(200, self.server.homepage(path[len('/site/'):]), 'text/html; charset=utf-8', head)
+        if path == '/devicon/devicon.json':
+            return self._send(200, [{'name': s, 'versions': {'svg': ['original']}} for s in icon_slugs['devicon']], head=head)
+        if path == '/simple-icons/data.json':
+            return self._send(200, {'icons': [{'title': s, 'slug': s} for s in icon_slugs['simple_icons']]}, head=head)
+        if path.startswith('/devicon/icons/'):
+            slug = path.split('/')[3]
+            return self._send(200 if slug in icon_slugs['devicon'] else 404, self.server.SVG, 'image/svg+xml', head)
+        if path.startswith('/simple-icons/'):
+            slug = path[len('/simple-icons/'):]
+            return self._send(200 if slug in icon_slugs['simple_icons'] else 404, self.server.SVG, 'image/svg+xml', head)
+        if path.startswith('/logos/'):
+            return self._send(200, self.server.SVG, 'image/svg+xml', head)
+        self._send(404, 'Not Found', 'text/plain', head)
+
+
+class FakeSiteServer(ThreadingHTTPServer):
+    daemon_threads = True
+    SVG = b'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 1 1"><rect width="1" height="1"/></svg>'
+
+    def __init__(self, address, faults, tech_count, page_kb=20):
+        super().__init__(address, FakeSiteHandler)
+        self.faults = faults
+        self.page_kb = page_kb
+        slugs = [synthetic_name(i).lower() for i in range(tech_count)]
+        # 1/3은 Devicon, 1/3은 Simple Icons 인덱스에 있고 나머지는 Gemini 로고 검색으로 넘어감
+        self.icon_slugs = {
+            'devicon': {s for i, s in enumerate(slugs) if i % 3 == 0},
+            'simple_icons': {s for i, s in enumerate(slugs) if i % 3 == 1},
+        }
+
+    def homepage(self, slug):
+        paragraph = f"<p>{slug} is a synthetic technology used for offline benchmarking. </p>\n"
+        repeat = max(1, self.page_kb * 1024 // len(paragraph))
+        return f"<html><head><title>{slug}</title></head><body><h1>{slug}</h1>\n{paragraph * repeat}</body></html>"
+
+
+class FakePostgrestHandler(StandInHandler):
+    """techs 테이블 조회 / upsert, upsert_tech_stack RPC"""
+
+    def _fault(self):
+        fault = self.server.faults.next_fault()
+        if fault == 'throttle':
+            self._send(429, {'message': 'Too Many Requests', 'code': '429'})
+        elif fault == 'error':
+            self._send(500, {'message': 'injected error', 'code': 'XX000', 'details': None, 'hint': None})
+        return fault is not None
+
+    def do_GET(self):
+        body_ready = self._fault()
+        if body_ready:
+            return
+        if self.path.startswith('/rest/v1/techs'):
+            # slug_index 조회: 벤치마크는 빈 카탈로그에서 시작
+            return self._send(200, [])
+        self._send(404, {'message': 'not found'})
+
+    def do_POST(self):
+        body = json.loads(self._read_body() or b'null')
+        if self._fault():
+            return
+        if self.path.startswith('/rest/v1/rpc/upsert_tech_stack'):
+            self.server.store([{'slug': body.get('p_slug'), 'name': body.get('p_name')}])
+            return self._send(200, {'slug': body.get('p_slug')})
+        if self.path.startswith('/rest/v1/techs'):
+            rows = body if isinstance(body, list) else [body]
+            self.server.store(rows)
+            return self._send(201, rows)
+        self._send(404, {'message': 'not found'})
+
+    def do_HEAD(self):
+        self._send(200, b'', head=True)
+
+
+class FakePostgrestServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, faults):
+        super().__init__(address, FakePostgrestHandler)
+        self.faults = faults
+        self.rows = {}
+        self._lock = threading.Lock()
+
+    def store(self, rows):
+        with self._lock:
+            for row in rows:
+                self.rows[row.get('slug')] = row
+
+
+def start_server(server):
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host, port = server.server_address[:2]
+    return f"http://{host}:{port}"
+
+
+# --- Child: 실제 파이프라인 실행 ---
+def _peak_rss_mb(children=False):
+    """최대 RSS (MB), resource 모듈이 없으면 None"""
+    if resource is None:
+        return None
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN if children else resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 바이트
+    return usage / (1024 * 1024) if sys.platform == 'darwin' else usage / 1024
+
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
+
+
+def run_child(args):
+    """환경변수로 로컬 서버를 가리키도록 설정된 상태에서 파이프라인 1회 실행"""
+    import asyncio
+
+    sys.path.insert(0, ROOT)
+    os.chdir(args.workdir)
+    log_path = os.path.join(args.workdir, 'pipeline.log')
+    latencies = []
+    outcome = {'persisted': 0, 'failed': 0}
+
+    def on_event(event):
+        name = type(event).__name__
+        if name == 'RecordPersisted':
+            outcome['persisted'] += 1
+            latencies.append(event.duration)
+        elif name == 'TechFailed':
+            outcome['failed'] += 1
+
+    with open(log_path, 'w', encoding='utf-8') as log, contextlib.redirect_stdout(log):
+        import dynamic_tech_discovery
+        import telemetry
+        pipeline = dynamic_tech_discovery.DiscoveryPipeline(
+            max_techs=args.size, concurrency=args.concurrency, no_cache=True, on_event=on_event
+        )
+        started = time.monotonic()
+        summary = asyncio.run(pipeline.run())
+        wall = time.monotonic() - started
+        stages = {}
+        if summary.get('run_id'):
+            report = telemetry.summarize(telemetry.path_for(dynamic_tech_discovery.STATE_DIR, summary['run_id']))
+            stages = {name: {k: s[k] for k in ('count', 'p50', 'p95', 'max')} for name, s in report['stages'].items()}
+
+    result = {
+        'size': args.size,
+        'persisted': outcome['persisted'],
+        'failed': outcome['failed'],
+        'wall': wall,
+        'techs_per_minute': outcome['persisted'] / (wall / 60) if wall > 0 else 0.0,
+        'latency': {
+            'p50': percentile(latencies, 50),
+            'p95': percentile(latencies, 95),
+            'max': max(latencies) if latencies else 0.0,
+        },
+        'stages': stages,
+        'peak_rss_mb': _peak_rss_mb(),
+        'peak_child_rss_mb': _peak_rss_mb(children=True),
+        'log': log_path,
+    }
+    print(json.dumps(result))
+
+
+# --- Parent: 서버 기동 + 크기별 실행 ---
+def run_size(args, size, urls):
+    workdir = tempfile.mkdtemp(prefix=f"stackload-bench-{size}-")
+    env = dict(os.environ)
+    env.update({
+        'GEMINI_API_KEY': 'bench-key',
+        'GEMINI_BASE_URL': urls['gemini'],
+        'GEMINI_RPM': str(args.gemini_rpm),
+        'GEMINI_MAX_RPM': str(args.gemini_rpm),
+        'SUPABASE_URL': urls['postgrest'],
+        'SUPABASE_KEY': FAKE_SUPABASE_KEY,
+        'DEVICON_BASE_URL': f"{urls['site']}/devicon",
+        'SIMPLE_ICONS_CDN_URL': f"{urls['site']}/simple-icons",
+        'SIMPLE_ICONS_DATA_URL': f"{urls['site']}/simple-icons/data.json",
+        'STACKLOAD_STATE_DIR': os.path.join(workdir, '.stackload'),
+        'PYTHONIOENCODING': 'utf-8',
+    })
+    command = [sys.executable, os.path.abspath(__file__), '--child', '--size', str(size), '--workdir', workdir]
+    if args.concurrency:
+        command += ['--concurrency', str(args.concurrency)]
+    proc = subprocess.run(command, env=env, capture_output=True, text=True, encoding='utf-8', errors='replace')
+    if proc.returncode != 0:
+        raise RuntimeError(f"size {size} failed:\n{proc.stderr.strip()[-2000:]}")
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def print_results(results):
+    print(f"[BENCH] {'techs':>6} {'ok':>6} {'fail':>5} {'wall':>8} {'techs/min':>10} "
+          f"{'p50':>7} {'p95':>7} {'max':>7} {'RSS MB':>7} {'gemini':>7} {'429s':>5} {'db':>5}")
+    for r in results:
+        rss = f"{r['peak_rss_mb']:>7.1f}" if r['peak_rss_mb'] is not None else f"{'n/a':>7}"
+        print(f"[BENCH] {r['size']:>6} {r['persisted']:>6} {r['failed']:>5} {r['wall']:>7.1f}s {r['techs_per_minute']:>10.1f} "
+              f"{r['latency']['p50']:>6.2f}s {r['latency']['p95']:>6.2f}s {r['latency']['max']:>6.2f}s "
+              f"{rss} {r['servers']['gemini']['requests']:>7} "
+              f"{r['servers']['gemini']['throttles']:>5} {r['servers']['postgrest']['requests']:>5}")
+    for r in results:
+        stages = ', '.join(f"{name} p50={s['p50']:.2f}s p95={s['p95']:.2f}s" for name, s in sorted(r['stages'].items()))
+        print(f"[BENCH] {r['size']} techs stages: {stages}")
+        print(f"[BENCH] {r['size']} techs log: {r['log']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Offline discovery pipeline benchmark')
+    parser.add_argument('--sizes', default=DEFAULT_SIZES, help='쉼표로 구분한 기술 수 (기본값: 10,100,1000)')
+    parser.add_argument('--concurrency', type=int, default=None, help='단계별 기본 동시 실행 수 (기본값: 파이프라인 기본값)')
+    parser.add_argument('--gemini-rpm', type=int, default=6000, help='벤치마크용 Gemini 속도 제한 (분당 요청 수)')
+    parser.add_argument('--gemini-latency-ms', type=float, default=50)
+    parser.add_argument('--gemini-error-rate', type=float, default=0.0)
+    parser.add_argument('--gemini-429-rate', type=float, default=0.0)
+    parser.add_argument('--gemini-retry-delay', type=float, default=1, help='429 응답의 retryDelay(초)')
+    parser.add_argument('--site-latency-ms', type=float, default=20)
+    parser.add_argument('--site-error-rate', type=float, default=0.0)
+    parser.add_argument('--page-kb', type=int, default=20, help='합성 홈페이지 크기(KB)')
+    parser.add_argument('--db-latency-ms', type=float, default=30)
+    parser.add_argument('--db-error-rate', type=float, default=0.0)
+    parser.add_argument('--db-429-rate', type=float, default=0.0)
+    parser.add_argument('--seed', type=int, default=0, help='오류 주입 난수 seed')
+    parser.add_argument('--json', default=None, help='결과를 JSON 파일로 저장')
+    # 내부용: 크기별 자식 프로세스
+    parser.add_argument('--child', action='store_true', help=argparse.SUPPRESS)
+    parser.add_argument('--size', type=int, default=None, help=argparse.SUPPRESS)
+    parser.add_argument('--workdir', default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        return run_child(args)
+
+    sizes = [int(s) for s in args.sizes.split(',') if s.strip()]
+    results = []
+    for size in sizes:
+        gemini_faults = FaultInjector(args.gemini_latency_ms, args.gemini_latency_ms / 2, args.gemini_error_rate, args.gemini_429_rate, args.seed)
+        site_faults = FaultInjector(args.site_latency_ms, args.site_latency_ms / 2, args.site_error_rate, 0.0, args.seed)
+        db_faults = FaultInjector(args.db_latency_ms, args.db_latency_ms / 2, args.db_error_rate, args.db_429_rate, args.seed)
+
+        site = FakeSiteServer(('127.0.0.1', 0), site_faults, size, page_kb=args.page_kb)
+        urls = {'site': start_server(site)}
+        gemini = FakeGeminiServer(('127.0.0.1', 0), gemini_faults, size, urls['site'], retry_delay=args.gemini_retry_delay)
+        urls['gemini'] = start_server(gemini)
+        postgrest = FakePostgrestServer(('127.0.0.1', 0), db_faults)
+        urls['postgrest'] = start_server(postgrest)
+
+        print(f"[BENCH] Running {size} synthetic techs...")
+        try:
+            result = run_size(args, size, urls)
+        finally:
+            for server in (site, gemini, postgrest):
+                server.shutdown()
+                server.server_close()
+        result['servers'] = {
+            'gemini': gemini_faults.counters(),
+            'site': site_faults.counters(),
+            'postgrest': db_faults.counters(),
+        }
+        result['rows_in_db'] = len(postgrest.rows)
+        print(f"[BENCH]   {result['persisted']}/{size} persisted in {result['wall']:.1f}s "
+              f"({result['techs_per_minute']:.1f} techs/min), {result['rows_in_db']} rows in fake DB")
+        results.append(result)
+
+    print_results(results)
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"[BENCH] Results saved to {args.json}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,93 @@
+"""
+dynamic_tech_discovery import 시간 측정
+
+`python -X importtime`으로 모듈을 새 프로세스에서 import하고 누적 시간이 예산을 넘거나
+무거운 의존성(google-genai, supabase, crawl4ai 등)이 import 시점에 로드되면 실패(종료 코드 1)합니다.
+
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --budget-ms 200 --repeat 5
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_MODULE = 'dynamic_tech_discovery'
+DEFAULT_BUDGET_MS = 300
+DEFAULT_REPEAT = 3
+
+# import 시점에 로드되면 안 되는 모듈 (처음 사용할 때만 import)
+LAZY_MODULES = ['google.genai', 'supabase', 'crawl4ai', 'httpx', 'openai', 'bs4']
+
+_LINE_PATTERN = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)')
+
+
+def parse_importtime(stderr):
+    """-X importtime 출력 -> [(모듈, self_us, cumulative_us, 깊이)]"""
+    rows = []
+    for line in stderr.splitlines():
+        match = _LINE_PATTERN.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            rows.append((name, int(self_us), int(cumulative_us), len(indent) // 2))
+    return rows
+
+
+def measure(module):
+    """새 프로세스에서 module import (누적 시간 ms, 전체 행, 로드된 무거운 모듈)"""
+    check = f"import sys, {module}; print(','.join(m for m in {LAZY_MODULES!r} if m in sys.modules))"
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', check],
+        cwd=ROOT, capture_output=True, text=True, encoding='utf-8', errors='replace'
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else 'import failed')
+
+    rows = parse_importtime(proc.stderr)
+    total_us = next((cumulative for name, _, cumulative, _ in reversed(rows) if name == module), None)
+    if total_us is None:
+        raise RuntimeError(f"{module} not found in -X importtime output")
+    loaded = [name for name in proc.stdout.strip().split(',') if name]
+    return total_us / 1000, rows, loaded
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Import time budget check')
+    parser.add_argument('--module', default=DEFAULT_MODULE, help='측정할 모듈 이름')
+    parser.add_argument('--budget-ms', type=float,
+                        default=float(os.environ.get('IMPORT_TIME_BUDGET_MS', DEFAULT_BUDGET_MS)),
+                        help='허용 누적 import 시간(ms) (기본값: IMPORT_TIME_BUDGET_MS 환경변수 또는 300)')
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT, help='측정 횟수 (가장 빠른 값 사용)')
+    parser.add_argument('--top', type=int, default=10, help='출력할 가장 느린 import 수')
+    args = parser.parse_args()
+
+    # 첫 실행은 .pyc 생성 비용이 섞이므로 여러 번 측정해 최솟값 사용
+    best_ms, best_rows, loaded = None, [], []
+    for _ in range(max(1, args.repeat)):
+        total_ms, rows, loaded = measure(args.module)
+        if best_ms is None or total_ms < best_ms:
+            best_ms, best_rows = total_ms, rows
+
+    print(f"[TIME] import {args.module}: {best_ms:.1f}ms (budget {args.budget_ms:.0f}ms, best of {max(1, args.repeat)})")
+    print(f"[INFO] Slowest imports (self time):")
+    for name, self_us, cumulative_us, _ in sorted(best_rows, key=lambda r: r[1], reverse=True)[:args.top]:
+        print(f"    {self_us / 1000:8.1f}ms self {cumulative_us / 1000:8.1f}ms cumulative  {name}")
+
+    failed = False
+    if loaded:
+        print(f"[ERROR] Heavy modules loaded at import time: {', '.join(loaded)}")
+        failed = True
+    if best_ms > args.budget_ms:
+        print(f"[ERROR] Import time {best_ms:.1f}ms exceeds budget {args.budget_ms:.0f}ms")
+        failed = True
+    if not failed:
+        print("[SUCCESS] Import time within budget")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,128 @@
+"""
+기술별 원본 콘텐츠 지문
+
+크롤링한 홈페이지 마크다운(정규화)과 검색으로 찾은 homepage / repo를 해시한 값을
+slug별로 .stackload/fingerprints.json에 기록합니다. 다시 수집할 때 지문이 같고
+마지막 AI 보강이 신선도 기간 안이면 enhance 단계를 건너뛰고 기존 레코드 값을 재사용합니다.
+인기도는 원본 콘텐츠와 무관하므로 마지막 점수 산정 시각의 신선도만 봅니다.
+"""
+
+import datetime
+import hashlib
+import json
+import os
+import re
+
+DEFAULT_FRESHNESS_DAYS = 30
+SAVE_EVERY = 25
+
+_WHITESPACE = re.compile(r'\s+')
+
+
+def normalize_content(text):
+    """공백/대소문자/잘림 표시 차이를 무시하도록 정규화"""
+    text = (text or '').replace('...(truncated)', '')
+    return _WHITESPACE.sub(' ', text).strip().lower()
+
+
+def _normalize_url(url):
+    url = (url or '').strip().lower()
+    url = re.sub(r'^https?://(www\.)?', '', url)
+    return url.rstrip('/')
+
+
+def compute_fingerprint(crawled, homepage=None, repo=None):
+    """크롤링 콘텐츠 + homepage + repo 지문 (sha256 hex)"""
+    payload = json.dumps([normalize_content(crawled), _normalize_url(homepage), _normalize_url(repo)], ensure_ascii=False)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def _now():
+    return datetime.datetime.now(datetime.timezone.utc)
+
+
+def _parse_ts(value):
+    """ISO 시각 -> aware datetime (시간대가 없으면 로컬 시각으로 간주, 실패 시 None)"""
+    if not value:
+        return None
+    try:
+        ts = datetime.datetime.fromisoformat(str(value).replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    return ts if ts.tzinfo else ts.astimezone()
+
+
+class FingerprintIndex:
+    """slug -> {'fingerprint', 'checked_at', 'enhanced_at', 'scored_at', 'logo_at'}"""
+
+    def __init__(self, path, freshness_days=DEFAULT_FRESHNESS_DAYS):
+        self.path = path
+        self.freshness = datetime.timedelta(days=freshness_days)
+        self.entries = {}
+        self.unchanged = 0           # 지문이 같았던 기술 수
+        self.enhance_saved = 0       # 건너뛴 enhance 호출 수
+        self.reused_scores = set()   # 기존 인기도를 재사용한 slug
+        self.score_calls_saved = 0   # 건너뛴 배치 점수 호출 수
+        self._dirty = 0
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            self.entries = {}
+
+    def save(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.entries, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+        self._dirty = 0
+
+    def is_fresh(self, timestamp):
+        ts = _parse_ts(timestamp)
+        return ts is not None and _now() - ts < self.freshness
+
+    def can_skip_enhance(self, slug, fingerprint):
+        """지문이 같고 마지막 AI 보강이 신선도 기간 안인지"""
+        entry = self.entries.get(slug)
+        if not entry or entry.get('fingerprint') != fingerprint:
+            return False
+        self.unchanged += 1
+        return self.is_fresh(entry.get('enhanced_at'))
+
+    def score_is_fresh(self, slug):
+        entry = self.entries.get(slug)
+        return bool(entry) and self.is_fresh(entry.get('scored_at'))
+
+    def record(self, slug, fingerprint=None, enhanced=False, scored=False, logo=False, previous_updated_at=None):
+        """저장 완료된 레코드의 지문 기록 (이번에 실제로 실행한 단계만 시각 갱신)
+
+        fingerprint가 None이면 원본 콘텐츠를 다시 확인하지 않은 것으로 보고 지문은 그대로 둡니다.
+        저장하면서 updated_at이 바뀌므로, 기록이 없는 단계 시각은 갱신 전 updated_at(previous_updated_at)으로 채웁니다.
+        """
+        entry = self.entries.setdefault(slug, {})
+        now = _now().isoformat()
+        previous = _parse_ts(previous_updated_at)
+        if previous:
+            for field in ('checked_at', 'scored_at', 'logo_at'):
+                entry.setdefault(field, previous.astimezone(datetime.timezone.utc).isoformat())
+        if fingerprint is not None:
+            if enhanced or entry.get('fingerprint') != fingerprint:
+                entry['enhanced_at'] = now if enhanced else None
+            entry['fingerprint'] = fingerprint
+            entry['checked_at'] = now
+        if scored:
+            entry['scored_at'] = now
+        if logo:
+            entry['logo_at'] = now
+        self._dirty += 1
+        if self._dirty >= SAVE_EVERY:
+            self.save()
+
+    def calls_saved(self):
+        return self.enhance_saved + self.score_calls_saved
@@ -0,0 +1,242 @@
+"""
+Supabase <-> stacks.json 증분 양방향 동기화
+
+원격 techs 테이블에서 updated_at 워터마크 이후에 바뀐 행만 키셋 페이지네이션으로
+가져오고, 마지막 동기화 이후 로컬에서 바뀐 레코드는 쓰기 큐로 올립니다.
+updated_at은 DB가 기록하며(techs_updated_at.sql), 커밋 순서가 어긋난 행을 놓치지 않도록
+워터마크보다 overlap초 앞부터 다시 조회합니다.
+
+필드별로 마지막으로 동기화한 원격 값의 해시(base)를 보관해, 원격 값이 base와 다를 때만
+원격에서 바뀐 필드로 봅니다. 같은 필드가 양쪽에서 모두 바뀌었으면 로컬 수정 시각이 원격 행의
+updated_at보다 늦을 때 로컬 값을, 아니면 원격 값을 사용합니다.
+
+로컬 필드 수정 시각은 StackStore 변경 알림(track)으로 기록하며, 원격에서 삭제된 행은
+updated_at으로 알 수 없으므로 반영하지 않습니다.
+"""
+
+import datetime
+import hashlib
+import json
+import os
+
+from supabase_sync import to_table_row, from_table_row, SYNC_FIELDS
+
+DEFAULT_PAGE_SIZE = 1000
+DEFAULT_OVERLAP_SECONDS = 300
+
+
+def parse_ts(value):
+    """ISO 시각 -> UTC aware datetime (시간대가 없으면 로컬 시각으로 간주, 실패 시 None)"""
+    if not value:
+        return None
+    try:
+        ts = datetime.datetime.fromisoformat(str(value).replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    if ts.tzinfo is None:
+        ts = ts.astimezone()
+    return ts.astimezone(datetime.timezone.utc)
+
+
+def _now():
+    return datetime.datetime.now(datetime.timezone.utc)
+
+
+def _digest(value):
+    """필드 값 비교용 짧은 해시"""
+    return hashlib.sha1(json.dumps(value, ensure_ascii=False, sort_keys=True).encode('utf-8')).hexdigest()[:12]
+
+
+class DeltaSync:
+    """워터마크 기반 증분 pull + 로컬 변경 push + 필드 단위 충돌 해결"""
+
+    def __init__(self, state_path, table='techs', page_size=DEFAULT_PAGE_SIZE, overlap=DEFAULT_OVERLAP_SECONDS, log=print):
+        self.state_path = state_path
+        # 필드 base는 크기가 커서 편집마다 저장하는 수정 시각과 분리
+        self.bases_path = os.path.splitext(state_path)[0] + '_bases.json'
+        self.table = table
+        self.page_size = page_size
+        self.overlap = datetime.timedelta(seconds=overlap)
+        self.log = log
+        self.watermark = None       # 원격에서 본 가장 최근 updated_at
+        self.field_times = {}       # slug -> {field: 로컬 수정 시각 (ISO, UTC)}
+        self.bases = {}             # slug -> {field: 마지막으로 동기화한 원격 값의 해시}
+        self.applying = False       # 원격 값을 반영하는 중에는 로컬 수정으로 기록하지 않음
+        self.pages_fetched = 0
+        self.bytes_fetched = 0
+        self._load()
+
+    # --- State ---
+    def _load(self):
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return
+        self.watermark = state.get('watermark')
+        self.field_times = state.get('field_times', {})
+        try:
+            with open(self.bases_path, 'r', encoding='utf-8') as f:
+                self.bases = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            self.bases = {}
+
+    def _write(self, path, data):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    def save(self, bases=False):
+        self._write(self.state_path, {'watermark': self.watermark, 'field_times': self.field_times})
+        if bases:
+            self._write(self.bases_path, self.bases)
+
+    # --- Local changes ---
+    def track(self, changes):
+        """StackStore 구독자: 로컬에서 바뀐 필드의 수정 시각 기록"""
+        if self.applying:
+            return
+        recorded = False
+        for change in changes:
+            if change.kind == 'delete':
+                recorded = self.field_times.pop(change.slug, None) is not None or recorded
+                continue
+            previous = change.previous or {}
+            fields = [f for f in SYNC_FIELDS if change.record.get(f) != previous.get(f)]
+            if not fields:
+                continue
+            # 레코드의 updated_at이 있으면 그 시각, 없으면 지금
+            ts = (parse_ts(change.record.get('updated_at')) or _now()).isoformat()
+            times = self.field_times.setdefault(change.slug, {})
+            for field in fields:
+                times[field] = ts
+            recorded = True
+        if recorded:
+            self.save()
+
+    def dirty_slugs(self):
+        """마지막 동기화 이후 로컬에서 수정된 slug"""
+        return set(self.field_times)
+
+    # --- Pull ---
+    def _track_watermark(self, rows):
+        for row in rows:
+            updated_at = parse_ts(row.get('updated_at'))
+            if updated_at and (self.watermark is None or updated_at > parse_ts(self.watermark)):
+                self.watermark = updated_at.isoformat()
+
+    def fetch(self, client):
+        """워터마크 - overlap 이후 바뀐 원격 행 조회 (처음이면 전체)
+
+        워터마크는 apply()가 끝난 뒤에만 옮기므로 반영 전에 중단되면 같은 구간을 다시 가져옵니다.
+        overlap 구간에서 다시 받은 행은 base와 같으므로 병합 결과에 영향이 없습니다.
+        """
+        columns = ','.join(['slug', 'updated_at'] + list(SYNC_FIELDS.values()))
+        since = parse_ts(self.watermark)
+        since = (since - self.overlap).isoformat() if since else None
+        cursor = None   # 페이지 사이의 (updated_at, slug) 키셋 위치
+        rows = []
+        while True:
+            query = client.table(self.table).select(columns)
+            if cursor is not None:
+                updated_at, slug = cursor
+                query = query.or_(f'updated_at.gt."{updated_at}",and(updated_at.eq."{updated_at}",slug.gt."{slug}")')
+            elif since is not None:
+                query = query.gte('updated_at', since)
+            page = query.order('updated_at').order('slug').limit(self.page_size).execute().data or []
+            self.pages_fetched += 1
+            self.bytes_fetched += len(json.dumps(page, ensure_ascii=False).encode('utf-8'))
+            rows.extend(page)
+            if len(page) < self.page_size:
+                break
+            last = page[-1]
+            cursor = (last.get('updated_at'), last['slug'])
+        return rows
+
+    # --- Merge ---
+    def merge(self, store, rows):
+        """원격 행을 로컬 레코드와 병합 -> (로컬에 반영할 레코드, 원격에 올릴 레코드, 로컬 우선 필드 수)"""
+        updates = {}
+        conflicts = 0
+        remotes = {}
+        for row in rows:
+            slug = row.get('slug')
+            if not slug:
+                continue
+            remote = remotes[slug] = from_table_row(row)
+            local = store.get(slug)
+            if local is None:
+                updates[slug] = remote
+                continue
+
+            remote_ts = parse_ts(row.get('updated_at'))
+            times = self.field_times.get(slug, {})
+            base = self.bases.get(slug, {})
+            merged = dict(local)
+            for field in SYNC_FIELDS:
+                if field not in remote or remote[field] == local.get(field):
+                    continue
+                if field in base and base[field] == _digest(remote[field]):
+                    continue  # 원격은 그대로 -> 로컬 값 유지 (로컬 수정이면 push)
+                local_ts = parse_ts(times.get(field))
+                if local_ts and (remote_ts is None or local_ts > remote_ts):
+                    conflicts += 1  # 양쪽 모두 수정, 로컬이 더 최근 -> 로컬 값 유지
+                    continue
+                merged[field] = remote[field]
+            if merged != local:
+                local_updated = parse_ts(local.get('updated_at'))
+                if remote_ts and (local_updated is None or remote_ts > local_updated):
+                    merged['updated_at'] = row.get('updated_at')
+                updates[slug] = merged
+
+        # 로컬에서 바뀐 레코드는 병합 결과가 원격 행과 다를 때만 push
+        pushes = []
+        for slug in self.dirty_slugs():
+            record = updates.get(slug) or store.get(slug)
+            if not record or not record.get('name'):
+                continue
+            remote = remotes.get(slug)
+            if remote is None or any(field not in remote or record.get(field) != remote[field] for field in SYNC_FIELDS):
+                pushes.append(record)
+        return list(updates.values()), pushes, conflicts
+
+    def commit(self, rows):
+        """반영 완료 후 워터마크 / 필드 base 갱신 + push한 수정 기록 정리
+
+        base는 원격에서 받은 값으로만 갱신하므로, 쓰기 큐의 push가 반영되기 전에 다시 동기화해도
+        원격 값이 base와 같아 로컬 값이 유지됩니다.
+        """
+        self._track_watermark(rows)
+        for row in rows:
+            if row.get('slug'):
+                remote = from_table_row(row)
+                self.bases[row['slug']] = {field: _digest(remote[field]) for field in SYNC_FIELDS if field in remote}
+        self.field_times = {}
+        self.save(bases=True)
+
+    # --- Entry point ---
+    def pull(self, client):
+        """네트워크 구간 (백그라운드 스레드용)"""
+        self.pages_fetched = 0
+        self.bytes_fetched = 0
+        return self.fetch(client)
+
+    def apply(self, store, rows, queue):
+        """병합 결과를 저장소에 반영하고 로컬 변경을 쓰기 큐에 추가 (메인 스레드용)"""
+        updates, pushes, conflicts = self.merge(store, rows)
+        self.applying = True
+        try:
+            store.put_many(updates)
+        finally:
+            self.applying = False
+        if pushes:
+            queue.upsert_many([to_table_row(record) for record in pushes])
+        self.commit(rows)
+        return {
+            'pulled': len(rows), 'applied': len(updates), 'pushed': len(pushes), 'conflicts': conflicts,
+            'pages': self.pages_fetched, 'bytes': self.bytes_fetched,
+        }
@@ -1,21 +1,29 @@
 import argparse
 import json
 import os
-import requests
-from openai import OpenAI
 import datetime
-from bs4 import BeautifulSoup
-from google import genai
-from google.genai import types
-from supabase import create_client, Client
 from dotenv import load_dotenv
 import time
 import re
-from urllib.parse import urljoin, urlparse
 import asyncio
-from crawl4ai import AsyncWebCrawler
 import sys
 import codecs
+from response_cache import ResponseCache
+from stack_journal import StackJournal, DEFAULT_COMPACT_EVERY
+from stack_store import StackStore, create_slug
+from content_fingerprint import FingerprintIndex, compute_fingerprint, DEFAULT_FRESHNESS_DAYS
+from refresh_daemon import (RefreshDaemon, RefreshPlanner, CallBudget, parse_ttls, DEFAULT_TTLS,
+                            DEFAULT_HOURLY_BUDGET, DEFAULT_TICK_MINUTES)
+from logo_resolver import LogoResolver
+from stage_scheduler import StageScheduler, parse_stage_limits
+from run_manifest import RunManifest
+from slug_index import SlugIndex
+from availability import save_availability
+from supabase_sync import BatchUpserter, DEFAULT_BATCH_SIZE as DEFAULT_UPSERT_BATCH_SIZE, DEFAULT_FLUSH_SECONDS
+from rate_limiter import AdaptiveRateLimiter, is_rate_limit_error, retry_after_seconds, DEFAULT_RPM, DEFAULT_MAX_RPM
+from pipeline_events import (RunStarted, TechStarted, StageFinished, RecordPersisted, TechFailed,
+                             AvailabilityChecked, RunFinished, print_event, log)
+import telemetry
 def setup_utf8_output():
     """UTF-8 출력을 위한 환경 설정"""
     if os.name == 'nt':  # Windows
@@ -28,13 +36,13 @@ def setup_utf8_output():
 def safe_print(message):
     """UTF-8 안전 출력 함수"""
     try:
-        print(message)
+        log(message)
     except UnicodeEncodeError:
         # 유니코드 문자를 ASCII로 변환하여 출력
         message_ascii = message.encode('ascii', errors='ignore').decode('ascii')
-        print(message_ascii)
+        log(message_ascii)
     except Exception:
-        print("[OUTPUT_ERROR]")
+        log("[OUTPUT_ERROR]")
 
 # UTF-8 출력 환경 설정
 setup_utf8_output()
@@ -43,38 +51,198 @@ setup_utf8_output()
 load_dotenv()
 
 # --- API Key & Supabase Setup ---
-try:
-    GEMINI_API_KEY = os.environ.get('GEMINI_API_KEY')
-    if not GEMINI_API_KEY:
-        print("[WARNING] GEMINI_API_KEY not set. AI enhancement will be skipped.")
-        genai_model = None
-    else:
-        # google-genai SDK 초기화
-        genai_client = genai.Client(api_key=GEMINI_API_KEY)
-        print("[SUCCESS] Gemini API configured with Google Search Grounding (google-genai SDK).")
-
-    SUPABASE_URL = os.environ.get('SUPABASE_URL')
-    SUPABASE_KEY = os.environ.get('SUPABASE_KEY')
+# google-genai / supabase / crawl4ai는 import 비용이 크므로 처음 사용할 때 불러오고 클라이언트를 만든다
+_UNSET = object()
+genai_client = _UNSET
+supabase = _UNSET
+
+def get_genai_client():
+    """Gemini 클라이언트 (첫 호출 시 생성, 키가 없거나 실패하면 None)"""
+    global genai_client
+    if genai_client is _UNSET:
+        genai_client = None
+        api_key = os.environ.get('GEMINI_API_KEY')
+        if not api_key:
+            log("[WARNING] GEMINI_API_KEY not set. AI enhancement will be skipped.")
+        else:
+            try:
+                from google import genai
+                # google-genai SDK 초기화 (GEMINI_BASE_URL이 있으면 해당 엔드포인트 사용, 예: 벤치마크용 로컬 서버)
+                base_url = os.environ.get('GEMINI_BASE_URL')
+                http_options = {'base_url': base_url} if base_url else None
+                genai_client = genai.Client(api_key=api_key, http_options=http_options)
+                log("[SUCCESS] Gemini API configured with Google Search Grounding (google-genai SDK).")
+            except Exception as e:
+                log(f"[ERROR] Gemini setup failed: {e}")
+    return genai_client
 
-    if SUPABASE_URL and SUPABASE_KEY:
-        supabase: Client = create_client(SUPABASE_URL, SUPABASE_KEY)
-        print("[SUCCESS] Supabase client created.")
-    else:
-        print("[WARNING] Supabase credentials not set. Database operations will be skipped.")
+def get_supabase():
+    """Supabase 클라이언트 (첫 호출 시 생성, 설정이 없거나 실패하면 None)"""
+    global supabase
+    if supabase is _UNSET:
         supabase = None
+        url = os.environ.get('SUPABASE_URL')
+        key = os.environ.get('SUPABASE_KEY')
+        if not (url and key):
+            log("[WARNING] Supabase credentials not set. Database operations will be skipped.")
+        else:
+            try:
+                from supabase import create_client
+                supabase = create_client(url, key)
+                log("[SUCCESS] Supabase client created.")
+            except Exception as e:
+                log(f"[ERROR] Supabase setup failed: {e}")
+    return supabase
+
+GEMINI_MODEL = 'gemini-2.0-flash-lite'
+
+# 동시에 처리할 기술 수 (CLI --concurrency 또는 환경변수 MAX_CONCURRENT)
+DEFAULT_MAX_CONCURRENT = 2
+
+# 크롤러 풀 설정 (CLI --crawl-pages / --crawl-recycle-after 또는 환경변수)
+DEFAULT_CRAWL_MAX_PAGES = 4
+DEFAULT_CRAWL_RECYCLE_AFTER = 50
+
+def strip_code_fence(text):
+    """응답 텍스트에서 마크다운 코드 블록 제거"""
+    text = text.strip()
+    if text.startswith('```json'):
+        text = text[7:]
+    if text.startswith('```'):
+        text = text[3:]
+    if text.endswith('```'):
+        text = text[:-3]
+    return text.strip()
+
+def parse_json_response(text):
+    """Gemini 응답을 JSON으로 파싱 (코드 블록 제거 포함)"""
+    return json.loads(strip_code_fence(text))
+
+# 로컬 상태 파일 위치 (응답 캐시 등)
+STATE_DIR = os.environ.get('STACKLOAD_STATE_DIR', '.stackload')
+
+# main()에서 설정되는 Gemini 응답 캐시 (--no-cache면 None)
+response_cache = None
+
+def configure_response_cache(no_cache=False, refresh=False):
+    """CLI 옵션에 따라 Gemini 응답 캐시 설정"""
+    global response_cache
+    if response_cache:
+        response_cache.close()
+        response_cache = None
+    if no_cache:
+        log("[CACHE] Response cache disabled (--no-cache)")
+        return None
+
+    max_mb = os.environ.get('GEMINI_CACHE_MAX_MB')
+    kwargs = {}
+    if max_mb:
+        try:
+            kwargs['max_bytes'] = int(float(max_mb) * 1024 * 1024)
+        except ValueError:
+            safe_print(f"[WARNING] Invalid GEMINI_CACHE_MAX_MB value '{max_mb}'. 숫자로 설정해주세요.")
+    try:
+        response_cache = ResponseCache(os.path.join(STATE_DIR, 'gemini_cache.sqlite3'), refresh=refresh, **kwargs)
+        if refresh:
+            log("[CACHE] Refresh mode: cached responses will be re-fetched (--refresh)")
+    except Exception as e:
+        log(f"[WARNING] Response cache unavailable: {e}")
+        response_cache = None
+    return response_cache
+
+def print_cache_stats():
+    """응답 캐시 적중/미스 통계 출력"""
+    if not response_cache:
+        return
+    stats = response_cache.stats()
+    log(f"[CACHE] Hits: {stats['hits']}, Misses: {stats['misses']}, "
+        f"Entries: {stats['entries']} ({stats['bytes'] / 1024:.1f} KB), Evictions: {stats['evictions']}")
+    for kind, counts in stats['by_kind'].items():
+        log(f"[CACHE]   {kind}: {counts['hits']} hit / {counts['misses']} miss")
+
+# 모델별 공유 속도 제한기 (GEMINI_RPM / GEMINI_MAX_RPM 환경변수)
+rate_limiters = {}
+
+# 429 재시도 횟수 (GEMINI_MAX_RETRIES 환경변수)
+DEFAULT_GEMINI_MAX_RETRIES = 5
+
+def get_rate_limiter(model):
+    """모델별 속도 제한기 (없으면 생성)"""
+    limiter = rate_limiters.get(model)
+    if limiter is None:
+        rpm = _resolve_int_setting(None, 'GEMINI_RPM', DEFAULT_RPM)
+        max_rpm = _resolve_int_setting(None, 'GEMINI_MAX_RPM', max(DEFAULT_MAX_RPM, rpm))
+        limiter = AdaptiveRateLimiter(model, rpm=rpm, max_rpm=max_rpm)
+        rate_limiters[model] = limiter
+    return limiter
+
+def print_rate_limiter_stats():
+    """모델별 현재 속도와 429로 멈춘 시간 출력"""
+    for limiter in rate_limiters.values():
+        stats = limiter.stats()
+        log(f"[RATE] {stats['model']}: {stats['rpm']:.1f} rpm, calls: {stats['calls']}, "
+            f"429s: {stats['throttle_events']}, throttled: {stats['throttled_time']:.1f}s")
+
+async def generate_text(prompt, kind, grounded=True, parse=None):
+    """Gemini 비동기 호출 (aio 클라이언트 사용, 이벤트 루프를 블로킹하지 않음)
+
+    응답 캐시가 켜져 있으면 kind별 TTL로 캐시를 먼저 조회합니다.
+    parse가 주어지면 파싱에 성공한 응답만 캐시하고 파싱 결과를 반환합니다.
+    """
+    cache_model = GEMINI_MODEL if not grounded else f"{GEMINI_MODEL}+search"
+    if response_cache:
+        cached = response_cache.get(kind, cache_model, prompt)
+        if cached is not None:
+            telemetry.count('cache_hits')
+            return parse(cached) if parse else cached
+        telemetry.count('cache_misses')
+
+    config = None
+    if grounded:
+        from google.genai import types
+        config = types.GenerateContentConfig(
+            tools=[types.Tool(google_search=types.GoogleSearch())]
+        )
 
-except Exception as e:
-    print(f"[ERROR] Setup failed: {e}")
-    exit()
+    # 모든 호출이 모델별 속도 제한기를 공유, 429면 전체 일시정지 후 재시도
+    limiter = get_rate_limiter(GEMINI_MODEL)
+    max_retries = _resolve_int_setting(None, 'GEMINI_MAX_RETRIES', DEFAULT_GEMINI_MAX_RETRIES)
+    for attempt in range(max_retries):
+        await limiter.acquire()
+        telemetry.count('gemini_calls')
+        telemetry.count('prompt_bytes', len(prompt.encode('utf-8')))
+        try:
+            response = await get_genai_client().aio.models.generate_content(
+                model=GEMINI_MODEL,
+                contents=prompt,
+                config=config
+            )
+        except Exception as e:
+            if is_rate_limit_error(e) and attempt < max_retries - 1:
+                pause = limiter.on_throttle(retry_after_seconds(e))
+                telemetry.count('retries')
+                log(f"        [WARNING] Rate limit hit ({kind}). Backing off {pause:.0f}s, "
+                    f"rate now {limiter.rpm:.1f} rpm ({attempt+1}/{max_retries})")
+                continue
+            raise
+        limiter.on_success()
+        break
+
+    text = (response.text or '').strip()
+    telemetry.count('response_bytes', len(text.encode('utf-8')))
+    result = parse(text) if parse else text
+    if response_cache and text:
+        response_cache.put(kind, cache_model, prompt, text)
+    return result
 
 # --- Dynamic Tech Stack Discovery ---
 
-def discover_trending_technologies():
+async def discover_trending_technologies():
     """Gemini Search를 이용한 최신 기술 트렌드 수집"""
-    print("[SEARCH] Discovering trending technologies via Gemini Search...")
+    log("[SEARCH] Discovering trending technologies via Gemini Search...")
 
-    if not genai_client:
-        print("[WARNING] Gemini not available. Using fallback list.")
+    if not get_genai_client():
+        log("[WARNING] Gemini not available. Using fallback list.")
         return get_comprehensive_base_technologies()
 
     prompt = """
@@ -93,34 +261,17 @@ def discover_trending_technologies():
     """
 
     try:
-        response = genai_client.models.generate_content(
-            model='gemini-2.0-flash-lite',
-            contents=prompt,
-            config=types.GenerateContentConfig(
-                tools=[types.Tool(google_search=types.GoogleSearch())]
-            )
-        )
-        text = response.text.strip()
-        
-        # JSON 파싱
-        if text.startswith('```json'):
-            text = text[7:]
-        if text.startswith('```'):
-            text = text[3:]
-        if text.endswith('```'):
-            text = text[:-3]
-            
-        techs = json.loads(text.strip())
+        techs = await generate_text(prompt, 'discovery', parse=parse_json_response)
         
         # 기본 기술 목록도 추가하여 풍부하게 유지
         base_techs = get_comprehensive_base_technologies()
         combined_techs = list(set(techs + base_techs))
         
-        print(f"[INFO] Discovered {len(combined_techs)} technologies.")
+        log(f"[INFO] Discovered {len(combined_techs)} technologies.")
         return combined_techs
         
     except Exception as e:
-        print(f"[ERROR] Discovery failed: {e}")
+        log(f"[ERROR] Discovery failed: {e}")
         return get_comprehensive_base_technologies()
 
 def get_comprehensive_base_technologies():
@@ -135,18 +286,8 @@ def get_comprehensive_base_technologies():
         'TensorFlow', 'PyTorch', 'LangChain', 'OpenAI'
     ]
 
-def create_slug(name):
-    """기술명을 슬러그로 변환"""
-    return name.lower().replace(' ', '-').replace('.', 'dot').replace('#', 'sharp').replace('+', 'plus')
-
-def get_tech_popularity_score(tech_name):
-    """기술의 인기도 점수 계산 (Gemini Search Grounding)"""
-    if not genai_client:
-        return 50
-
-    prompt = f"""
-    Determine the popularity score of '{tech_name}' in 2024-2025 on a scale of 0 to 100.
-    
+# 인기도 산정 기준 (단건/배치 프롬프트 공용)
+POPULARITY_RUBRIC = """
     STRICT SCORING RUBRIC (Do not inflate scores):
     - 90-100: Ubiquitous / Industry Standard (e.g., Python, React, AWS, Docker). Everyone knows it.
     - 75-89:  Mainstream / High Demand (e.g., TypeScript, Next.js, Kubernetes, Redis). Widely used in production.
@@ -156,30 +297,186 @@ def get_tech_popularity_score(tech_name):
     
     Consider: GitHub stars, Job market demand, Stack Overflow trends, and Ecosystem size.
     BE CRITICAL. If a tech is new or niche, give it a lower score (e.g., 40-60).
-    
+"""
+
+# 배치 인기도 요청 한 번에 보낼 기술 수
+POPULARITY_BATCH_SIZE = 30
+
+async def get_tech_popularity_score(tech_name):
+    """기술의 인기도 점수 계산 (Gemini Search Grounding, 실패 시 None)"""
+    if not get_genai_client():
+        return 50
+
+    prompt = f"""
+    Determine the popularity score of '{tech_name}' in 2024-2025 on a scale of 0 to 100.
+    {POPULARITY_RUBRIC}
     Return ONLY the integer number. Example: 85
     """
     
     try:
-        response = genai_client.models.generate_content(
-            model='gemini-2.0-flash-lite',
-            contents=prompt,
-            config=types.GenerateContentConfig(
-                tools=[types.Tool(google_search=types.GoogleSearch())]
-            )
-        )
-        score_text = response.text.strip()
-        # 숫자만 추출
-        import re
-        match = re.search(r'\d+', score_text)
-        if match:
-            score = int(match.group())
-            return min(100, max(0, score))
-        return 50
+        return await generate_text(prompt, 'popularity', parse=parse_popularity_score)
     except Exception as e:
-        print(f"    [WARNING] Popularity check failed: {e}")
-        return 50
+        # 기본값(50)을 저장하지 않도록 None 반환 -> 해당 기술은 실패 처리
+        log(f"    [WARNING] Popularity check failed for {tech_name}: {e}")
+        return None
+
+def parse_popularity_score(text):
+    """응답에서 0-100 정수 점수 추출 (숫자가 없으면 ValueError)"""
+    match = re.search(r'\d+', text)
+    if not match:
+        raise ValueError(f"No score in response: {text[:50]}")
+    return min(100, max(0, int(match.group())))
+
+def _normalize_tech_key(name):
+    """배치 응답의 이름 매칭용 키 (대소문자/공백 무시)"""
+    return ' '.join(str(name).lower().split())
 
+async def _score_popularity_batch(tech_names):
+    """기술 목록 한 묶음의 인기도를 한 번의 Gemini 호출로 계산"""
+    names_json = json.dumps(tech_names, ensure_ascii=False)
+    prompt = f"""
+    Determine the popularity score of EACH of the following technologies in 2024-2025 on a scale of 0 to 100.
+    Technologies: {names_json}
+    {POPULARITY_RUBRIC}
+    Score every technology independently with the same rubric.
+    Return ONLY a JSON object mapping each technology name, spelled exactly as given, to its integer score.
+    Example: {{"React": 95, "Bun": 45}}
+    """
+
+    try:
+        parsed = await generate_text(prompt, 'popularity_batch', parse=parse_json_response)
+    except Exception as e:
+        log(f"    [WARNING] Batch popularity check failed ({len(tech_names)} techs): {e}")
+        return {}
+
+    if not isinstance(parsed, dict):
+        return {}
+
+    requested = {_normalize_tech_key(name): name for name in tech_names}
+    scores = {}
+    for key, value in parsed.items():
+        name = requested.get(_normalize_tech_key(key))
+        if name is None:
+            continue
+        try:
+            scores[name] = min(100, max(0, int(value)))
+        except (TypeError, ValueError):
+            continue
+    return scores
+
+async def get_tech_popularity_scores(tech_names, batch_size=POPULARITY_BATCH_SIZE, max_rounds=3):
+    """여러 기술의 인기도를 배치로 계산 (이름 -> 점수, 누락된 기술만 재요청)"""
+    pending = list(dict.fromkeys(tech_names))
+    if not get_genai_client():
+        return {name: 50 for name in pending}
+
+    scores = {}
+    for round_no in range(1, max_rounds + 1):
+        if not pending:
+            break
+        batches = [pending[i:i + batch_size] for i in range(0, len(pending), batch_size)]
+        log(f"[SCORE] Batch popularity round {round_no}: {len(pending)} techs in {len(batches)} request(s)")
+        for batch_scores in await asyncio.gather(*[_score_popularity_batch(b) for b in batches]):
+            scores.update(batch_scores)
+
+        pending = [name for name in pending if name not in scores]
+        if pending:
+            log(f"[WARNING] Missing popularity for {len(pending)} techs: {', '.join(pending[:10])}")
+
+    return scores
+
+class CrawlerPool:
+    """실행 단위로 공유되는 Crawl4AI 브라우저 풀
+
+    브라우저는 첫 크롤링 때 한 번만 띄우고, 페이지는 session_id 단위로 재사용한다.
+    동시에 열린 페이지 수는 max_pages로 제한하며, recycle_after 페이지를 처리했거나
+    브라우저 오류가 나면 진행 중인 페이지가 끝난 뒤 브라우저를 새로 띄운다.
+    """
+
+    CRASH_PATTERN = re.compile(r'(target|browser|page|context).{0,40}(closed|crash)', re.IGNORECASE)
+
+    def __init__(self, max_pages=DEFAULT_CRAWL_MAX_PAGES, recycle_after=DEFAULT_CRAWL_RECYCLE_AFTER):
+        self.max_pages = max(1, max_pages)
+        self.recycle_after = max(1, recycle_after)
+        self.pages_served = 0
+        self.restarts = 0
+        self._crawler = None
+        self._pages_since_start = 0
+        self._needs_recycle = False
+        self._in_flight = 0
+        self._lock = asyncio.Lock()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._sessions = asyncio.Queue()
+        for i in range(self.max_pages):
+            self._sessions.put_nowait(f"stackload-page-{i}")
+
+    async def _start_browser(self):
+        from crawl4ai import AsyncWebCrawler
+        crawler = AsyncWebCrawler(verbose=False)
+        await crawler.start()
+        self._crawler = crawler
+        self._pages_since_start = 0
+        self._needs_recycle = False
+
+    async def _close_browser(self):
+        crawler, self._crawler = self._crawler, None
+        if crawler:
+            try:
+                await crawler.close()
+            except Exception as e:
+                log(f"        [WARNING] Crawler close failed: {e}")
+
+    async def _acquire_browser(self):
+        """브라우저 확보 (필요 시 진행 중인 페이지를 기다린 뒤 재시작)"""
+        async with self._lock:
+            if self._crawler and self._needs_recycle:
+                await self._idle.wait()
+                await self._close_browser()
+                self.restarts += 1
+                log(f"    - [CRAWL] Recycling browser (restart #{self.restarts})")
+            if not self._crawler:
+                await self._start_browser()
+            self._in_flight += 1
+            self._idle.clear()
+            return self._crawler
+
+    def _release_browser(self, crashed):
+        self._in_flight -= 1
+        self.pages_served += 1
+        self._pages_since_start += 1
+        if crashed or self._pages_since_start >= self.recycle_after:
+            self._needs_recycle = True
+        if self._in_flight == 0:
+            self._idle.set()
+
+    async def crawl(self, url):
+        """풀의 페이지 하나를 빌려 URL 크롤링 (CrawlResult 반환)"""
+        from crawl4ai import CrawlerRunConfig
+        session_id = await self._sessions.get()
+        try:
+            crawler = await self._acquire_browser()
+            crashed = False
+            try:
+                result = await crawler.arun(url=url, config=CrawlerRunConfig(session_id=session_id))
+                if not result.success and self.CRASH_PATTERN.search(result.error_message or ''):
+                    crashed = True
+                return result
+            except Exception:
+                crashed = True
+                raise
+            finally:
+                self._release_browser(crashed)
+        finally:
+            self._sessions.put_nowait(session_id)
+
+    async def close(self):
+        async with self._lock:
+            await self._idle.wait()
+            await self._close_browser()
+
+# main()에서 실행 단위로 생성되는 공유 풀 (없으면 crawl_url이 일회성 크롤러 사용)
+crawler_pool = None
 
 async def crawl_url(url):
     """Crawl4AI를 사용하여 URL의 콘텐츠를 마크다운으로 가져옴"""
@@ -190,72 +487,83 @@ async def crawl_url(url):
     if not url.startswith(('http://', 'https://', 'file://')):
         url = 'https://' + url
     
-    print(f"    - [CRAWL] Crawling {url}...")
+    log(f"    - [CRAWL] Crawling {url}...")
     try:
-        async with AsyncWebCrawler(verbose=False) as crawler:
-            result = await crawler.arun(url=url)
-            if result.success:
-                # 너무 긴 콘텐츠는 자름 (토큰 제한 고려)
-                content = result.markdown
-                if len(content) > 20000:
-                    content = content[:20000] + "...(truncated)"
-                return content
-            else:
-                print(f"        [WARNING] Crawl failed: {result.error_message}")
-                return ""
+        if crawler_pool:
+            result = await crawler_pool.crawl(url)
+        else:
+            from crawl4ai import AsyncWebCrawler
+            async with AsyncWebCrawler(verbose=False) as crawler:
+                result = await crawler.arun(url=url)
+        if result.success:
+            # 너무 긴 콘텐츠는 자름 (토큰 제한 고려)
+            content = result.markdown
+            telemetry.count('bytes_crawled', len(content.encode('utf-8')))
+            if len(content) > 20000:
+                content = content[:20000] + "...(truncated)"
+            return content
+        else:
+            log(f"        [WARNING] Crawl failed: {result.error_message}")
+            return ""
     except Exception as e:
-        print(f"        [ERROR] Crawl exception: {e}")
+        log(f"        [ERROR] Crawl exception: {e}")
         return ""
 
-def get_best_logo_url(tech_name, homepage_url):
+def parse_svg_url(text):
+    """응답이 SVG 파일 URL인지 확인 (아니면 ValueError)"""
+    if text.startswith('http') and '.svg' in text:
+        return text
+    raise ValueError(f"Not an SVG URL: {text[:80]}")
+
+# 실행 단위로 공유되는 로고 탐색기 (연결 풀 + 로컬 아이콘 인덱스)
+logo_resolver = None
+
+def _get_logo_resolver():
+    global logo_resolver
+    if logo_resolver is None:
+        logo_resolver = LogoResolver(STATE_DIR)
+    return logo_resolver
+
+async def close_logo_resolver():
+    """로고 탐색기 종료 (확인 결과 저장)"""
+    global logo_resolver
+    if logo_resolver is not None:
+        stats = logo_resolver.stats()
+        log(f"[LOGO] Index hits: {stats['index_hits']}, probe cache hits: {stats['probe_cache_hits']}, "
+            f"network probes: {stats['network_probes']}")
+        await logo_resolver.aclose()
+        logo_resolver = None
+
+async def get_best_logo_url(tech_name, homepage_url):
     """최적의 로고 URL 찾기 (SVG Only: Devicon -> Simple Icons -> Gemini Search)"""
     
     slug = create_slug(tech_name)
 
-    # 1. Devicon (SVG)
-    devicon_url = f"https://cdn.jsdelivr.net/gh/devicons/devicon/icons/{slug}/{slug}-original.svg"
+    # 1-2. Devicon / Simple Icons (로컬 인덱스 우선, 없으면 두 CDN 동시 확인)
     try:
-        response = requests.head(devicon_url, timeout=5, headers={'User-Agent': 'Mozilla/5.0'})
-        if response.status_code == 200:
-            return devicon_url
-    except Exception:
-        pass
-
-    # 2. Simple Icons (SVG) - 방대한 브랜드 아이콘 라이브러리
-    simple_icons_url = f"https://cdn.simpleicons.org/{slug}"
-    try:
-        response = requests.head(simple_icons_url, timeout=5, headers={'User-Agent': 'Mozilla/5.0'})
-        if response.status_code == 200:
-            return simple_icons_url
-    except Exception:
-        pass
+        url = await _get_logo_resolver().resolve(tech_name, slug)
+        if url:
+            return url
+    except Exception as e:
+        log(f"        [WARNING] Logo lookup failed: {e}")
 
     # 3. Gemini Search로 SVG 로고 찾기 (Strict SVG)
-    if genai_client:
+    if get_genai_client():
         try:
             prompt = f"Find a direct URL for the official SVG logo of '{tech_name}'. Return ONLY the URL string. It MUST be an .svg file."
-            response = genai_client.models.generate_content(
-                model='gemini-2.0-flash-lite',
-                contents=prompt,
-                config=types.GenerateContentConfig(
-                    tools=[types.Tool(google_search=types.GoogleSearch())]
-                )
-            )
-            url = response.text.strip()
-            if url.startswith('http') and '.svg' in url:
-                return url
+            return await generate_text(prompt, 'logo', parse=parse_svg_url)
         except Exception:
             pass
 
     return ""
 
-def enhance_with_ai(tech_name, scraped_info, crawled_content=""):
+async def enhance_with_ai(tech_name, scraped_info, crawled_content=""):
     """AI로 기술 정보 향상 (Gemini 사용)"""
-    print(f"    - [AI] Enhancing '{tech_name}' data with AI (Gemini)...")
+    log(f"    - [AI] Enhancing '{tech_name}' data with AI (Gemini)...")
 
     # Gemini 모델이 없으면 기본값 반환
-    if not genai_client:
-        print(f"        [WARNING] Gemini model not available. Using default data for {tech_name}")
+    if not get_genai_client():
+        log(f"        [WARNING] Gemini model not available. Using default data for {tech_name}")
         return {
             "description": f"{tech_name}은(는) 인기있는 개발 기술입니다.",
             "category": "language",
@@ -340,45 +648,17 @@ def enhance_with_ai(tech_name, scraped_info, crawled_content=""):
     """
 
     try:
-        # 재시도 로직 추가 (Rate Limit 대응)
-        max_retries = 3
-        retry_delay = 5
-        
-        for attempt in range(max_retries):
-            try:
-                response = genai_client.models.generate_content(
-                    model='gemini-2.0-flash-lite',
-                    contents=prompt
-                )
-                break
-            except Exception as e:
-                if "429" in str(e) or "Quota exceeded" in str(e):
-                    if attempt < max_retries - 1:
-                        print(f"        [WARNING] Rate limit hit. Retrying in {retry_delay}s... ({attempt+1}/{max_retries})")
-                        time.sleep(retry_delay)
-                        retry_delay *= 2  # 지수 백오프
-                        continue
-                raise e
-        
-        # 응답 텍스트 정제 (마크다운 코드 블록 제거)
-        json_text = response.text.strip()
-        if json_text.startswith('```json'):
-            json_text = json_text[7:]
-        if json_text.startswith('```'):
-            json_text = json_text[3:]
-        if json_text.endswith('```'):
-            json_text = json_text[:-3]
-            
-        return json.loads(json_text.strip())
+        # Rate Limit 재시도는 generate_text의 공유 속도 제한기가 처리
+        return await generate_text(prompt, 'enhance', grounded=False, parse=parse_json_response)
     except Exception as e:
-        print(f"        [ERROR] AI enhancement failed: {e}")
+        log(f"        [ERROR] AI enhancement failed: {e}")
         return None
 
-def search_and_scrape(tech_name):
+async def search_and_scrape(tech_name):
     """기술에 대한 정보 스크래핑 (Gemini Search Grounding)"""
-    print(f"    - [SEARCH] Finding info for '{tech_name}'...")
+    log(f"    - [SEARCH] Finding info for '{tech_name}'...")
     
-    if not genai_client:
+    if not get_genai_client():
         return {}
 
     prompt = f"""
@@ -393,64 +673,42 @@ def search_and_scrape(tech_name):
     """
 
     try:
-        response = genai_client.models.generate_content(
-            model='gemini-2.0-flash-lite',
-            contents=prompt,
-            config=types.GenerateContentConfig(
-                tools=[types.Tool(google_search=types.GoogleSearch())]
-            )
-        )
-        text = response.text.strip()
-        
-        if text.startswith('```json'):
-            text = text[7:]
-        if text.startswith('```'):
-            text = text[3:]
-        if text.endswith('```'):
-            text = text[:-3]
-            
-        return json.loads(text.strip())
+        return await generate_text(prompt, 'search', parse=parse_json_response)
     except Exception as e:
-        print(f"    [ERROR] Info search failed for {tech_name}: {e}")
+        log(f"    [ERROR] Info search failed for {tech_name}: {e}")
         return {}
 
-def save_to_local_json(data):
-    """로컬 JSON 파일에 저장"""
-    try:
-        # 기존 데이터 읽기
-        try:
-            with open('stacks.json', 'r', encoding='utf-8') as f:
-                existing_stacks = json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            existing_stacks = []
-
-        # 중복 제거 (slug 기준)
-        existing_stacks = [s for s in existing_stacks if s.get('slug') != data.get('slug')]
-
-        # 새 데이터 추가
-        existing_stacks.append(data)
-
-        # 인기도 순으로 정렬
-        existing_stacks.sort(key=lambda x: x.get('popularity', 0), reverse=True)
+# main()에서 실행 단위로 생성되는 저널 (종료 시 stacks.json으로 압축)
+stack_journal = None
 
-        # 파일에 저장
-        with open('stacks.json', 'w', encoding='utf-8') as f:
-            json.dump(existing_stacks, f, ensure_ascii=False, indent=2)
+def _new_stack_journal(compact_every=DEFAULT_COMPACT_EVERY):
+    return StackJournal('stacks.json', os.path.join(STATE_DIR, 'stacks.journal.ndjson'), compact_every=compact_every)
 
+def save_to_local_json(data):
+    """로컬 저장 (저널에 추가, N건마다/종료 시 stacks.json으로 압축)"""
+    try:
+        if stack_journal:
+            stack_journal.append(data)
+        else:
+            # 실행 중인 저널이 없으면 바로 반영
+            journal = _new_stack_journal()
+            journal.append(data)
+            journal.compact()
         return True
 
     except Exception as e:
-        print(f"        [ERROR] Failed to save to JSON: {e}")
+        log(f"        [ERROR] Failed to save to JSON: {e}")
         return False
 
 def upsert_to_supabase_rpc(data):
     """RPC 함수를 사용한 업서트"""
-    if not supabase:
-        print(f"        [WARNING] Supabase not available. Skipping database upsert for '{data['name']}'")
+    client = get_supabase()
+    if not client:
+        log(f"        [WARNING] Supabase not available. Skipping database upsert for '{data['name']}'")
         return False
 
     try:
-        response = supabase.rpc('upsert_tech_stack', {
+        response = client.rpc('upsert_tech_stack', {
             'p_name': data['name'],
             'p_slug': data['slug'],
             'p_category': data.get('category'),
@@ -466,99 +724,242 @@ def upsert_to_supabase_rpc(data):
         }).execute()
 
         if response.data:
-            print(f"        [SUCCESS] RPC upsert completed for '{data['name']}'")
+            log(f"        [SUCCESS] RPC upsert completed for '{data['name']}'")
             return True
         return False
 
     except Exception as e:
-        print(f"        [ERROR] RPC upsert failed: {e}")
+        log(f"        [ERROR] RPC upsert failed: {e}")
         return False
 
-import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+# main()에서 실행 단위로 생성되는 단계 스케줄러 (없으면 process_technology가 기본 한도로 생성)
+stage_scheduler = None
+
+# main()에서 실행 단위로 생성되는 매니페스트 (완료 단계 기록 / --resume 시 재사용)
+run_manifest = None
+
+# main()에서 실행 단위로 생성되는 콘텐츠 지문 인덱스와 실행 시작 시점의 stacks.json 스냅샷
+content_fingerprints = None
+existing_catalog = None
+
+def enhancement_from_record(record):
+    """기존 레코드에서 enhance 단계 결과 복원 (build_final_data 입력 형식)"""
+    return {
+        'category': record.get('category'),
+        'description': record.get('description'),
+        'learningResources': record.get('learning_resources', []),
+        'ai_explanation': record.get('ai_explanation'),
+        'project_suitability': record.get('project_suitability', []),
+        'learning_difficulty': record.get('learning_difficulty', {}),
+    }
+
+def reuse_enhancement(tech_name, scraped_info, crawled):
+    """원본 콘텐츠 지문이 같고 신선도 기간 안이면 기존 AI 보강 결과 반환 (아니면 None)"""
+    if not content_fingerprints or not existing_catalog:
+        return None
+    slug = create_slug(tech_name)
+    record = existing_catalog.get(slug)
+    if not record or not record.get('description'):
+        return None
+    fingerprint = compute_fingerprint(crawled, scraped_info.get('homepage'), scraped_info.get('repo'))
+    if not content_fingerprints.can_skip_enhance(slug, fingerprint):
+        return None
+    content_fingerprints.enhance_saved += 1
+    safe_print(f"        [FINGERPRINT] '{tech_name}' content unchanged, reusing AI fields")
+    return enhancement_from_record(record)
 
-# ... (imports remain the same)
+def reuse_popularity(tech_names, batch_size=POPULARITY_BATCH_SIZE):
+    """마지막 점수 산정이 신선도 기간 안인 기존 기술의 인기도 (이름 -> 점수)"""
+    if not content_fingerprints or not existing_catalog:
+        return {}
+    reused = {}
+    for tech in tech_names:
+        slug = create_slug(tech)
+        record = existing_catalog.get(slug)
+        if record and record.get('popularity') is not None and content_fingerprints.score_is_fresh(slug):
+            reused[tech] = record['popularity']
+            content_fingerprints.reused_scores.add(slug)
+    before = -(-len(tech_names) // batch_size)
+    after = -(-(len(tech_names) - len(reused)) // batch_size)
+    content_fingerprints.score_calls_saved += before - after
+    return reused
+
+def build_final_data(tech_name, scraped_info, popularity, ai_enhanced_data, logo_url):
+    """단계 결과를 stacks.json / Supabase 레코드로 조립"""
+    now_utc = datetime.datetime.now(datetime.timezone.utc).isoformat()
+    return {
+        'name': tech_name,
+        'slug': create_slug(tech_name),
+        'category': ai_enhanced_data.get('category'),
+        'description': ai_enhanced_data.get('description'),
+        'logoUrl': logo_url,
+        'popularity': popularity,
+        'learning_resources': ai_enhanced_data.get('learningResources', []),
+        'ai_explanation': ai_enhanced_data.get('ai_explanation'),
+        'homepage': scraped_info.get('homepage'),
+        'repo': scraped_info.get('repo'),
+        'project_suitability': ai_enhanced_data.get('project_suitability', []),
+        'learning_difficulty': ai_enhanced_data.get('learning_difficulty', {}),
+        'updated_at': now_utc
+    }
+
+# main()에서 실행 단위로 생성되는 Supabase 일괄 upsert 버퍼 (없으면 기술마다 RPC 호출)
+supabase_upserter = None
+
+async def persist_record(final_data):
+    """로컬 저널에 저장 후 Supabase 반영 (일괄 버퍼가 있으면 N건/T초마다 한 번에 upsert)"""
+    saved = save_to_local_json(final_data)
+    if supabase_upserter:
+        await supabase_upserter.add(final_data)
+    else:
+        await asyncio.to_thread(upsert_to_supabase_rpc, final_data)
+    return saved
 
-async def process_technology(tech_name):
-    """개별 기술 처리 (Async)"""
+async def process_technology(tech_name, popularity=None, emit=print_event, existing=None, due=None):
+    """개별 기술 처리 (Async, 단계 DAG로 실행, popularity가 주어지면 배치 점수 사용)
+
+    search -> crawl -> enhance 는 순서대로, score / logo 는 검색·크롤링과 동시에 실행되고
+    persist 는 enhance / score / logo 가 모두 끝난 뒤 실행됩니다.
+    기존 레코드(existing)와 다시 실행할 단계(due: 'score' / 'enhance' / 'logo')가 주어지면
+    나머지 단계는 기존 레코드 값을 그대로 사용합니다 (enhance에는 search / crawl 포함).
+    진행 상황은 emit으로 TechStarted / StageFinished / RecordPersisted / TechFailed 이벤트를 보냅니다.
+    """
     start_time = time.time()
-    print(f"\n[PROCESS] Processing: {tech_name}")
+    emit(TechStarted(tech_name))
+    scheduler = stage_scheduler or StageScheduler(default_stage_limits(DEFAULT_MAX_CONCURRENT))
+    outcome = {'record': None, 'reason': None}
+    # 기존 값을 그대로 쓰는 단계
+    kept = set()
+    if existing is not None and due is not None:
+        kept = {'search', 'crawl', 'enhance', 'score', 'logo'} - set(due)
+        if 'enhance' in due:
+            kept -= {'search', 'crawl'}
 
     # 1. 기술 정보 검색 (Gemini Search)
-    t1 = time.time()
-    scraped_info = search_and_scrape(tech_name)
-    t2 = time.time()
-    print(f"    [TIME] Searching '{tech_name}': {t2 - t1:.2f}s")
-    
+    async def search(results):
+        if 'search' in kept:
+            return {'homepage': existing.get('homepage'), 'repo': existing.get('repo')}
+        return await search_and_scrape(tech_name)
+
     # 2. 홈페이지 크롤링 (Crawl4AI)
-    crawled_content = ""
-    if scraped_info.get('homepage'):
-        t_crawl_start = time.time()
-        crawled_content = await crawl_url(scraped_info['homepage'])
-        t_crawl_end = time.time()
-        print(f"    [TIME] Crawling '{tech_name}': {t_crawl_end - t_crawl_start:.2f}s")
-
-    # 3. 인기도 점수 계산
-    t3 = time.time()
-    popularity = get_tech_popularity_score(tech_name)
-    t4 = time.time()
-    print(f"    [TIME] Popularity '{tech_name}': {t4 - t3:.2f}s")
+    async def crawl(results):
+        if 'crawl' in kept:
+            return ""
+        homepage = results['search'].get('homepage')
+        return await crawl_url(homepage) if homepage else ""
+
+    # 3. 인기도 점수 계산 (배치 점수가 없을 때만 단건 호출)
+    async def score(results):
+        if 'score' in kept and existing.get('popularity') is not None:
+            return existing['popularity']
+        if popularity is not None:
+            return popularity
+        return await get_tech_popularity_score(tech_name)
 
     # 4. AI로 정보 향상 (크롤링 데이터 포함)
-    t5 = time.time()
-    ai_enhanced_data = enhance_with_ai(tech_name, scraped_info, crawled_content)
-    t6 = time.time()
-    print(f"    [TIME] AI Enhancement '{tech_name}': {t6 - t5:.2f}s")
-
-    # 5. 로고 URL 결정
-    logo_url = get_best_logo_url(tech_name, scraped_info.get('homepage'))
-
-    if ai_enhanced_data:
-        now_utc = datetime.datetime.now(datetime.timezone.utc).isoformat()
-        final_data = {
-            'name': tech_name,
-            'slug': create_slug(tech_name),
-            'category': ai_enhanced_data.get('category'),
-            'description': ai_enhanced_data.get('description'),
-            'logoUrl': logo_url,
-            'popularity': popularity,
-            'learning_resources': ai_enhanced_data.get('learningResources', []),
-            'ai_explanation': ai_enhanced_data.get('ai_explanation'),
-            'homepage': scraped_info.get('homepage'),
-            'repo': scraped_info.get('repo'),
-            'project_suitability': ai_enhanced_data.get('project_suitability', []),
-            'learning_difficulty': ai_enhanced_data.get('learning_difficulty', {}),
-            'updated_at': now_utc
-        }
+    # (원본 콘텐츠 지문이 같고 신선도 기간 안이면 기존 레코드 값 재사용)
+    async def enhance(results):
+        if 'enhance' in kept:
+            return enhancement_from_record(existing)
+        reused = reuse_enhancement(tech_name, results['search'], results['crawl'])
+        if reused is not None:
+            outcome['enhance_reused'] = True
+            return reused
+        return await enhance_with_ai(tech_name, results['search'], results['crawl'])
+
+    # 5. 로고 URL 결정 (검색 결과와 무관하므로 바로 시작)
+    async def logo(results):
+        if 'logo' in kept:
+            return existing.get('logoUrl')
+        url = await get_best_logo_url(tech_name, None)
+        # 갱신 중 로고를 못 찾으면 기존 로고 유지
+        return url or (existing or {}).get('logoUrl')
+
+    # 6. Supabase 시도 후 로컬 저장
+    async def persist(results):
+        if not results['enhance']:
+            outcome['reason'] = 'AI enhancement failed'
+            return False
+        if results['score'] is None:
+            outcome['reason'] = 'popularity score unavailable, not saving a fallback score'
+            return False
+        final_data = build_final_data(tech_name, results['search'], results['score'], results['enhance'], results['logo'])
+        if not await persist_record(final_data):
+            outcome['reason'] = 'failed to save to stacks.json'
+            return False
+        outcome['record'] = final_data
+        if content_fingerprints:
+            slug = final_data['slug']
+            fingerprint = None
+            if 'crawl' not in kept:
+                fingerprint = compute_fingerprint(results['crawl'], final_data['homepage'], final_data['repo'])
+            previous = existing_catalog.get(slug) if existing_catalog else None
+            content_fingerprints.record(slug, fingerprint, enhanced='enhance' not in kept and not outcome.get('enhance_reused'),
+                                        scored='score' not in kept and slug not in content_fingerprints.reused_scores,
+                                        logo='logo' not in kept,
+                                        previous_updated_at=previous.get('updated_at') if previous else None)
+        return True
 
-        # 5. Supabase 시도 후 로컬 저장
-        t7 = time.time()
-        if not upsert_to_supabase_rpc(final_data):
-            save_to_local_json(final_data)
-        else:
-            save_to_local_json(final_data)  # 백업용으로도 저장
-        t8 = time.time()
-        print(f"    [TIME] DB Upsert '{tech_name}': {t8 - t7:.2f}s")
-        
-        print(f"    [SUCCESS] {tech_name} Total Time: {t8 - start_time:.2f}s")
+    manifest = run_manifest
+    restored = set()
+    stage_metrics = {}
+
+    def measured(name, func):
+        """단계 안에서 발생한 호출 지표(바이트, 재시도, 캐시 적중)를 단계별로 집계"""
+        async def run(results):
+            with telemetry.collect() as metrics:
+                stage_metrics[name] = metrics
+                return await func(results)
+        return run
+
+    def checkpointed(name, func):
+        """매니페스트에 완료 기록이 있으면 저장된 결과를 그대로 사용"""
+        func = measured(name, func)
+        async def run(results):
+            if manifest and manifest.has_stage(tech_name, name):
+                restored.add(name)
+                return manifest.get_stage(tech_name, name)
+            return await func(results)
+        return run
+
+    def on_stage_done(name, result, duration):
+        # 일괄 upsert를 쓰면 persist는 Supabase 반영이 확인된 뒤 BatchUpserter.on_written에서 기록
+        deferred = name == 'persist' and supabase_upserter is not None
+        if name not in restored and manifest and not deferred and (result or name in ('crawl', 'logo')):
+            # 실패한 단계(빈 검색 결과, 점수/AI 없음, 저장 실패)는 기록하지 않음
+            manifest.record_stage(tech_name, name, result)
+        # 배치로 미리 계산된 점수와 기존 값을 그대로 쓴 단계는 보고하지 않음
+        if name == 'score' and popularity is not None and name not in restored:
+            return
+        if name in kept and name not in restored:
+            return
+        emit(StageFinished(tech_name, name, duration, bool(result), name in restored, stage_metrics.get(name)))
+
+    results = await scheduler.run_graph([
+        ('search', [], checkpointed('search', search)),
+        ('score', [], checkpointed('score', score)),
+        ('logo', [], checkpointed('logo', logo)),
+        ('crawl', ['search'], checkpointed('crawl', crawl)),
+        ('enhance', ['search', 'crawl'], checkpointed('enhance', enhance)),
+        ('persist', ['enhance', 'score', 'logo'], measured('persist', persist)),
+    ], on_stage_done=on_stage_done)
+
+    if results['persist']:
+        record = outcome['record']
+        emit(RecordPersisted(tech_name, record['slug'], record, time.time() - start_time))
         return True
 
+    emit(TechFailed(tech_name, outcome['reason'] or 'not persisted'))
     return False
 
-def get_existing_slugs():
-    """Supabase에서 이미 존재하는 기술들의 slug 목록을 가져옴"""
-    if not supabase:
-        return set()
-    
-    try:
-        # 모든 기술의 slug만 조회 (페이지네이션 처리 필요할 수 있으나 일단 1000개로 제한)
-        response = supabase.table('techs').select('slug').limit(1000).execute()
-        if response.data:
-            return {item['slug'] for item in response.data}
-        return set()
-    except Exception as e:
-        print(f"[WARNING] Failed to fetch existing slugs: {e}")
-        return set()
+def get_existing_slugs(full_refresh=False):
+    """이미 존재하는 기술들의 slug 인덱스 (Supabase 전체 + 로컬 stacks.json, O(1) 조회)"""
+    return SlugIndex(
+        get_supabase(),
+        os.path.join(STATE_DIR, 'slug_index.json'),
+        stacks_path='stacks.json',
+        slugify=create_slug
+    ).refresh(full=full_refresh)
 
 def _resolve_limit(max_techs_arg, force_limited_mode):
     """환경변수/CLI 조합으로 최대 처리 기술 수 계산"""
@@ -586,85 +987,391 @@ def _resolve_limit(max_techs_arg, force_limited_mode):
 
     return limited_mode or resolved_max is not None, resolved_max
 
-
-async def main(max_techs=None, force_limited_mode=False, check_only=False):
-    if check_only:
-        print('[CHECK] Checking available technologies...')
-        discovered = discover_trending_technologies()
-        existing = get_existing_slugs()
-        new_techs = [t for t in discovered if create_slug(t) not in existing]
-        print(f"[RESULT] Available: {len(new_techs)}")
+async def rescore_catalog(batch_size=POPULARITY_BATCH_SIZE):
+    """stacks.json 전체 카탈로그의 인기도를 배치로 재계산"""
+    store = StackStore('stacks.json')
+    store.load()
+    if not len(store):
+        log("[ERROR] stacks.json is empty or missing.")
         return
 
-    print('[START] Starting Dynamic Tech Stack Discovery System (Parallel Mode)...')
+    names = [s['name'] for s in store if s.get('name')]
+    log(f"[SCORE] Re-scoring {len(names)} technologies (batch size: {batch_size})...")
+    scores = await get_tech_popularity_scores(names, batch_size=batch_size)
 
-    limited_mode, max_limit = _resolve_limit(max_techs, force_limited_mode)
+    now_utc = datetime.datetime.now(datetime.timezone.utc).isoformat()
+    updated = []
+    changed = 0
+    for stack in store.records():
+        score = scores.get(stack.get('name'))
+        if score is None:
+            continue
+        if stack.get('popularity') != score:
+            changed += 1
+        updated.append({**stack, 'popularity': score, 'updated_at': now_utc})
 
-    # 1단계: 동적으로 인기 기술들 발견
-    discovered_technologies = discover_trending_technologies()
+    # 바뀐 레코드만 정렬 위치 갱신 후 인기도 순으로 저장
+    store.put_many(updated)
+    store.save()
 
-    # 이미 존재하는 기술 필터링
-    print("[CHECK] Checking for existing technologies in database...")
-    existing_slugs = get_existing_slugs()
-    print(f"[INFO] Found {len(existing_slugs)} existing technologies.")
+    log(f"[RESULT] Re-scored: {len(scores)}/{len(names)}, changed: {changed}")
 
-    new_technologies = []
-    for tech in discovered_technologies:
-        slug = create_slug(tech)
-        if slug not in existing_slugs:
-            new_technologies.append(tech)
-    
-    skipped_count = len(discovered_technologies) - len(new_technologies)
-    print(f"[INFO] Skipped {skipped_count} technologies that already exist.")
-    
-    discovered_technologies = new_technologies
+# Gemini 호출 단계의 상대 비용 (enhance: 크롤링 본문이 들어가는 긴 프롬프트, score: 단건 Search Grounding)
+GEMINI_STAGE_COSTS = {'search': 1, 'score': 2, 'enhance': 2, 'logo': 1}
 
-    if not discovered_technologies:
-        print("[INFO] No new technologies to process.")
-        return
+def default_stage_limits(concurrency, crawl_pages=DEFAULT_CRAWL_MAX_PAGES):
+    """단계별 기본 동시 실행 한도
 
-    # 개수 제한 적용
-    if max_limit is not None:
-        discovered_technologies = discovered_technologies[:max_limit]
+    concurrency가 단계별 기본 한도이고, 비용이 큰 Gemini 단계는 concurrency / 비용으로
+    낮춰 같은 단계가 한꺼번에 몰리지 않게 합니다. STAGE_LIMITS / --stage-limits로 단계별로 조정합니다.
+    """
+    gemini = {stage: max(1, concurrency // cost) for stage, cost in GEMINI_STAGE_COSTS.items()}
+    return {
+        'search': gemini['search'],
+        'crawl': min(concurrency, crawl_pages),
+        'score': gemini['score'],
+        'enhance': gemini['enhance'],
+        'logo': gemini['logo'],
+        'persist': 2,
+    }
+
+def _resolve_int_setting(arg_value, env_name, default):
+    """CLI 값 > 환경변수 > 기본값 순으로 양의 정수 설정 계산"""
+    if arg_value is not None:
+        return max(1, arg_value)
+    env_value = os.environ.get(env_name)
+    if env_value:
+        try:
+            return max(1, int(env_value))
+        except ValueError:
+            safe_print(f"[WARNING] Invalid {env_name} value '{env_value}'. 숫자로 설정해주세요.")
+    return default
 
-    print(f"\n[LIST] 새로 처리할 기술들: {', '.join(discovered_technologies[:10])}...")
-    print(f"[COUNT] 총 처리할 기술 수: {len(discovered_technologies)}")
 
-    # 2단계: 병렬 처리 (Async)
-    processed_count = 0
-    failed_count = 0
-    
-    # 동시에 실행할 작업 수
-    MAX_CONCURRENT = 2
-    print(f"[INFO] 병렬 처리 시작 (Max Concurrent: {MAX_CONCURRENT})")
+class DiscoveryPipeline:
+    """동적 기술 수집 파이프라인 (같은 프로세스 안에서 실행)
 
-    # 세마포어로 동시 실행 제한
-    semaphore = asyncio.Semaphore(MAX_CONCURRENT)
+    진행 상황은 pipeline_events의 이벤트로 전달됩니다. on_event 콜백을 주거나
+    events() 비동기 이터레이터로 받을 수 있습니다. 단계 스케줄러·크롤러 풀 등
+    실행 단위 상태는 모듈 전역을 사용하므로 한 번에 하나의 실행만 지원합니다.
+    """
 
-    async def sem_task(tech):
-        async with semaphore:
+    def __init__(self, max_techs=None, force_limited_mode=False, concurrency=None, crawl_pages=None,
+                 crawl_recycle_after=None, no_cache=False, refresh_cache=False, compact_every=None,
+                 stage_limits=None, resume=None, refresh_existing=False, freshness_days=None, reuse_scores=False,
+                 refresh_plan=None, in_flight=None, on_event=None):
+        self.max_techs = max_techs
+        self.force_limited_mode = force_limited_mode
+        self.concurrency = concurrency
+        self.crawl_pages = crawl_pages
+        self.crawl_recycle_after = crawl_recycle_after
+        self.no_cache = no_cache
+        self.refresh_cache = refresh_cache
+        self.compact_every = compact_every
+        self.stage_limits = stage_limits
+        self.resume = resume
+        self.refresh_existing = refresh_existing
+        self.freshness_days = freshness_days
+        self.reuse_scores = reuse_scores
+        self.refresh_plan = refresh_plan   # {기술 이름: 다시 실행할 단계 집합} (--daemon)
+        self.in_flight = in_flight
+        self.on_event = on_event
+        self.telemetry = telemetry.TelemetryWriter(STATE_DIR)
+
+    def emit(self, event):
+        # 텔레메트리 파일(.stackload/telemetry/<run-id>.jsonl)은 항상 기록
+        self.telemetry.handle(event)
+        if self.on_event:
+            self.on_event(event)
+
+    def _prepare(self):
+        configure_response_cache(no_cache=self.no_cache, refresh=self.refresh_cache)
+        # 속도 제한기는 이벤트 루프에 묶이므로 실행마다 새로 생성
+        rate_limiters.clear()
+
+    async def events(self):
+        """run()을 실행하면서 이벤트를 하나씩 반환하는 비동기 이터레이터"""
+        queue = asyncio.Queue()
+        finished = object()
+        listener = self.on_event
+
+        def forward(event):
+            if listener:
+                listener(event)
+            queue.put_nowait(event)
+
+        self.on_event = forward
+        task = asyncio.create_task(self.run())
+        task.add_done_callback(lambda _: queue.put_nowait(finished))
+        try:
+            while True:
+                event = await queue.get()
+                if event is finished:
+                    break
+                yield event
+            task.result()  # 실행 중 예외 전달
+        finally:
+            self.on_event = listener
+            if not task.done():
+                task.cancel()
+
+    async def check_available(self):
+        """새로 수집할 수 있는 기술 수 확인 (결과를 availability 캐시에 저장)"""
+        self._prepare()
+        log('[CHECK] Checking available technologies...')
+        discovered = await discover_trending_technologies()
+        existing = get_existing_slugs()
+        new_techs = [t for t in discovered if create_slug(t) not in existing]
+        save_availability(len(new_techs), os.path.join(STATE_DIR, 'availability.json'))
+        self.emit(AvailabilityChecked(len(new_techs)))
+        print_cache_stats()
+        print_rate_limiter_stats()
+        return len(new_techs)
+
+    async def _select_technologies(self):
+        """처리할 기술 목록 결정 (재개 시 매니페스트, --refresh-existing이면 기존 기술, 아니면 탐색 후 기존 기술 제외)
+
+        (기술 목록, 수집 가능 총 수) 반환, 처리할 기술이 없으면 빈 목록
+        """
+        global run_manifest
+        if self.resume:
+            # 중단된 실행 재개: 기술 목록과 완료된 단계 결과를 매니페스트에서 복원
             try:
-                return await process_technology(tech)
-            except Exception as e:
-                print(f"    [ERROR] {tech} 처리 중 예외 발생: {e}")
-                return False
-
-    tasks = [sem_task(tech) for tech in discovered_technologies]
-    results = await asyncio.gather(*tasks)
+                run_manifest = RunManifest.load(STATE_DIR, self.resume)
+            except FileNotFoundError:
+                log(f"[ERROR] Run manifest not found: {RunManifest.path_for(STATE_DIR, self.resume)}")
+                return [], None
+            pending = run_manifest.pending_techs()
+            log(f"[RUN] Resuming run {self.resume}: {len(run_manifest.techs) - len(pending)}"
+                f"/{len(run_manifest.techs)} already persisted")
+            if not pending:
+                log("[INFO] Nothing left to process in this run.")
+                run_manifest = None
+                return [], None
+            self.emit(RunStarted(run_manifest.run_id, pending, True))
+            return pending, None
+
+        if self.refresh_plan:
+            # 데몬 틱: 기한이 지난 단계가 있는 기존 기술만
+            techs = list(self.refresh_plan)
+            run_manifest = RunManifest.create(STATE_DIR, techs)
+            self.emit(RunStarted(run_manifest.run_id, techs, False))
+            return techs, None
+
+        limited_mode, max_limit = _resolve_limit(self.max_techs, self.force_limited_mode)
+
+        if self.refresh_existing:
+            # 기존 기술 재수집: 가장 오래 갱신되지 않은 기술부터
+            store = StackStore('stacks.json')
+            store.load()
+            records = sorted((s for s in store if s.get('name')), key=lambda s: s.get('updated_at') or '')
+            techs = [s['name'] for s in records]
+            if max_limit is not None:
+                techs = techs[:max_limit]
+            if not techs:
+                log("[INFO] stacks.json is empty, nothing to refresh.")
+                return [], None
+            log(f"\n[LIST] 다시 수집할 기존 기술들 (오래된 순): {', '.join(techs[:10])}...")
+            log(f"[COUNT] 총 처리할 기술 수: {len(techs)}")
+            run_manifest = RunManifest.create(STATE_DIR, techs)
+            self.emit(RunStarted(run_manifest.run_id, techs, False))
+            return techs, None
+
+        # 1단계: 동적으로 인기 기술들 발견
+        discovered_technologies = await discover_trending_technologies()
+
+        # 이미 존재하는 기술 필터링
+        log("[CHECK] Checking for existing technologies in database and stacks.json...")
+        existing_slugs = get_existing_slugs()
+        log(f"[INFO] Found {len(existing_slugs)} existing technologies.")
+
+        new_technologies = []
+        for tech in discovered_technologies:
+            slug = create_slug(tech)
+            if slug not in existing_slugs:
+                new_technologies.append(tech)
+
+        skipped_count = len(discovered_technologies) - len(new_technologies)
+        log(f"[INFO] Skipped {skipped_count} technologies that already exist.")
+
+        available_total = len(new_technologies)
+        save_availability(available_total, os.path.join(STATE_DIR, 'availability.json'))
+
+        if not new_technologies:
+            log("[INFO] No new technologies to process.")
+            return [], available_total
+
+        # 개수 제한 적용
+        if max_limit is not None:
+            new_technologies = new_technologies[:max_limit]
+
+        log(f"\n[LIST] 새로 처리할 기술들: {', '.join(new_technologies[:10])}...")
+        log(f"[COUNT] 총 처리할 기술 수: {len(new_technologies)}")
+
+        run_manifest = RunManifest.create(STATE_DIR, new_technologies)
+        self.emit(RunStarted(run_manifest.run_id, new_technologies, False))
+        return new_technologies, available_total
+
+    async def run(self):
+        """수집 실행, {'run_id', 'processed', 'failed', 'pending', 'calls_saved'} 반환"""
+        global run_manifest, crawler_pool, stage_scheduler, supabase_upserter, stack_journal
+        global content_fingerprints, existing_catalog
+        self._prepare()
+        log('[START] Starting Dynamic Tech Stack Discovery System (Parallel Mode)...')
+
+        discovered_technologies, available_total = await self._select_technologies()
+        if not discovered_technologies:
+            self.emit(RunFinished(None, 0, 0, 0))
+            print_cache_stats()
+            print_rate_limiter_stats()
+            return {'run_id': None, 'processed': 0, 'failed': 0, 'pending': 0, 'calls_saved': 0}
+
+        # 2단계: 병렬 처리 (Async)
+        max_concurrent = _resolve_int_setting(self.concurrency, 'MAX_CONCURRENT', DEFAULT_MAX_CONCURRENT)
+
+        # 원본 콘텐츠가 그대로인 기존 기술은 AI 보강을 건너뛰도록 지문 인덱스와 stacks.json 스냅샷 준비
+        freshness_days = _resolve_int_setting(self.freshness_days, 'CONTENT_FRESHNESS_DAYS', DEFAULT_FRESHNESS_DAYS)
+        content_fingerprints = FingerprintIndex(os.path.join(STATE_DIR, 'fingerprints.json'), freshness_days)
+        existing_catalog = StackStore('stacks.json')
+        existing_catalog.load()
+
+        # 인기도는 배치로 미리 계산 (기술당 1회 호출 -> 배치당 1회 호출, 재개 시 이미 계산된 점수 재사용)
+        t_score = time.time()
+        popularity_scores = dict(run_manifest.popularity)
+        unscored = [tech for tech in discovered_technologies if tech not in popularity_scores]
+        if self.refresh_plan:
+            # 점수 단계가 기한 전인 기술은 기존 인기도 사용
+            kept_scores = {}
+            for tech in unscored:
+                record = existing_catalog.get(create_slug(tech))
+                if 'score' not in self.refresh_plan.get(tech, ()) and record and record.get('popularity') is not None:
+                    kept_scores[tech] = record['popularity']
+                    content_fingerprints.reused_scores.add(create_slug(tech))
+            popularity_scores.update(kept_scores)
+            unscored = [tech for tech in unscored if tech not in kept_scores]
+        if self.reuse_scores and unscored:
+            # 신선도 기간 안에 점수를 매긴 기존 기술은 인기도 재사용
+            reused_scores = reuse_popularity(unscored)
+            run_manifest.record_popularity(reused_scores)
+            popularity_scores.update(reused_scores)
+            unscored = [tech for tech in unscored if tech not in reused_scores]
+        if unscored:
+            new_scores = await get_tech_popularity_scores(unscored)
+            run_manifest.record_popularity(new_scores)
+            popularity_scores.update(new_scores)
+        log(f"[TIME] Batch popularity ({len(popularity_scores)}/{len(discovered_technologies)}): {time.time() - t_score:.2f}s")
+
+        async def sem_task(tech):
+            async with in_flight:
+                try:
+                    if self.refresh_plan:
+                        return await process_technology(tech, popularity=popularity_scores.get(tech), emit=self.emit,
+                                                        existing=existing_catalog.get(create_slug(tech)),
+                                                        due=self.refresh_plan.get(tech))
+                    return await process_technology(tech, popularity=popularity_scores.get(tech), emit=self.emit)
+                except Exception as e:
+                    self.emit(TechFailed(tech, f"처리 중 예외 발생: {e}"))
+                    return False
+
+        # 실행 단위 공유 브라우저 풀 (첫 크롤링 시 시작)
+        max_pages = _resolve_int_setting(self.crawl_pages, 'CRAWL_MAX_PAGES', DEFAULT_CRAWL_MAX_PAGES)
+        crawler_pool = CrawlerPool(
+            max_pages=max_pages,
+            recycle_after=_resolve_int_setting(self.crawl_recycle_after, 'CRAWL_RECYCLE_AFTER', DEFAULT_CRAWL_RECYCLE_AFTER)
+        )
 
-    processed_count = sum(1 for r in results if r)
-    failed_count = len(results) - processed_count
+        # 단계별 동시 실행 한도 (기본값 + STAGE_LIMITS 환경변수 + --stage-limits)
+        limits = default_stage_limits(max_concurrent, max_pages)
+        try:
+            limits.update(parse_stage_limits(os.environ.get('STAGE_LIMITS')))
+            limits.update(parse_stage_limits(self.stage_limits))
+        except ValueError as e:
+            safe_print(f"[WARNING] {e}. 기본 단계 한도를 사용합니다.")
+        stage_scheduler = StageScheduler(limits)
+        log(f"[INFO] Stage limits: {', '.join(f'{k}={v}' for k, v in limits.items())}")
+
+        # 처리 중인 기술 수는 단계 한도의 합까지 허용해 모든 단계가 동시에 한도만큼 돌 수 있게 함
+        # (처리량은 단계별 한도가 결정, 이 창은 메모리에 올라와 있는 기술 수만 제한)
+        max_in_flight = _resolve_int_setting(self.in_flight, 'MAX_IN_FLIGHT', sum(limits.values()))
+        in_flight = asyncio.Semaphore(max_in_flight)
+        log(f"[INFO] 병렬 처리 시작 (Techs in flight: {max_in_flight})")
+        monitor_task = asyncio.create_task(stage_scheduler.monitor())
+
+        # Supabase는 N건마다/T초마다 다중 행 upsert로 반영
+        # (반영이 확인된 기술만 persist 완료로 기록 -> 실패한 행은 --resume 때 다시 저장)
+        if get_supabase():
+            manifest = run_manifest
+
+            def record_persisted(rows):
+                for row in rows:
+                    manifest.record_stage(row['name'], 'persist', True)
+
+            supabase_upserter = BatchUpserter(
+                get_supabase(),
+                batch_size=_resolve_int_setting(None, 'SUPABASE_BATCH_SIZE', DEFAULT_UPSERT_BATCH_SIZE),
+                flush_seconds=_resolve_int_setting(None, 'SUPABASE_FLUSH_SECONDS', int(DEFAULT_FLUSH_SECONDS)),
+                on_written=record_persisted
+            )
+            supabase_upserter.start()
 
-    print(f'\n[COMPLETE] 동적 수집 완료!')
-    print(f'[SUCCESS] 성공: {processed_count}개')
-    print(f'[FAILED] 실패: {failed_count}개')
-    print(f'[FILE] 결과는 stacks.json에 저장되었습니다.')
+        # 결과는 저널에 추가하고 N건마다/종료 시 stacks.json으로 압축
+        stack_journal = _new_stack_journal(
+            compact_every=_resolve_int_setting(self.compact_every, 'JOURNAL_COMPACT_EVERY', DEFAULT_COMPACT_EVERY)
+        )
 
-    # 요약 통계 출력
+        run_id = run_manifest.run_id
+        try:
+            tasks = [sem_task(tech) for tech in discovered_technologies]
+            results = await asyncio.gather(*tasks)
+        finally:
+            monitor_task.cancel()
+            stage_scheduler.print_report()
+            stage_scheduler = None
+            await crawler_pool.close()
+            log(f"[CRAWL] Pages crawled: {crawler_pool.pages_served}, browser restarts: {crawler_pool.restarts}")
+            crawler_pool = None
+            stack_journal.compact()
+            log(f"[JOURNAL] stacks.json compactions: {stack_journal.compactions}")
+            stack_journal = None
+            await close_logo_resolver()
+            if supabase_upserter:
+                await supabase_upserter.close()
+                stats = supabase_upserter.stats()
+                log(f"[DB] Rows upserted: {stats['rows_written']}, round trips: {stats['round_trips']}, "
+                    f"failed rows: {stats['failed_rows']}, DB time: {stats['db_time']:.2f}s")
+                supabase_upserter = None
+            pending = len(run_manifest.pending_techs())
+            if pending:
+                log(f"[RUN] {pending} techs unfinished. Resume with: --resume {run_id}")
+            run_manifest = None
+            content_fingerprints.save()
+            calls_saved = content_fingerprints.calls_saved()
+            log(f"[FINGERPRINT] Unchanged: {content_fingerprints.unchanged}, enhance calls saved: "
+                f"{content_fingerprints.enhance_saved}, score calls saved: {content_fingerprints.score_calls_saved} "
+                f"({len(content_fingerprints.reused_scores)} scores reused)")
+            content_fingerprints = None
+            existing_catalog = None
+            log(f"[TELEMETRY] {telemetry.path_for(STATE_DIR, run_id)} (summarise with: report {run_id})")
+
+        processed_count = sum(1 for r in results if r)
+        failed_count = len(results) - processed_count
+        if available_total is not None:
+            # GUI가 즉시 표시할 수 있도록 남은 수집 가능 수 갱신
+            save_availability(max(0, available_total - processed_count), os.path.join(STATE_DIR, 'availability.json'))
+
+        self.emit(RunFinished(run_id, processed_count, failed_count, pending))
+        print_cache_stats()
+        print_rate_limiter_stats()
+        print_catalog_stats()
+        return {'run_id': run_id, 'processed': processed_count, 'failed': failed_count, 'pending': pending,
+                'calls_saved': calls_saved}
+
+def print_catalog_stats():
+    """stacks.json 전체 기술 수와 카테고리별 분포 출력"""
     try:
         with open('stacks.json', 'r', encoding='utf-8') as f:
             all_stacks = json.load(f)
-            print(f'[STATS] 전체 데이터베이스: {len(all_stacks)}개 기술 스택')
+            log(f'[STATS] 전체 데이터베이스: {len(all_stacks)}개 기술 스택')
 
             # 카테고리별 통계
             categories = {}
@@ -672,16 +1379,131 @@ async def main(max_techs=None, force_limited_mode=False, check_only=False):
                 cat = stack.get('category', 'unknown')
                 categories[cat] = categories.get(cat, 0) + 1
 
-            print(f'[CATEGORY] 카테고리별 분포: {categories}')
+            log(f'[CATEGORY] 카테고리별 분포: {categories}')
 
     except Exception as e:
-        print(f"[ERROR] 통계 생성 실패: {e}")
+        log(f"[ERROR] 통계 생성 실패: {e}")
+
+async def run_refresh_daemon(hourly_budget=None, tick_minutes=None, refresh_ttls=None, **pipeline_options):
+    """기존 카탈로그를 신선도 순으로 계속 갱신 (--daemon, 틱마다 기한이 지난 단계만 실행)"""
+    ttls = dict(DEFAULT_TTLS)
+    try:
+        ttls.update(parse_ttls(os.environ.get('REFRESH_TTLS')))
+        ttls.update(parse_ttls(refresh_ttls))
+    except ValueError as e:
+        safe_print(f"[WARNING] {e}. 기본 갱신 주기를 사용합니다.")
+    tick_minutes = _resolve_int_setting(tick_minutes, 'REFRESH_TICK_MINUTES', DEFAULT_TICK_MINUTES)
+    budget = CallBudget(_resolve_int_setting(hourly_budget, 'REFRESH_HOURLY_BUDGET', DEFAULT_HOURLY_BUDGET), tick_minutes)
+
+    def load_records():
+        store = StackStore('stacks.json')
+        store.load()
+        return store.records()
+
+    def load_stage_times():
+        return FingerprintIndex(os.path.join(STATE_DIR, 'fingerprints.json')).entries
+
+    async def refresh(plan):
+        # 배치 점수 호출은 단계 밖, 나머지는 단계별 지표(StageFinished.metrics)로 집계
+        stage_calls = []
+
+        def on_event(event):
+            print_event(event)
+            if isinstance(event, StageFinished) and event.metrics:
+                stage_calls.append(event.metrics.get('gemini_calls', 0))
+
+        with telemetry.collect() as metrics:
+            pipeline = DiscoveryPipeline(refresh_plan=plan, on_event=on_event, **pipeline_options)
+            await pipeline.run()
+        return sum(stage_calls) + metrics.get('gemini_calls', 0)
+
+    daemon = RefreshDaemon(refresh, load_records, load_stage_times, RefreshPlanner(ttls, POPULARITY_BATCH_SIZE),
+                           budget, tick_minutes)
+    await daemon.run_forever()
+
+async def main(max_techs=None, force_limited_mode=False, check_only=False, concurrency=None,
+               crawl_pages=None, crawl_recycle_after=None, rescore=False, no_cache=False, refresh_cache=False,
+               compact_every=None, refresh_logo_index=False, stage_limits=None, resume=None,
+               refresh_existing=False, freshness_days=None, reuse_scores=False, daemon=False, hourly_budget=None,
+               tick_minutes=None, refresh_ttls=None, in_flight=None):
+    """CLI 진입점 (진행 이벤트를 기존 로그 형식으로 출력)"""
+    if refresh_logo_index:
+        await _get_logo_resolver().load_index(refresh=True)
+        await close_logo_resolver()
+        return
+
+    if rescore:
+        configure_response_cache(no_cache=no_cache, refresh=refresh_cache)
+        rate_limiters.clear()
+        await rescore_catalog()
+        print_cache_stats()
+        print_rate_limiter_stats()
+        return
+
+    if daemon:
+        await run_refresh_daemon(
+            hourly_budget=hourly_budget, tick_minutes=tick_minutes, refresh_ttls=refresh_ttls,
+            concurrency=concurrency, crawl_pages=crawl_pages, crawl_recycle_after=crawl_recycle_after,
+            no_cache=no_cache, refresh_cache=refresh_cache, compact_every=compact_every,
+            stage_limits=stage_limits, freshness_days=freshness_days, in_flight=in_flight
+        )
+        return
+
+    pipeline = DiscoveryPipeline(
+        max_techs=max_techs, force_limited_mode=force_limited_mode, concurrency=concurrency,
+        crawl_pages=crawl_pages, crawl_recycle_after=crawl_recycle_after, no_cache=no_cache,
+        refresh_cache=refresh_cache, compact_every=compact_every, stage_limits=stage_limits,
+        resume=resume, refresh_existing=refresh_existing, freshness_days=freshness_days,
+        reuse_scores=reuse_scores, in_flight=in_flight, on_event=print_event
+    )
+    if check_only:
+        await pipeline.check_available()
+    else:
+        await pipeline.run()
 
 if __name__ == '__main__':
+    # 'report' 서브커맨드: 실행 텔레메트리 요약 / 두 실행 비교
+    if len(sys.argv) > 1 and sys.argv[1] == 'report':
+        report_parser = argparse.ArgumentParser(prog='dynamic_tech_discovery.py report', description="Run telemetry report")
+        report_parser.add_argument('run', nargs='?', default='latest', help="실행 id 또는 텔레메트리 파일 경로 (기본값: 가장 최근 실행)")
+        report_parser.add_argument('compare', nargs='?', default=None, help="비교할 두 번째 실행 id 또는 파일 경로")
+        report_args = report_parser.parse_args(sys.argv[2:])
+        try:
+            telemetry.report(STATE_DIR, report_args.run, report_args.compare)
+        except FileNotFoundError as e:
+            log(f"[ERROR] {e}")
+            sys.exit(1)
+        sys.exit(0)
+
     parser = argparse.ArgumentParser(description="Dynamic Tech Discovery Runner")
     parser.add_argument('--max-techs', type=int, default=None, help='수집할 최대 기술 수')
     parser.add_argument('--limited-mode', action='store_true', help='LIMITED_MODE 강제 활성화')
     parser.add_argument('--check-only', action='store_true', help='수집 가능한 기술 수만 확인')
+    parser.add_argument('--concurrency', type=int, default=None, help='단계별 기본 동시 실행 수 (기본값: MAX_CONCURRENT 환경변수 또는 2)')
+    parser.add_argument('--crawl-pages', type=int, default=None, help='크롤러 풀의 최대 동시 페이지 수 (기본값: CRAWL_MAX_PAGES 환경변수 또는 4)')
+    parser.add_argument('--crawl-recycle-after', type=int, default=None, help='브라우저 재시작 전 처리할 페이지 수 (기본값: CRAWL_RECYCLE_AFTER 환경변수 또는 50)')
+    parser.add_argument('--rescore', action='store_true', help='stacks.json 전체의 인기도를 배치로 재계산')
+    parser.add_argument('--no-cache', action='store_true', help='Gemini 응답 캐시 사용 안 함')
+    parser.add_argument('--refresh', action='store_true', help='캐시를 읽지 않고 새 응답으로 갱신')
+    parser.add_argument('--compact-every', type=int, default=None, help='저널을 stacks.json으로 압축할 레코드 간격 (기본값: JOURNAL_COMPACT_EVERY 환경변수 또는 25)')
+    parser.add_argument('--stage-limits', default=None, help="단계별 동시 실행 한도 (예: 'search=4,crawl=2,enhance=3', 환경변수 STAGE_LIMITS)")
+    parser.add_argument('--in-flight', type=int, default=None, help='동시에 처리 중일 수 있는 최대 기술 수 (기본값: MAX_IN_FLIGHT 환경변수 또는 단계 한도의 합)')
+    parser.add_argument('--resume', default=None, metavar='RUN_ID', help='중단된 실행을 이어서 처리 (.stackload/runs/<RUN_ID>.ndjson)')
+    parser.add_argument('--refresh-existing', action='store_true', help='새 기술 대신 stacks.json의 기존 기술을 오래된 순으로 다시 수집')
+    parser.add_argument('--freshness-days', type=int, default=None, help='원본 콘텐츠가 같을 때 AI 보강을 재사용할 기간(일) (기본값: CONTENT_FRESHNESS_DAYS 환경변수 또는 30)')
+    parser.add_argument('--reuse-scores', action='store_true', help='신선도 기간 안에 계산된 기존 인기도 점수 재사용')
+    parser.add_argument('--daemon', action='store_true', help='기존 기술을 신선도 순으로 계속 갱신 (시간당 API 호출 예산 안에서 틱마다 분산 실행)')
+    parser.add_argument('--hourly-budget', type=int, default=None, help='--daemon의 시간당 API 호출 예산 (기본값: REFRESH_HOURLY_BUDGET 환경변수 또는 120)')
+    parser.add_argument('--tick-minutes', type=int, default=None, help='--daemon의 갱신 간격(분) (기본값: REFRESH_TICK_MINUTES 환경변수 또는 5)')
+    parser.add_argument('--refresh-ttls', default=None, help="항목별 갱신 주기(일) (예: 'score=7,enhance=14,logo=90', 환경변수 REFRESH_TTLS)")
+    parser.add_argument('--refresh-logo-index', action='store_true', help='Devicon / Simple Icons 로컬 인덱스 갱신')
     args = parser.parse_args()
     
-    asyncio.run(main(max_techs=args.max_techs, force_limited_mode=args.limited_mode, check_only=args.check_only))
+    asyncio.run(main(max_techs=args.max_techs, force_limited_mode=args.limited_mode, check_only=args.check_only, concurrency=args.concurrency,
+                     crawl_pages=args.crawl_pages, crawl_recycle_after=args.crawl_recycle_after, rescore=args.rescore,
+                     no_cache=args.no_cache, refresh_cache=args.refresh, compact_every=args.compact_every,
+                     refresh_logo_index=args.refresh_logo_index, stage_limits=args.stage_limits,
+                     resume=args.resume, refresh_existing=args.refresh_existing,
+                     freshness_days=args.freshness_days, reuse_scores=args.reuse_scores, daemon=args.daemon,
+                     hourly_budget=args.hourly_budget, tick_minutes=args.tick_minutes, refresh_ttls=args.refresh_ttls,
+                     in_flight=args.in_flight))
@@ -3,14 +3,22 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 import json
 import threading
-import subprocess
+import asyncio
 import os
-from datetime import datetime
+from datetime import datetime, timezone
 import webbrowser
 import queue
 import time
 from supabase import create_client, Client
 from dotenv import load_dotenv
+from availability import load_availability, is_stale, format_age
+from virtual_list import VirtualList
+from search_index import SearchIndex
+from stack_store import StackStore, key_for
+from supabase_sync import WriteBehindQueue, to_table_row
+from delta_sync import DeltaSync
+from log_buffer import LogBuffer, LOG_TAGS, DEFAULT_MAX_LINES as DEFAULT_LOG_MAX_LINES, default_spill_path
+from pipeline_events import format_event, log_to, RunStarted, RecordPersisted, TechFailed, AvailabilityChecked, RunFinished
 
 # --- VS Code Theme Colors ---
 COLOR_BG_MAIN = "#1e1e1e"
@@ -24,6 +32,17 @@ COLOR_TEXT_GRAY = "#858585"
 COLOR_SELECTION = "#094771"
 COLOR_DANGER = "#ef4444"
 
+STATE_DIR = os.environ.get('STACKLOAD_STATE_DIR', '.stackload')
+
+# 한 번에 색인할 최대 시간(초), 나머지는 after()로 이어서 색인해 UI가 멈추지 않게 함
+INDEX_SLICE_SECONDS = 0.03
+
+def _env_int(name, default):
+    try:
+        return int(os.environ.get(name, default))
+    except ValueError:
+        return default
+
 ctk.set_appearance_mode("Dark")
 ctk.set_default_color_theme("blue")
 
@@ -43,15 +62,42 @@ class TechStackManager:
         # State
         self.log_queue = queue.Queue()
         self.log_text = None
+        # 최근 줄만 화면에 유지하고 밀려난 줄은 .stackload/logs/에 기록
+        self.log_buffer = LogBuffer(_env_int('GUI_LOG_MAX_LINES', DEFAULT_LOG_MAX_LINES), default_spill_path())
+        self._pending_logs = []    # 다음 틱에 한 번에 그릴 (ts, msg)
+        self.hidden_log_tags = set()
         self.supabase = None
         self.supabase_enabled = False
-        self.stacks_data = self.load_stacks_data()
+        # GUI 편집은 백그라운드에서 slug별로 모아 전송 (오프라인이면 .stackload에 보관)
+        self.sync_queue = WriteBehindQueue(
+            None, os.path.join(STATE_DIR, 'supabase_queue.json'),
+            on_change=self._set_sync_pending,
+            log=self.log_queue.put,
+        )
+        # 쓰기 스레드는 대기 수만 기록하고, 화면 갱신은 check_log_queue(메인 스레드)에서
+        self._sync_pending = 0
+        self._sync_pending_shown = None
+        self.search_index = SearchIndex()  # 저장소 변경 알림으로 바뀐 레코드만 다시 색인
+        self._index_pending = {}   # 색인 대기 중인 변경 {slug: 레코드 또는 None(삭제)}
+        self._index_after = None   # 나눠서 색인하는 타이머
+        self.store = StackStore('stacks.json')  # slug 키 레코드 저장소 (파이프라인과 공용)
+        self.store.subscribe(self.on_store_changed)
+        self.store.load()
+        # 마지막 동기화 이후 로컬 수정 필드를 기록 (Sync DB에서 증분 동기화)
+        self.delta_sync = DeltaSync(os.path.join(STATE_DIR, 'delta_sync.json'), log=self.log_queue.put)
+        self.store.subscribe(self.delta_sync.track)
+        self._pipeline_lock = threading.Lock()  # 파이프라인은 한 번에 하나만 실행
+        self.selected_keys = set() # 선택은 레코드 키(slug) 기준으로 유지
+        self.anchor_key = None     # Shift 범위 선택의 기준 행
+        self._search_after = None  # 검색 입력 디바운스 타이머
 
         # UI Setup
         self.setup_ui()
         
         # Init
         self.init_supabase()
+        self.sync_queue.start()
+        self.update_sync_status(len(self.sync_queue))
         self.refresh_stack_list()
         self.check_log_queue()
         
@@ -59,8 +105,14 @@ class TechStackManager:
         self.check_available_techs()
 
     def run(self):
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
         self.root.mainloop()
 
+    def on_close(self):
+        # 남은 동기화 작업을 한 번 더 보내고 종료 (실패분은 다음 실행에서 재시도)
+        self.sync_queue.stop(timeout=3.0)
+        self.root.destroy()
+
     # --- Data & Logic ---
     def init_supabase(self):
         try:
@@ -70,6 +122,7 @@ class TechStackManager:
             
             if url and key:
                 self.supabase = create_client(url, key)
+                self.sync_queue.set_client(self.supabase)
                 if self.test_supabase_connection():
                     self.supabase_enabled = True
                     self.update_status(True)
@@ -96,17 +149,24 @@ class TechStackManager:
             self.status_dot.configure(fg_color=color)
             self.status_text.configure(text=text, text_color=color)
 
-    def load_stacks_data(self):
-        try:
-            with open('stacks.json', 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except:
-            return []
+    def on_store_changed(self, changes):
+        # 저장소에서 바뀐 레코드만 검색 인덱스에 반영 (편집 몇 건은 바로, 로드/동기화 같은 대량 변경은 나눠서)
+        for change in changes:
+            self._index_pending[change.slug] = None if change.kind == 'delete' else change.record
+        if self._index_after is None:
+            self.index_pending()
+
+    def index_pending(self, resumed=False):
+        self._index_after = None
+        if self.search_index.apply(self._index_pending, INDEX_SLICE_SECONDS):
+            self._index_after = self.root.after(1, lambda: self.index_pending(resumed=True))
+        elif resumed and hasattr(self, 'search_var') and self.search_var.get().strip():
+            # 색인 중에 입력한 검색어는 색인이 끝난 뒤 다시 검색
+            self.apply_search(keep_scroll=True)
 
     def save_stacks_data(self):
         try:
-            with open('stacks.json', 'w', encoding='utf-8') as f:
-                json.dump(self.stacks_data, f, ensure_ascii=False, indent=2)
+            self.store.save()
             return True
         except Exception as e:
             self.add_log(f"Save Error: {e}")
@@ -188,8 +248,29 @@ class TechStackManager:
             tb.tag_config("TIMESTAMP", foreground="#4b5563")
         except: pass
 
-        # Clear Btn (Floating top-right)
-        ctk.CTkButton(self.log_frame, text="Clear Output", command=self.clear_log, width=80, height=20, fg_color=COLOR_BG_MAIN, text_color=COLOR_TEXT_GRAY, hover_color="#333333").place(relx=1.0, x=-5, y=5, anchor="ne")
+        # Tag filters + Clear Btn (Floating top-right)
+        tools = ctk.CTkFrame(self.log_frame, fg_color=COLOR_BG_MAIN)
+        tools.place(relx=1.0, x=-5, y=5, anchor="ne")
+        self.log_filter_buttons = {}
+        for tag in LOG_TAGS:
+            btn = ctk.CTkButton(tools, text=tag, command=lambda t=tag: self.toggle_log_tag(t), width=56, height=20,
+                                fg_color="#333333", text_color=COLOR_TEXT_MAIN, hover_color="#444444", font=self.font_small)
+            btn.pack(side="left", padx=1)
+            self.log_filter_buttons[tag] = btn
+        ctk.CTkButton(tools, text="Clear Output", command=self.clear_log, width=80, height=20, fg_color=COLOR_BG_MAIN, text_color=COLOR_TEXT_GRAY, hover_color="#333333").pack(side="left", padx=(6, 0))
+
+    def toggle_log_tag(self, tag):
+        # 해당 태그 줄을 elide로 숨김/표시 (버퍼를 다시 그리지 않음)
+        hidden = tag not in self.hidden_log_tags
+        if hidden:
+            self.hidden_log_tags.add(tag)
+        else:
+            self.hidden_log_tags.discard(tag)
+        try:
+            self.log_text._textbox.tag_config(tag, elide=hidden)
+        except: pass
+        self.log_filter_buttons[tag].configure(fg_color=COLOR_BG_MAIN if hidden else "#333333",
+                                               text_color=COLOR_TEXT_GRAY if hidden else COLOR_TEXT_MAIN)
 
     def start_resize(self, event):
         self.start_y = event.y_root
@@ -223,63 +304,36 @@ class TechStackManager:
 
     # ... (rest of methods)
 
-    def check_available_techs(self):
+    def check_available_techs(self, force=False):
+        # 캐시된 마지막 탐색 결과를 즉시 표시하고, 오래된 경우에만 백그라운드에서 재확인
+        entry = load_availability()
+        if entry:
+            self.update_avail_count(f"{entry['available']} ({format_age(entry['age'])})")
+        if not force and not is_stale(entry):
+            return
+        if getattr(self, '_avail_check_running', False):
+            return
+        self._avail_check_running = True
+        if not entry:
+            self.update_avail_count("Checking...")
+
         def task():
             try:
-                # Run with --check-only
-                print("[DEBUG] Running check_available_techs...")
                 self.log_queue.put("[INFO] Checking for available technologies...")
-                
-                process = subprocess.Popen(
-                    ["python3", "dynamic_tech_discovery.py", "--check-only"],
-                    stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
-                )
-                out, err = process.communicate()
-                print(f"[DEBUG] Check output: {out}")
-                if err: print(f"[DEBUG] Check error: {err}")
-                
-                # Send output to log panel
-                if out:
-                    for line in out.splitlines():
-                        self.log_queue.put(line)
-                
-                # Parse output for [RESULT] Available: X
-                import re
-                match = re.search(r"\[RESULT\] Available: (\d+)", out)
-                if match:
-                    count = match.group(1)
-                    print(f"[DEBUG] Found count: {count}")
-                    self.root.after(0, lambda: self.update_avail_count(count))
-                else:
-                    print("[DEBUG] Count not found in output")
-                    self.log_queue.put("[WARNING] Could not determine available count.")
+                # 같은 프로세스에서 --check-only와 동일한 확인 실행 (결과는 AvailabilityChecked 이벤트)
+                checked = self._run_pipeline(lambda dtd: dtd.DiscoveryPipeline(on_event=self._on_pipeline_event).check_available(), wait=False)
+                if checked is None:
+                    self.log_queue.put("[INFO] Discovery is running. Skipping availability check.")
             except Exception as e:
-                print(f"Check Error: {e}")
                 self.log_queue.put(f"[ERROR] Check failed: {e}")
+            finally:
+                self._avail_check_running = False
         threading.Thread(target=task, daemon=True).start()
 
     def update_avail_count(self, count):
         if hasattr(self, 'avail_status'):
             self.avail_status.configure(text=f"Available: {count}")
 
-    def setup_footer(self):
-        footer = ctk.CTkFrame(self.root, height=24, fg_color=COLOR_ACCENT, corner_radius=0)
-        footer.grid(row=3, column=0, sticky="ew")
-        footer.grid_propagate(False)
-
-        ctk.CTkLabel(footer, text="Ready", font=self.font_small, text_color="white").pack(side="left", padx=10)
-        
-        right = ctk.CTkFrame(footer, fg_color=COLOR_ACCENT)
-        right.pack(side="right", padx=10)
-        
-        self.avail_status = ctk.CTkLabel(right, text="Available: Checking...", font=self.font_small, text_color="#e5e5e5")
-        self.avail_status.pack(side="left", padx=10)
-        
-        self.limit_status = ctk.CTkLabel(right, text="Limit: 50", font=self.font_small, text_color="#e5e5e5")
-        self.limit_status.pack(side="left", padx=10)
-        self.count_status = ctk.CTkLabel(right, text="0 Records", font=self.font_small, text_color="#e5e5e5")
-        self.count_status.pack(side="left", padx=10)
-
     # ... (rest of file)
 
     def __init__(self):
@@ -298,15 +352,42 @@ class TechStackManager:
         # State
         self.log_queue = queue.Queue()
         self.log_text = None
+        # 최근 줄만 화면에 유지하고 밀려난 줄은 .stackload/logs/에 기록
+        self.log_buffer = LogBuffer(_env_int('GUI_LOG_MAX_LINES', DEFAULT_LOG_MAX_LINES), default_spill_path())
+        self._pending_logs = []    # 다음 틱에 한 번에 그릴 (ts, msg)
+        self.hidden_log_tags = set()
         self.supabase = None
         self.supabase_enabled = False
-        self.stacks_data = self.load_stacks_data()
+        # GUI 편집은 백그라운드에서 slug별로 모아 전송 (오프라인이면 .stackload에 보관)
+        self.sync_queue = WriteBehindQueue(
+            None, os.path.join(STATE_DIR, 'supabase_queue.json'),
+            on_change=self._set_sync_pending,
+            log=self.log_queue.put,
+        )
+        # 쓰기 스레드는 대기 수만 기록하고, 화면 갱신은 check_log_queue(메인 스레드)에서
+        self._sync_pending = 0
+        self._sync_pending_shown = None
+        self.search_index = SearchIndex()  # 저장소 변경 알림으로 바뀐 레코드만 다시 색인
+        self._index_pending = {}   # 색인 대기 중인 변경 {slug: 레코드 또는 None(삭제)}
+        self._index_after = None   # 나눠서 색인하는 타이머
+        self.store = StackStore('stacks.json')  # slug 키 레코드 저장소 (파이프라인과 공용)
+        self.store.subscribe(self.on_store_changed)
+        self.store.load()
+        # 마지막 동기화 이후 로컬 수정 필드를 기록 (Sync DB에서 증분 동기화)
+        self.delta_sync = DeltaSync(os.path.join(STATE_DIR, 'delta_sync.json'), log=self.log_queue.put)
+        self.store.subscribe(self.delta_sync.track)
+        self._pipeline_lock = threading.Lock()  # 파이프라인은 한 번에 하나만 실행
+        self.selected_keys = set() # 선택은 레코드 키(slug) 기준으로 유지
+        self.anchor_key = None     # Shift 범위 선택의 기준 행
+        self._search_after = None  # 검색 입력 디바운스 타이머
 
         # UI Setup
         self.setup_ui()
         
         # Init
         self.init_supabase()
+        self.sync_queue.start()
+        self.update_sync_status(len(self.sync_queue))
         self.refresh_stack_list()
         self.check_log_queue()
         
@@ -314,8 +395,14 @@ class TechStackManager:
         self.check_available_techs()
 
     def run(self):
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
         self.root.mainloop()
 
+    def on_close(self):
+        # 남은 동기화 작업을 한 번 더 보내고 종료 (실패분은 다음 실행에서 재시도)
+        self.sync_queue.stop(timeout=3.0)
+        self.root.destroy()
+
 
     def setup_header(self):
         # Header with bottom border
@@ -400,7 +487,7 @@ class TechStackManager:
 
         # Search
         self.search_var = tk.StringVar()
-        self.search_var.trace('w', lambda *args: self.refresh_stack_list())
+        self.search_var.trace('w', lambda *args: self.schedule_search())
         search_entry = ctk.CTkEntry(right_box, textvariable=self.search_var, placeholder_text="Filter...", 
                                     width=180, height=28, fg_color="#1e1e1e", border_color=COLOR_INPUT_BG,
                                     font=self.font_small)
@@ -443,12 +530,24 @@ class TechStackManager:
         # Header Bottom Border
         ctk.CTkFrame(list_frame, height=1, fg_color="#333333").pack(side="top", fill="x")
 
-        # 2. Scrollable List Body
-        self.stack_list_scroll = ctk.CTkScrollableFrame(list_frame, fg_color=COLOR_BG_SIDE, corner_radius=0)
-        self.stack_list_scroll.pack(side="top", fill="both", expand=True)
-        self.stack_list_scroll.grid_columnconfigure(0, weight=1)
-        
-        self.list_item_refs = [] # Keep track of row widgets
+        # 2. Virtualized List Body (보이는 행 위젯만 만들어 스크롤 시 재사용)
+        self.view_keys = [] # view index -> record key (현재 필터 결과)
+        self.view_pos = {}  # record key -> view index
+        self.stack_list = VirtualList(
+            list_frame,
+            columns=[
+                (self.col_widths[0], "w", ("Segoe UI", 12)),
+                (self.col_widths[1], "w", ("Segoe UI", 11)),
+                (self.col_widths[2], "center", ("Consolas", 11)),
+                (self.col_widths[3], "center", ("Segoe UI", 11)),
+            ],
+            get_row=self.get_list_row,
+            is_selected=lambda i: self.view_keys[i] in self.selected_keys,
+            on_click=lambda i, e: self.on_stack_click(self.store.get(self.view_keys[i]), i, e),
+            bg=COLOR_BG_SIDE, selected_color=COLOR_SELECTION,
+            text_colors=("#e1e1e1", COLOR_TEXT_GRAY),
+        )
+        self.stack_list.pack(side="top", fill="both", expand=True)
 
     def setup_stack_details(self):
         # Right Panel (Flex)
@@ -506,7 +605,7 @@ class TechStackManager:
         self.ai_text.grid(row=self._row, column=1, sticky="ew", padx=10, pady=2)
         self._row += 1
 
-        self.current_stack_index = -1
+        self.current_key = None
 
         # Action Footer
         footer = ctk.CTkFrame(self.detail_frame, height=50, fg_color=COLOR_BG_MAIN)
@@ -515,226 +614,153 @@ class TechStackManager:
 
 
     def add_log(self, msg):
-        ts = datetime.now().strftime("%H:%M:%S")
-        
-        # Determine Tag
-        tag = "INFO"
-        if "[SUCCESS]" in msg: tag = "SUCCESS"
-        elif "[ERROR]" in msg or "[FAILED]" in msg: tag = "ERROR"
-        elif "[WARNING]" in msg: tag = "WARNING"
-        elif "[SEARCH]" in msg: tag = "SEARCH"
-        elif "[CRAWL]" in msg or "[FETCH]" in msg or "[SCRAPE]" in msg: tag = "CRAWL"
-        elif "[TIME]" in msg: tag = "TIME"
-        
-        # Clean up indentation
-        clean_msg = msg.strip()
-        
-        if self.log_text:
-            self.log_text.configure(state="normal")
-            
-            # Insert Timestamp
-            self.log_text.insert("end", f"[{ts}] ", "TIMESTAMP")
-            
-            # Insert Message with Tag
-            self.log_text.insert("end", f"{clean_msg}\n", tag)
-            
-            self.log_text.see("end")
-            self.log_text.configure(state="disabled")
+        # 다음 틱(check_log_queue)에 다른 줄과 함께 그림
+        self._pending_logs.append((datetime.now().strftime("%H:%M:%S"), msg))
+
+    def flush_logs(self):
+        # 한 틱에 모인 줄을 insert 한 번으로 그리고, 화면 줄 수를 버퍼 크기로 제한
+        if not self._pending_logs or not self.log_text:
+            return
+        entries = self.log_buffer.extend(self._pending_logs)
+        self._pending_logs = []
+        if not entries:
+            return
+
+        args = []
+        for ts, tag, text in entries:
+            # 타임스탬프도 줄 태그를 함께 달아 필터 시 같이 숨김
+            args += [f"[{ts}] ", (tag, "TIMESTAMP"), f"{text}\n", tag]
+        tb = self.log_text._textbox
+        follow = tb.yview()[1] >= 0.999  # 맨 아래를 보고 있을 때만 자동 스크롤
+
+        self.log_text.configure(state="normal")
+        tb.insert("end", *args)
+        excess = int(tb.index("end-1c").split(".")[0]) - 1 - self.log_buffer.max_lines
+        if excess > 0:
+            tb.delete("1.0", f"{excess + 1}.0")
+        self.log_text.configure(state="disabled")
+        if follow:
+            tb.see("end")
 
     def clear_log(self):
+        self._pending_logs = []
+        self.log_buffer.clear()
         if self.log_text:
             self.log_text.configure(state="normal")
             self.log_text.delete("1.0", "end")
             self.log_text.configure(state="disabled")
 
     def check_log_queue(self):
+        # 작업 스레드는 로그 줄(str)이나 메인 스레드에서 실행할 함수를 큐에 넣음
         try:
             while True:
-                self.add_log(self.log_queue.get_nowait())
+                item = self.log_queue.get_nowait()
+                if callable(item):
+                    item()
+                else:
+                    self.add_log(item)
         except queue.Empty:
             pass
+        self.flush_logs()
+        pending = self._sync_pending
+        if pending != self._sync_pending_shown:
+            self.update_sync_status(pending)
         self.root.after(100, self.check_log_queue)
 
     def refresh_stack_list(self, keep_scroll=False):
         if not keep_scroll:
             self.add_log("Refreshing list...")
         
-        # Clear existing items
-        for widget in self.stack_list_scroll.winfo_children():
-            widget.destroy()
-        self.list_item_refs = []
-        
         # Reload data only if not keeping scroll (implies just visual refresh? No, refresh usually implies reload)
         # Actually, if we just want to update selection, we shouldn't reload data from disk if we haven't saved.
         # But for now, let's stick to reloading.
-        self.stacks_data = self.load_stacks_data()
-        q = self.search_var.get().lower()
-        
-        filtered = [s for s in self.stacks_data if q in s.get('name', '').lower() or q in s.get('category', '').lower()]
-        
-        for i, s in enumerate(filtered):
-            self.create_list_row(s, i)
+        # 파일과 달라진 레코드만 저장소에 반영 (검색 인덱스는 변경 알림으로 갱신)
+        changes = self.store.load()
+        self.apply_search(keep_scroll=keep_scroll)
             
-        self.count_status.configure(text=f"{len(filtered)} Records")
         try: self.limit_status.configure(text=f"Limit: {self.limit_entry.get()}")
         except: pass
         if not keep_scroll:
-            self.add_log(f"Loaded {len(filtered)} items")
-
-    def create_list_row(self, s, idx):
-        # Ensure col_widths exists
-        if not hasattr(self, 'col_widths'): self.col_widths = [220, 120, 80, 80]
-        total_width = sum(self.col_widths)
-
-        # Row Container - Fixed size, using pack(anchor='nw') to prevent stretching/centering issues
-        row_frame = ctk.CTkFrame(self.stack_list_scroll, width=total_width, height=36, fg_color="transparent", corner_radius=0)
-        row_frame.pack(anchor="nw", pady=0) 
-        row_frame.pack_propagate(False) # Strict size enforcement
-        
-        # Selection Logic
-        if not hasattr(self, 'selected_indices'): self.selected_indices = set()
-        is_selected = (idx in self.selected_indices)
-        if is_selected: row_frame.configure(fg_color=COLOR_SELECTION)
-
-        # Event Bindings
-        def on_enter(e): 
-            if idx not in self.selected_indices: row_frame.configure(fg_color="#2a2d2e")
-        def on_leave(e): 
-            if idx not in self.selected_indices: row_frame.configure(fg_color="transparent")
-        def on_click(e): self.on_stack_click(s, idx, e)
-
-        row_frame.bind("<Enter>", on_enter)
-        row_frame.bind("<Leave>", on_leave)
-        row_frame.bind("<Button-1>", on_click)
-
-        # Helper for cells
-        def create_cell(x, width, widget_func):
-            f = ctk.CTkFrame(row_frame, width=width, height=36, fg_color="transparent", corner_radius=0)
-            f.place(x=x, y=0)
-            
-            # Bind events to cell frame
-            f.bind("<Enter>", on_enter)
-            f.bind("<Leave>", on_leave)
-            f.bind("<Button-1>", on_click)
-            
-            w = widget_func(f)
-            if w:
-                w.bind("<Enter>", on_enter)
-                w.bind("<Leave>", on_leave)
-                w.bind("<Button-1>", on_click)
-            return f
-
-        current_x = 0
-
-        # 1. Name
-        def name_widget(parent):
-            l = ctk.CTkLabel(parent, text=s.get('name', ''), font=("Segoe UI", 12), text_color="white" if is_selected else "#e1e1e1")
-            l.place(relx=0, rely=0.5, anchor="w", x=10)
-            return l
-        create_cell(current_x, self.col_widths[0], name_widget)
-        current_x += self.col_widths[0]
-
-        # 2. Category
-        def cat_widget(parent):
-            l = ctk.CTkLabel(parent, text=s.get('category', ''), font=("Segoe UI", 11), text_color=COLOR_TEXT_GRAY if not is_selected else "#d1d5db")
-            l.place(relx=0, rely=0.5, anchor="w", x=5)
-            return l
-        create_cell(current_x, self.col_widths[1], cat_widget)
-        current_x += self.col_widths[1]
-
-        # 3. Popularity
-        def pop_widget(parent):
-            l = ctk.CTkLabel(parent, text=f"{int(s.get('popularity', 0))}%", font=("Consolas", 11), text_color=COLOR_TEXT_GRAY if not is_selected else "#d1d5db")
-            l.place(relx=0.5, rely=0.5, anchor="center")
-            return l
-        create_cell(current_x, self.col_widths[2], pop_widget)
-        current_x += self.col_widths[2]
-
-        # 4. Difficulty (Text Only, Gray)
+            self.add_log(f"Loaded {len(self.view_keys)} items ({len(changes)} changed)")
+
+    def schedule_search(self, delay=150):
+        # 입력이 멈춘 뒤 한 번만 검색 (디스크는 다시 읽지 않음)
+        if self._search_after is not None:
+            self.root.after_cancel(self._search_after)
+        self._search_after = self.root.after(delay, self.apply_search)
+
+    def apply_search(self, keep_scroll=False):
+        # 검색어가 있으면 인덱스 결과(점수 순), 없으면 전체 목록
+        self._search_after = None
+        ranked = self.search_index.search(self.search_var.get())
+        if ranked is None:
+            self.view_keys = self.store.keys()
+        else:
+            self.view_keys = [key for key in ranked if key in self.store]
+        self.view_pos = {key: i for i, key in enumerate(self.view_keys)}
+        # 행 위젯은 다시 만들지 않고 보이는 범위만 다시 그림
+        self.stack_list.set_count(len(self.view_keys), keep_scroll=keep_scroll)
+        self.count_status.configure(text=f"{len(self.view_keys)} Records")
+
+    def get_list_row(self, view_idx):
+        # 목록 한 행의 셀 텍스트 (Name, Category, Pop, Diff)
+        s = self.store.get(self.view_keys[view_idx])
         diff = s.get('learning_difficulty')
         d_str = diff.get('label', 'Medium') if isinstance(diff, dict) else (diff if isinstance(diff, str) else 'Medium')
-        
-        def diff_widget(parent):
-            # Simple Text, Gray color to match others
-            badge = ctk.CTkLabel(parent, text=d_str, font=("Segoe UI", 11), text_color=COLOR_TEXT_GRAY if not is_selected else "#d1d5db")
-            badge.place(relx=0.5, rely=0.5, anchor="center")
-            return badge
-        create_cell(current_x, self.col_widths[3], diff_widget)
+        return (s.get('name', ''), s.get('category') or '', f"{int(s.get('popularity') or 0)}%", d_str)
 
-        # Bottom Border (Underline)
-        sep = ctk.CTkFrame(self.stack_list_scroll, height=1, fg_color="#2d2d2d")
-        sep.pack(fill="x")
-        
-        self.list_item_refs.append(row_frame)
-        
-        # Auto-scroll to view if needed (omitted for simplicity in multi-select)
+    def record_key(self, s):
+        # 선택 상태를 유지하는 레코드 키 (저장소와 같은 slug, 없으면 이름으로 만든 slug)
+        return key_for(s)
 
     def on_stack_click(self, s, view_idx, event=None):
-        # Find real index
-        real_idx = -1
-        for i, item in enumerate(self.stacks_data):
-            if item.get('name') == s.get('name'):
-                real_idx = i
-                break
-        
-        if real_idx != -1:
-            # Multi-selection Logic
-            ctrl_pressed = (event.state & 0x4) != 0 if event else False # Control key
-            cmd_pressed = (event.state & 0x8) != 0 if event else False # Command key (Mac)
-            shift_pressed = (event.state & 0x1) != 0 if event else False
-            
-            if not hasattr(self, 'selected_indices'): self.selected_indices = set()
-            if not hasattr(self, 'last_selected_index'): self.last_selected_index = None
-
-            if shift_pressed and self.last_selected_index is not None:
-                # Range Selection
-                start = min(self.last_selected_index, real_idx)
-                end = max(self.last_selected_index, real_idx)
-                
-                if not (ctrl_pressed or cmd_pressed):
-                    self.selected_indices = set()
-                
-                for i in range(start, end + 1):
-                    self.selected_indices.add(i)
-            elif ctrl_pressed or cmd_pressed:
-                # Toggle
-                if real_idx in self.selected_indices:
-                    self.selected_indices.remove(real_idx)
-                else:
-                    self.selected_indices.add(real_idx)
-                self.last_selected_index = real_idx
+        # Multi-selection Logic
+        ctrl_pressed = (event.state & 0x4) != 0 if event else False # Control key
+        cmd_pressed = (event.state & 0x8) != 0 if event else False # Command key (Mac)
+        shift_pressed = (event.state & 0x1) != 0 if event else False
+
+        key = self.view_keys[view_idx]
+        before = set(self.selected_keys)
+
+        if shift_pressed and self.anchor_key in self.view_pos:
+            # Range Selection (현재 목록에 보이는 순서 기준)
+            start, end = sorted((self.view_pos[self.anchor_key], view_idx))
+            span = set(self.view_keys[start:end + 1])
+            if ctrl_pressed or cmd_pressed:
+                self.selected_keys |= span
             else:
-                # Single select
-                self.selected_indices = {real_idx}
-                self.last_selected_index = real_idx
-
-            # Update Detail View (Show last clicked)
-            if real_idx in self.selected_indices:
-                self.load_stack(s, real_idx)
-            
-            # Update Visuals
-            self.refresh_selection_visuals()
-
-    def refresh_selection_visuals(self):
-        # We need to map real indices back to view indices if filtering is active
-        # But for simplicity, we can just iterate the list_item_refs which matches the current view
-        # Wait, list_item_refs matches the filtered view.
-        # We need to know which real_idx corresponds to which view_idx.
-        # Let's just re-render the list or be smarter.
-        # Re-rendering is safest but slow. Let's try to update existing widgets.
-        
-        # Actually, create_list_row is called during refresh.
-        # We need to know if the item in the view is selected.
-        # The view items are 'filtered'.
-        
-        # Let's just re-render for now to be safe and correct with filtering
-        self.refresh_stack_list(keep_scroll=True)
+                self.selected_keys = span
+        elif ctrl_pressed or cmd_pressed:
+            # Toggle
+            self.selected_keys ^= {key}
+            self.anchor_key = key
+        else:
+            # Single select
+            self.selected_keys = {key}
+            self.anchor_key = key
+
+        # Update Detail View (Show last clicked)
+        if key in self.selected_keys:
+            self.load_stack(s, key)
+
+        # 선택 상태가 바뀐 행만 다시 그림 (디스크 재로드 / 목록 재구성 없음)
+        self.refresh_selection_visuals(before ^ self.selected_keys)
+
+    def refresh_selection_visuals(self, changed_keys=None):
+        if changed_keys is None or len(changed_keys) > len(self.stack_list.visible_indices()):
+            # 바뀐 행이 화면보다 많으면 보이는 행만 확인 (내용이 같으면 색만 갱신)
+            self.stack_list.refresh_rows()
+            return
+        for key in changed_keys:
+            view_idx = self.view_pos.get(key)
+            if view_idx is not None:
+                self.stack_list.refresh_row(view_idx)
 
     def on_stack_select(self, e):
         pass # Deprecated
 
-    def load_stack(self, s, idx):
-        self.current_stack_index = idx # Keep for save_current_stack
+    def load_stack(self, s, key):
+        self.current_key = key # Keep for save_current_stack
         self.name_entry.delete(0, "end"); self.name_entry.insert(0, s.get('name') or '')
         self.category_combo.set(s.get('category') or '')
         self.pop_slider.set(s.get('popularity', 0))
@@ -751,11 +777,13 @@ class TechStackManager:
         self.ai_text.delete("1.0", "end"); self.ai_text.insert("1.0", s.get('ai_explanation') or '')
 
     def save_current_stack(self):
-        if self.current_stack_index == -1: return
-        s = self.stacks_data[self.current_stack_index]
+        s = self.store.get(self.current_key)
+        if s is None: return
+        s = dict(s)  # 변경 전 레코드와 비교할 수 있도록 복사본을 수정
         
         diff = s.get('learning_difficulty', {})
-        if isinstance(diff, dict): diff['label'] = self.diff_combo.get()
+        # 중첩 dict도 복사해야 저장소의 변경 전 레코드가 함께 바뀌지 않음
+        if isinstance(diff, dict): diff = {**diff, 'label': self.diff_combo.get()}
         else: diff = {'label': self.diff_combo.get()}
 
         s.update({
@@ -768,125 +796,148 @@ class TechStackManager:
             'logoUrl': self.logo_entry.get(),
             'description': self.desc_text.get("1.0", "end").strip(),
             'ai_explanation': self.ai_text.get("1.0", "end").strip(),
-            'updated_at': datetime.now().isoformat()
+            'updated_at': datetime.now(timezone.utc).isoformat()
         })
+        self.store.put(s)
         
         if self.save_stacks_data():
-            if self.supabase_enabled: self.save_to_supabase(s)
+            if self.supabase: self.save_to_supabase(s)
             self.refresh_stack_list()
             messagebox.showinfo("Saved", f"Updated {s['name']}")
 
     def save_to_supabase(self, s):
-        try:
-            data = {
-                'name': s['name'],
-                'slug': s.get('slug') or s['name'].lower().replace(' ', '-'),
-                'category': s.get('category'),
-                'description': s.get('description'),
-                'logo_url': s.get('logoUrl'),
-                'popularity': int(s.get('popularity', 0)),
-                'updated_at': datetime.now().isoformat()
-            }
-            self.supabase.table('techs').upsert(data, on_conflict='slug').execute()
-            self.add_log(f"Synced {s['name']}")
-        except Exception as e:
-            self.add_log(f"Sync Fail: {e}")
+        # 바로 전송하지 않고 쓰기 큐에 추가 (같은 slug의 대기 중인 편집과 병합)
+        self.sync_queue.upsert(to_table_row({**s, 'slug': key_for(s)}))
+        self.add_log(f"Queued sync: {s['name']}")
 
     def delete_current_stack(self):
-        if self.current_stack_index == -1: return
+        if self.current_key not in self.store: return
         if not messagebox.askyesno("Delete", "Are you sure?"): return
-        del self.stacks_data[self.current_stack_index]
+        removed = self.store.delete(self.current_key)
+        if self.supabase and removed:
+            self.delete_from_supabase([removed])
         self.save_stacks_data()
         self.refresh_stack_list()
-        self.current_stack_index = -1
+        self.current_key = None
 
     def delete_selected_stacks(self):
-        if not hasattr(self, 'selected_indices') or not self.selected_indices:
+        if not self.selected_keys:
             return
             
-        count = len(self.selected_indices)
+        count = len(self.selected_keys)
         if not messagebox.askyesno("Delete", f"Delete {count} selected item(s)?"): return
         
-        # Sort indices in reverse to avoid shifting issues
-        indices = sorted(list(self.selected_indices), reverse=True)
-        
-        for idx in indices:
-            if 0 <= idx < len(self.stacks_data):
-                stack = self.stacks_data[idx]
-                # Sync Delete
-                if self.supabase_enabled:
-                    self.delete_from_supabase(stack)
-                del self.stacks_data[idx]
+        removed = [change.previous for change in self.store.delete_many(self.selected_keys)]
+        # Sync Delete (in_ 필터 한 번으로 전송)
+        if self.supabase and removed:
+            self.delete_from_supabase(removed)
                 
         self.save_stacks_data()
-        self.selected_indices = set()
-        self.current_stack_index = -1
+        self.selected_keys = set()
+        self.anchor_key = None
+        self.current_key = None
         self.refresh_stack_list()
         
-    def delete_from_supabase(self, s):
-        try:
-            slug = s.get('slug') or s['name'].lower().replace(' ', '-')
-            self.supabase.table('techs').delete().eq('slug', slug).execute()
-            self.add_log(f"Deleted {s['name']} from DB")
-        except Exception as e:
-            self.add_log(f"Delete Fail: {e}")
+    def delete_from_supabase(self, stacks):
+        self.sync_queue.delete_many([key_for(s) for s in stacks])
+        self.add_log(f"Queued delete: {len(stacks)} item(s)")
 
     def add_new_stack(self):
         new_s = {
             'name': 'New Stack', 'category': 'Tool', 'slug': f'new-{int(time.time())}',
             'popularity': 50, 'learning_difficulty': {'label': 'Medium'}, 
-            'updated_at': datetime.now().isoformat(),
+            'updated_at': datetime.now(timezone.utc).isoformat(),
             'description': '', 'ai_explanation': ''
         }
-        self.stacks_data.insert(0, new_s)
+        key = self.store.put(new_s)
         
         # Immediate Save & Sync
         self.save_stacks_data()
-        if self.supabase_enabled:
+        if self.supabase:
             self.save_to_supabase(new_s)
             
         # Select the new item
-        self.selected_indices = {0}
+        self.selected_keys = {key}
+        self.anchor_key = key
         self.refresh_stack_list()
+        self.stack_list.scroll_to(self.view_pos.get(key, 0))
         
         # Load into detail view
-        self.load_stack(new_s, 0)
+        self.load_stack(new_s, key)
 
     def run_auto_discovery(self):
-        try: limit = str(int(self.limit_entry.get()))
-        except: limit = "50"
+        try: limit = int(self.limit_entry.get())
+        except: limit = 50
         
         self.add_log(f"Auto Collect (Limit: {limit})...")
         def task():
             try:
-                # Use Popen with -u for unbuffered output to capture in real-time
-                process = subprocess.Popen(
-                    ["python3", "-u", "dynamic_tech_discovery.py", "--max-techs", limit],
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.STDOUT, # Merge stderr into stdout
-                    text=True,
-                    bufsize=1,
-                    encoding='utf-8',
-                    errors='replace'
-                )
-                
-                # Read output line by line
-                for line in iter(process.stdout.readline, ''):
-                    if line:
-                        self.log_queue.put(line.rstrip())
-                
-                process.wait()
-                
-                if process.returncode == 0:
-                    self.log_queue.put("Collection Finished")
-                    self.root.after(100, self.refresh_stack_list)
-                else:
-                    self.log_queue.put(f"Process failed with code {process.returncode}")
-                    
+                # 같은 프로세스에서 파이프라인 실행, 진행 상황은 이벤트로 받음
+                self._run_pipeline(lambda dtd: dtd.DiscoveryPipeline(max_techs=limit, on_event=self._on_pipeline_event).run())
             except Exception as e:
                 self.log_queue.put(f"Error: {e}")
+                self.log_queue.put(lambda: self.update_progress("Collection failed"))
         threading.Thread(target=task, daemon=True).start()
 
+    def _run_pipeline(self, start, wait=True):
+        """수집 파이프라인을 작업 스레드의 이벤트 루프에서 실행 (파이프라인 로그는 로그 패널로)
+
+        한 번에 하나만 실행하며, wait=False이고 이미 실행 중이면 None을 반환합니다.
+        """
+        if not self._pipeline_lock.acquire(blocking=wait):
+            return None
+        try:
+            # 전역 stdout은 그대로 두고 이 실행의 log() 출력만 로그 큐로 받음
+            with log_to(self._pipeline_log):
+                import dynamic_tech_discovery
+                return asyncio.run(start(dynamic_tech_discovery))
+        finally:
+            self._pipeline_lock.release()
+
+    def _pipeline_log(self, message):
+        for line in message.split("\n"):
+            self.log_queue.put(line)
+
+    def _on_pipeline_event(self, e):
+        # 작업 스레드에서 호출되므로 처리는 메인 스레드(check_log_queue)로 넘김
+        self.log_queue.put(lambda: self._handle_pipeline_event(e))
+
+    def _handle_pipeline_event(self, e):
+        """파이프라인 이벤트로 로그와 진행 상태 갱신 (메인 스레드)"""
+        msg = format_event(e)
+        if msg is not None:
+            for line in msg.split("\n"):
+                self.add_log(line)
+
+        if isinstance(e, RunStarted):
+            self._progress = {'total': len(e.techs), 'done': 0, 'failed': 0}
+            self.update_progress(f"Collecting 0/{len(e.techs)}")
+        elif isinstance(e, (RecordPersisted, TechFailed)):
+            p = getattr(self, '_progress', None)
+            if p is None: return
+            p['done' if isinstance(e, RecordPersisted) else 'failed'] += 1
+            self.update_progress(f"Collecting {p['done'] + p['failed']}/{p['total']}" + (f" ({p['failed']} failed)" if p['failed'] else ""))
+        elif isinstance(e, AvailabilityChecked):
+            self.update_avail_count(f"{e.available} (just now)")
+        elif isinstance(e, RunFinished):
+            self.add_log("Collection Finished")
+            self.update_progress(f"Collected {e.processed}" + (f", {e.failed} failed" if e.failed else ""))
+            self.root.after(100, self.refresh_stack_list)
+            self.root.after(100, self.check_available_techs)
+
+    def _set_sync_pending(self, pending):
+        # 쓰기 스레드에서 호출되므로 Tk는 건드리지 않음
+        self._sync_pending = pending
+
+    def update_sync_status(self, pending):
+        self._sync_pending_shown = pending
+        if hasattr(self, 'sync_status'):
+            self.sync_status.configure(text=f"Sync: {pending} pending" if pending else "Sync: idle")
+
+    def update_progress(self, text):
+        if hasattr(self, 'progress_status'):
+            self.progress_status.configure(text=text)
+
     def sync_with_supabase(self):
         if not self.supabase_enabled: return
         threading.Thread(target=self._sync_task, daemon=True).start()
@@ -894,24 +945,20 @@ class TechStackManager:
     def _sync_task(self):
         try:
             self.log_queue.put("Syncing...")
-            # (Sync logic omitted for brevity, reusing existing structure if needed or keeping simple)
-            # For now, just re-implementing basic fetch to update local
-            res = self.supabase.table('techs').select('*').execute()
-            if res.data:
-                # Simple merge: prefer supabase
-                remote = {i['slug']: i for i in res.data}
-                local = {i.get('slug'): i for i in self.stacks_data}
-                
-                for slug, r in remote.items():
-                    if slug not in local:
-                        self.stacks_data.append(self._convert(r))
-                    # Update logic could be more complex
-                self.save_stacks_data()
-                self.log_queue.put("Sync Complete")
-                self.root.after(100, self.refresh_stack_list)
+            # 워터마크 이후 바뀐 행만 조회 (반영은 메인 스레드의 check_log_queue에서)
+            rows = self.delta_sync.pull(self.supabase)
+            self.log_queue.put(lambda: self._apply_remote(rows))
         except Exception as e:
             self.log_queue.put(f"Sync Error: {e}")
 
+    def _apply_remote(self, rows):
+        # 필드 단위 병합 후 로컬 변경은 쓰기 큐로 push
+        stats = self.delta_sync.apply(self.store, rows, self.sync_queue)
+        self.save_stacks_data()
+        self.add_log(f"Sync Complete: pulled {stats['pulled']} rows ({stats['bytes'] / 1024:.1f} KB, {stats['pages']} pages), "
+                     f"applied {stats['applied']}, pushed {stats['pushed']}, kept local {stats['conflicts']} field(s)")
+        self.refresh_stack_list(keep_scroll=True)
+
     # --- Helpers ---
     def create_label(self, text, color=COLOR_TEXT_GRAY):
         lbl = ctk.CTkLabel(self.detail_scroll, text=text, font=self.font_small, text_color=color)
@@ -941,24 +988,25 @@ class TechStackManager:
         footer.grid(row=3, column=0, sticky="ew")
         footer.grid_propagate(False)
 
-        ctk.CTkLabel(footer, text="Ready", font=self.font_small, text_color="white").pack(side="left", padx=10)
+        self.progress_status = ctk.CTkLabel(footer, text="Ready", font=self.font_small, text_color="white")
+        self.progress_status.pack(side="left", padx=10)
         
         right = ctk.CTkFrame(footer, fg_color=COLOR_ACCENT)
         right.pack(side="right", padx=10)
         
+        # 클릭하면 캐시를 무시하고 다시 확인
+        self.avail_status = ctk.CTkLabel(right, text="Available: -", font=self.font_small, text_color="#e5e5e5", cursor="hand2")
+        self.avail_status.pack(side="left", padx=10)
+        self.avail_status.bind("<Button-1>", lambda e: self.check_available_techs(force=True))
+        
+        self.sync_status = ctk.CTkLabel(right, text="Sync: idle", font=self.font_small, text_color="#e5e5e5")
+        self.sync_status.pack(side="left", padx=10)
         self.limit_status = ctk.CTkLabel(right, text="Limit: 50", font=self.font_small, text_color="#e5e5e5")
         self.limit_status.pack(side="left", padx=10)
         self.count_status = ctk.CTkLabel(right, text="0 Records", font=self.font_small, text_color="#e5e5e5")
         self.count_status.pack(side="left", padx=10)
         ctk.CTkLabel(right, text="Python Backend", font=self.font_small, text_color="#e5e5e5").pack(side="left", padx=10)
 
-    def _convert(self, r):
-        return {
-            'name': r.get('name'), 'slug': r.get('slug'), 'category': r.get('category'),
-            'description': r.get('description'), 'logoUrl': r.get('logo_url'),
-            'popularity': r.get('popularity'), 'updated_at': r.get('updated_at')
-        }
-
     def open_website(self): webbrowser.open("http://stackload.wiki")
     def open_homepage(self): 
         if self.homepage_entry.get(): webbrowser.open(self.homepage_entry.get())
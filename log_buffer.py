@@ -0,0 +1,88 @@
+"""
+GUI 로그 버퍼
+
+로그 줄을 태그([SUCCESS], [ERROR] ...)로 분류하고 최근 max_lines 줄만 메모리에 유지합니다.
+밀려난 오래된 줄은 .stackload/logs/ 아래 파일로 옮겨 기록이 유실되지 않습니다.
+화면 출력은 GUI가 한 틱에 모인 줄을 한 번에 그리며, 이 모듈은 Tk에 의존하지 않습니다.
+"""
+
+import datetime
+import os
+import re
+from collections import deque
+
+DEFAULT_MAX_LINES = 5000
+
+# 필터 버튼 순서 겸 표시 태그 목록
+LOG_TAGS = ['INFO', 'SUCCESS', 'ERROR', 'WARNING', 'SEARCH', 'CRAWL', 'TIME']
+
+# 한 줄에 여러 태그가 있으면 앞쪽 우선 (기존 분류 순서)
+_TAG_PRIORITY = ['SUCCESS', 'ERROR', 'WARNING', 'SEARCH', 'CRAWL', 'TIME']
+_TAG_ALIASES = {'FAILED': 'ERROR', 'FETCH': 'CRAWL', 'SCRAPE': 'CRAWL'}
+_TAG_PATTERN = re.compile(r'\[(SUCCESS|ERROR|FAILED|WARNING|SEARCH|CRAWL|FETCH|SCRAPE|TIME)\]')
+
+
+def classify(message):
+    """로그 줄의 표시 태그 (해당 없으면 INFO)"""
+    found = {_TAG_ALIASES.get(tag, tag) for tag in _TAG_PATTERN.findall(message)}
+    if not found:
+        return 'INFO'
+    return min(found, key=_TAG_PRIORITY.index)
+
+
+def default_spill_path(state_dir=None):
+    state_dir = state_dir or os.environ.get('STACKLOAD_STATE_DIR', '.stackload')
+    return os.path.join(state_dir, 'logs', f"gui-{datetime.date.today().isoformat()}.log")
+
+
+class LogBuffer:
+    """최근 max_lines 줄을 유지하는 링 버퍼 (넘친 줄은 spill_path에 추가)"""
+
+    def __init__(self, max_lines=DEFAULT_MAX_LINES, spill_path=None):
+        self.max_lines = max(1, max_lines)
+        self.spill_path = spill_path
+        self.lines = deque()   # (ts, tag, text)
+        self.spilled = 0
+
+    def __len__(self):
+        return len(self.lines)
+
+    def extend(self, messages):
+        """(ts, message) 목록 추가 -> 화면에 그릴 (ts, tag, text) 목록 반환
+
+        여러 줄 메시지는 줄 단위로 나누고 빈 줄은 버립니다. 한 번에 max_lines를 넘게
+        들어오면 마지막 max_lines 줄만 반환합니다.
+        """
+        entries = []
+        for ts, message in messages:
+            for line in str(message).splitlines():
+                text = line.strip()
+                if text:
+                    entries.append((ts, classify(text), text))
+        self.lines.extend(entries)
+
+        overflow = len(self.lines) - self.max_lines
+        if overflow > 0:
+            self._spill([self.lines.popleft() for _ in range(overflow)])
+        return entries[-self.max_lines:]
+
+    def clear(self):
+        """화면에서 지운 줄도 파일에는 남김"""
+        self._spill(list(self.lines))
+        self.lines.clear()
+
+    def _spill(self, entries):
+        if not entries:
+            return
+        self.spilled += len(entries)
+        if not self.spill_path:
+            return
+        try:
+            directory = os.path.dirname(self.spill_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self.spill_path, 'a', encoding='utf-8') as f:
+                f.write(''.join(f"[{ts}] {text}\n" for ts, _, text in entries))
+        except OSError:
+            # 로그 파일 기록 실패로 GUI가 멈추지 않도록 무시
+            pass
@@ -0,0 +1,243 @@
+"""
+비동기 로고 URL 탐색기
+
+Devicon / Simple Icons의 슬러그 목록을 로컬 인덱스로 보관해 대부분의 조회를
+네트워크 없이 처리합니다. 인덱스가 없을 때는 두 CDN을 풀링된 연결로 동시에
+확인하고, 결과(존재/없음)를 슬러그별로 저장해 같은 아이콘을 다시 확인하지 않습니다.
+"""
+
+import asyncio
+import json
+import os
+import re
+import time
+import unicodedata
+
+from pipeline_events import log
+
+DEVICON_BASE_URL = os.environ.get('DEVICON_BASE_URL', 'https://cdn.jsdelivr.net/gh/devicons/devicon')
+SIMPLE_ICONS_CDN_URL = os.environ.get('SIMPLE_ICONS_CDN_URL', 'https://cdn.simpleicons.org')
+SIMPLE_ICONS_DATA_URLS = [
+    url for url in [
+        os.environ.get('SIMPLE_ICONS_DATA_URL'),
+        'https://cdn.jsdelivr.net/npm/simple-icons@latest/data/simple-icons.json',
+        'https://cdn.jsdelivr.net/npm/simple-icons@latest/_data/simple-icons.json',
+    ] if url
+]
+
+DAY = 24 * 60 * 60
+INDEX_MAX_AGE = 30 * DAY      # 인덱스 자동 갱신 주기
+PROBE_NEGATIVE_TTL = 90 * DAY  # 없는 아이콘 재확인 주기
+
+# Devicon에서 선호하는 SVG 변형 순서
+DEVICON_VARIANTS = ['original', 'plain', 'original-wordmark', 'plain-wordmark', 'line']
+
+HEADERS = {'User-Agent': 'Mozilla/5.0'}
+
+# Simple Icons의 titleToSlug 규칙
+_SIMPLE_ICONS_REPLACEMENTS = {
+    '+': 'plus', '.': 'dot', '&': 'and', 'đ': 'd', 'ħ': 'h', 'ı': 'i', 'ĸ': 'k',
+    'ŀ': 'l', 'ł': 'l', 'ß': 'ss', 'ŧ': 't',
+}
+
+
+def simple_icons_slug(title):
+    """Simple Icons 제목을 슬러그로 변환"""
+    slug = title.lower()
+    for src, dst in _SIMPLE_ICONS_REPLACEMENTS.items():
+        slug = slug.replace(src, dst)
+    slug = unicodedata.normalize('NFD', slug)
+    return re.sub(r'[^a-z0-9]', '', slug)
+
+
+def slug_candidates(tech_name, slug):
+    """인덱스 조회에 사용할 슬러그 후보 (기본 슬러그 우선)"""
+    candidates = [slug, re.sub(r'[^a-z0-9]', '', slug), re.sub(r'[^a-z0-9]', '', tech_name.lower()), simple_icons_slug(tech_name)]
+    return [c for c in dict.fromkeys(candidates) if c]
+
+
+class LogoResolver:
+    """Devicon -> Simple Icons 순으로 SVG 로고 URL 탐색"""
+
+    def __init__(self, state_dir='.stackload', client=None):
+        self.index_path = os.path.join(state_dir, 'logo_index.json')
+        self.probe_path = os.path.join(state_dir, 'logo_probes.json')
+        self.devicon = {}        # slug -> svg 변형
+        self.simple_icons = set()
+        self.index_fetched_at = None
+        self.probes = self._load_json(self.probe_path, {})
+        self.index_hits = 0
+        self.probe_hits = 0
+        self.network_probes = 0
+        self._client = client
+        self._owns_client = client is None
+        self._index_lock = asyncio.Lock()
+        self._index_loaded = False
+        os.makedirs(state_dir, exist_ok=True)
+
+    @staticmethod
+    def _load_json(path, default):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return default
+
+    def _write_json(self, path, data):
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    @property
+    def client(self):
+        if self._client is None:
+            # httpx는 실제로 네트워크 확인이 필요할 때만 import
+            import httpx
+            self._client = httpx.AsyncClient(
+                headers=HEADERS,
+                timeout=5,
+                follow_redirects=True,
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=10)
+            )
+        return self._client
+
+    @property
+    def has_index(self):
+        return bool(self.devicon or self.simple_icons)
+
+    # --- Index ---
+    async def load_index(self, refresh=False):
+        """로컬 인덱스 로드 (없거나 오래되었거나 refresh면 CDN에서 다시 받음)"""
+        async with self._index_lock:
+            if self._index_loaded and not refresh:
+                return
+            cached = self._load_json(self.index_path, None)
+            if cached:
+                self.devicon = cached.get('devicon', {})
+                self.simple_icons = set(cached.get('simple_icons', []))
+                self.index_fetched_at = cached.get('fetched_at')
+
+            stale = not self.index_fetched_at or time.time() - self.index_fetched_at > INDEX_MAX_AGE
+            if refresh or stale:
+                await self._refresh_index()
+            self._index_loaded = True
+
+    async def _refresh_index(self):
+        log("    - [LOGO] Refreshing Devicon / Simple Icons index...")
+        devicon, simple_icons = await asyncio.gather(self._fetch_devicon_index(), self._fetch_simple_icons_index())
+        if devicon is None and simple_icons is None:
+            log("        [WARNING] Logo index refresh failed. Falling back to CDN probes.")
+            return
+        if devicon is not None:
+            self.devicon = devicon
+        if simple_icons is not None:
+            self.simple_icons = simple_icons
+        self.index_fetched_at = time.time()
+        # 인덱스가 바뀌었으므로 이전 확인 결과는 버림
+        self.probes = {}
+        self._write_json(self.index_path, {
+            'fetched_at': self.index_fetched_at,
+            'devicon': self.devicon,
+            'simple_icons': sorted(self.simple_icons),
+        })
+        log(f"    - [LOGO] Index: {len(self.devicon)} Devicon, {len(self.simple_icons)} Simple Icons")
+
+    async def _fetch_devicon_index(self):
+        try:
+            response = await self.client.get(f"{DEVICON_BASE_URL}/devicon.json", timeout=30)
+            response.raise_for_status()
+            index = {}
+            for icon in response.json():
+                svg_versions = icon.get('versions', {}).get('svg', [])
+                variant = next((v for v in DEVICON_VARIANTS if v in svg_versions), None)
+                if icon.get('name') and variant:
+                    index[icon['name']] = variant
+            return index
+        except Exception as e:
+            log(f"        [WARNING] Devicon index fetch failed: {e}")
+            return None
+
+    async def _fetch_simple_icons_index(self):
+        for url in SIMPLE_ICONS_DATA_URLS:
+            try:
+                response = await self.client.get(url, timeout=30)
+                if response.status_code != 200:
+                    continue
+                data = response.json()
+                icons = data.get('icons', []) if isinstance(data, dict) else data
+                return {icon.get('slug') or simple_icons_slug(icon['title']) for icon in icons if icon.get('title')}
+            except Exception as e:
+                log(f"        [WARNING] Simple Icons index fetch failed ({url}): {e}")
+        return None
+
+    # --- URLs ---
+    @staticmethod
+    def devicon_url(slug, variant='original'):
+        return f"{DEVICON_BASE_URL}/icons/{slug}/{slug}-{variant}.svg"
+
+    @staticmethod
+    def simple_icons_url(slug):
+        return f"{SIMPLE_ICONS_CDN_URL}/{slug}"
+
+    # --- Probes ---
+    async def _probe(self, url):
+        """HEAD 요청으로 URL 존재 확인 (결과는 영구 캐시)"""
+        cached = self.probes.get(url)
+        if cached is not None:
+            if cached['ok'] or time.time() - cached['checked_at'] < PROBE_NEGATIVE_TTL:
+                self.probe_hits += 1
+                return cached['ok']
+
+        self.network_probes += 1
+        try:
+            response = await self.client.head(url)
+            ok = response.status_code == 200
+        except Exception:
+            # 네트워크 오류는 '없음'으로 저장하지 않음
+            return False
+        self.probes[url] = {'ok': ok, 'checked_at': time.time()}
+        return ok
+
+    async def resolve(self, tech_name, slug):
+        """SVG 로고 URL 반환 (Devicon 우선, 못 찾으면 빈 문자열)"""
+        await self.load_index()
+        candidates = slug_candidates(tech_name, slug)
+
+        if self.has_index:
+            for candidate in candidates:
+                if candidate in self.devicon:
+                    self.index_hits += 1
+                    return self.devicon_url(candidate, self.devicon[candidate])
+            for candidate in candidates:
+                if candidate in self.simple_icons:
+                    self.index_hits += 1
+                    return self.simple_icons_url(candidate)
+            return ""
+
+        # 인덱스가 없으면 두 CDN을 동시에 확인
+        devicon_url = self.devicon_url(slug)
+        simple_url = self.simple_icons_url(slug)
+        devicon_ok, simple_ok = await asyncio.gather(self._probe(devicon_url), self._probe(simple_url))
+        if devicon_ok:
+            return devicon_url
+        if simple_ok:
+            return simple_url
+        return ""
+
+    def stats(self):
+        return {
+            'index_hits': self.index_hits,
+            'probe_cache_hits': self.probe_hits,
+            'network_probes': self.network_probes,
+        }
+
+    async def aclose(self):
+        """확인 결과 저장 및 연결 풀 종료"""
+        try:
+            self._write_json(self.probe_path, self.probes)
+        except Exception as e:
+            log(f"        [WARNING] Failed to save logo probe cache: {e}")
+        if self._owns_client and self._client is not None:
+            await self._client.aclose()
+            self._client = None
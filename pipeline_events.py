@@ -0,0 +1,97 @@
+"""
+수집 파이프라인 진행 이벤트
+
+DiscoveryPipeline이 실행 중에 내보내는 구조화된 이벤트 타입입니다.
+CLI는 format_event()로 기존 로그 형식을 출력하고, GUI는 같은 이벤트로 상태를 갱신합니다.
+파이프라인 모듈의 로그는 log()로 출력하며, log_to(hook) 안에서 실행하면 print 대신 hook으로 전달됩니다.
+"""
+
+import contextlib
+import contextvars
+from collections import namedtuple
+
+STAGE_LABELS = {
+    'search': 'Searching',
+    'crawl': 'Crawling',
+    'score': 'Popularity',
+    'enhance': 'AI Enhancement',
+    'logo': 'Logo',
+    'persist': 'DB Upsert',
+}
+
+# 실행 시작 (resumed면 --resume으로 재개한 실행)
+RunStarted = namedtuple('RunStarted', 'run_id techs resumed')
+# 기술 처리 시작
+TechStarted = namedtuple('TechStarted', 'tech')
+# 단계 완료 (ok: 결과 유무, restored: 체크포인트에서 복원, metrics: 단계 중 집계된 telemetry 지표)
+StageFinished = namedtuple('StageFinished', 'tech stage duration ok restored metrics', defaults=(None,))
+# 로컬 저장 + Supabase 반영 대기열 추가 완료
+RecordPersisted = namedtuple('RecordPersisted', 'tech slug record duration')
+# 기술 처리 실패
+TechFailed = namedtuple('TechFailed', 'tech reason')
+# 수집 가능 기술 수 확인 완료 (--check-only)
+AvailabilityChecked = namedtuple('AvailabilityChecked', 'available')
+# 실행 종료 (pending: 재개가 필요한 기술 수)
+RunFinished = namedtuple('RunFinished', 'run_id processed failed pending')
+
+
+# 실행 단위 로그 출력 대상 (asyncio 태스크 / to_thread로 전파, 없으면 print)
+_log_hook = contextvars.ContextVar('pipeline_log_hook', default=None)
+
+
+def log(message):
+    """파이프라인 로그 한 줄 출력"""
+    hook = _log_hook.get()
+    if hook is None:
+        print(message)
+    else:
+        hook(str(message))
+
+
+@contextlib.contextmanager
+def log_to(hook):
+    """이 블록(과 여기서 시작한 asyncio.run)의 log() 출력을 hook(message)으로 전달"""
+    token = _log_hook.set(hook)
+    try:
+        yield
+    finally:
+        _log_hook.reset(token)
+
+
+def format_event(event):
+    """이벤트를 기존 CLI 로그 형식의 문자열로 변환 (출력할 내용이 없으면 None)"""
+    if isinstance(event, RunStarted):
+        if event.resumed:
+            return f"[RUN] Resumed run {event.run_id}: {len(event.techs)} techs to process"
+        return f"[RUN] Run id: {event.run_id} (resume with --resume {event.run_id})"
+    if isinstance(event, TechStarted):
+        return f"\n[PROCESS] Processing: {event.tech}"
+    if isinstance(event, StageFinished):
+        label = STAGE_LABELS.get(event.stage, event.stage)
+        if event.restored:
+            return f"    [RESUME] {label} '{event.tech}': restored from checkpoint"
+        # 저장하지 않은 persist는 시간 로그 생략 (실패는 TechFailed로 출력)
+        if event.stage == 'persist' and not event.ok:
+            return None
+        return f"    [TIME] {label} '{event.tech}': {event.duration:.2f}s"
+    if isinstance(event, RecordPersisted):
+        return f"    [SUCCESS] {event.tech} Total Time: {event.duration:.2f}s"
+    if isinstance(event, TechFailed):
+        return f"    [ERROR] {event.tech}: {event.reason}"
+    if isinstance(event, AvailabilityChecked):
+        return f"[RESULT] Available: {event.available}"
+    if isinstance(event, RunFinished):
+        return '\n'.join([
+            '\n[COMPLETE] 동적 수집 완료!',
+            f'[SUCCESS] 성공: {event.processed}개',
+            f'[FAILED] 실패: {event.failed}개',
+            '[FILE] 결과는 stacks.json에 저장되었습니다.',
+        ])
+    return None
+
+
+def print_event(event):
+    """CLI용 이벤트 출력"""
+    message = format_event(event)
+    if message is not None:
+        log(message)
@@ -0,0 +1,113 @@
+"""
+Gemini 호출용 적응형 속도 제한기
+
+모델별 토큰 버킷을 모든 호출 지점이 공유합니다. 429 / "Quota exceeded" 응답을 받으면
+프로세스 전체가 잠시 멈추고 속도를 절반으로 줄이며(multiplicative decrease),
+성공할 때마다 조금씩 속도를 올립니다(additive increase).
+"""
+
+import asyncio
+import re
+import time
+
+DEFAULT_RPM = 30
+DEFAULT_MAX_RPM = 60
+DEFAULT_MIN_RPM = 2
+DEFAULT_BACKOFF = 10.0  # Retry-After 정보가 없을 때 최초 일시정지(초)
+MAX_BACKOFF = 120.0
+
+_RETRY_DELAY_PATTERN = re.compile(r"retry[_ ]?delay['\"]?\s*[:=]\s*['\"]?(\d+(?:\.\d+)?)s", re.IGNORECASE)
+# 상태 코드가 없는 오류용 (ID / 바이트 수 / URL 경로 안의 429는 제외)
+_RATE_LIMIT_PATTERN = re.compile(r"(?<![\w/.-])429(?![\w/.-])|\bRESOURCE_EXHAUSTED\b|\bQuota exceeded\b")
+
+
+def is_rate_limit_error(error):
+    """429 / 할당량 초과 오류인지 확인 (상태 코드가 있으면 그것만, 없을 때만 메시지 확인)"""
+    response = getattr(error, 'response', None)
+    code = getattr(error, 'code', None)
+    if code is None:
+        code = getattr(error, 'status_code', None) or getattr(response, 'status_code', None)
+    status = getattr(error, 'status', None)
+    if code is not None or status is not None:
+        return str(code) == '429' or status == 'RESOURCE_EXHAUSTED'
+    return bool(_RATE_LIMIT_PATTERN.search(str(error)))
+
+
+def retry_after_seconds(error):
+    """오류 메시지의 retryDelay 값 (없으면 None)"""
+    match = _RETRY_DELAY_PATTERN.search(str(error))
+    return float(match.group(1)) if match else None
+
+
+class AdaptiveRateLimiter:
+    """AIMD 방식 토큰 버킷 (분당 요청 수 기준)"""
+
+    def __init__(self, name, rpm=DEFAULT_RPM, max_rpm=DEFAULT_MAX_RPM, min_rpm=DEFAULT_MIN_RPM,
+                 increase_step=1.0, decrease_factor=0.5):
+        self.name = name
+        self.max_rpm = max(max_rpm, rpm)
+        self.min_rpm = min(min_rpm, rpm)
+        self.rpm = rpm
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+        self.calls = 0
+        self.throttle_events = 0
+        self.throttled_time = 0.0
+        self._tokens = 1.0
+        self._last_refill = time.monotonic()
+        self._paused_until = 0.0
+        self._backoff = DEFAULT_BACKOFF
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now):
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        # 버스트는 최대 1초 분량으로 제한
+        capacity = max(1.0, self.rpm / 60.0)
+        self._tokens = min(capacity, self._tokens + elapsed * self.rpm / 60.0)
+
+    async def acquire(self):
+        """호출 1회분 토큰 확보 (일시정지 중이면 해제될 때까지 대기)"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+                self._refill(now)
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    self.calls += 1
+                    return
+                await asyncio.sleep((1.0 - self._tokens) * 60.0 / self.rpm)
+
+    def on_success(self):
+        """성공 시 속도를 조금씩 회복 (additive increase)"""
+        self.rpm = min(self.max_rpm, self.rpm + self.increase_step)
+        self._backoff = DEFAULT_BACKOFF
+
+    def on_throttle(self, retry_after=None):
+        """429 수신 시 속도 감소 + 프로세스 전체 일시정지 (multiplicative decrease)"""
+        self.throttle_events += 1
+        now = time.monotonic()
+        if now < self._paused_until:
+            # 같은 일시정지 구간에 도착한 429는 속도를 다시 줄이지 않음
+            return self._paused_until - now
+
+        self.rpm = max(self.min_rpm, self.rpm * self.decrease_factor)
+        self._tokens = 0.0
+
+        pause = retry_after if retry_after is not None else self._backoff
+        self._backoff = min(MAX_BACKOFF, self._backoff * 2)
+        self._paused_until = now + pause
+        self.throttled_time += pause
+        return pause
+
+    def stats(self):
+        return {
+            'model': self.name,
+            'rpm': self.rpm,
+            'calls': self.calls,
+            'throttle_events': self.throttle_events,
+            'throttled_time': self.throttled_time,
+        }
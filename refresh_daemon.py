@@ -0,0 +1,219 @@
+"""
+기존 카탈로그 백그라운드 갱신 (--daemon)
+
+stacks.json 레코드마다 항목별 TTL(인기도 / 원본 콘텐츠·AI 보강 / 로고)이 지난 정도와
+인기도로 우선순위를 매겨 우선순위 큐에 넣고, 기한이 지난 단계만 다시 실행합니다.
+시간당 API 호출 예산을 틱(기본 5분)마다 균등하게 나눠 쓰고, 남은 몫은 다음 틱으로
+넘기되 최근 1시간 사용량이 예산을 넘지 않도록 합니다.
+
+단계별 마지막 실행 시각은 콘텐츠 지문 인덱스(.stackload/fingerprints.json)를 사용하고,
+기록이 없으면 레코드의 updated_at을 기준으로 합니다. 일부 단계만 갱신해도 updated_at이 바뀌므로
+저장할 때 기록이 없는 단계 시각을 갱신 전 updated_at으로 채워 둡니다.
+"""
+
+import asyncio
+import datetime
+import heapq
+import time
+from collections import deque
+
+REFRESH_STAGES = ['score', 'enhance', 'logo']
+
+# 항목별 갱신 주기 (일)
+DEFAULT_TTLS = {'score': 7, 'enhance': 14, 'logo': 90}
+DEFAULT_HOURLY_BUDGET = 120
+DEFAULT_TICK_MINUTES = 5
+
+# 단계별 예상 API 호출 수 (enhance는 검색 + 보강, score는 배치당 1회로 따로 계산)
+STAGE_COSTS = {'enhance': 2, 'logo': 1}
+
+# 지문 인덱스에서 단계별 마지막 실행 시각 필드
+STAGE_TIME_FIELDS = {'score': 'scored_at', 'enhance': 'checked_at', 'logo': 'logo_at'}
+
+
+def parse_ttls(spec):
+    """'score=7,enhance=14' 형식의 문자열을 {stage: 일수}로 변환"""
+    ttls = {}
+    if not spec:
+        return ttls
+    for part in spec.split(','):
+        part = part.strip()
+        if not part:
+            continue
+        name, sep, value = part.partition('=')
+        name = name.strip()
+        if not sep or name not in REFRESH_STAGES:
+            raise ValueError(f"Invalid refresh TTL '{part}' (stages: {', '.join(REFRESH_STAGES)})")
+        ttls[name] = max(1, int(value))
+    return ttls
+
+
+def _parse_ts(value):
+    if not value:
+        return None
+    try:
+        ts = datetime.datetime.fromisoformat(str(value).replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    if ts.tzinfo is None:
+        ts = ts.astimezone()
+    return ts
+
+
+def _now():
+    return datetime.datetime.now(datetime.timezone.utc)
+
+
+class CallBudget:
+    """시간당 API 호출 예산 (틱마다 균등 배분 + 최근 1시간 사용량 상한)"""
+
+    def __init__(self, hourly, tick_minutes):
+        self.hourly = max(1, hourly)
+        self.per_tick = self.hourly * tick_minutes / 60
+        # 틱 몫이 레코드 하나의 최대 비용(점수 배치 1 + 나머지 단계)보다 작아도 몇 틱 모으면 실행되도록 이월 상한을 둠
+        self.max_carry = max(self.per_tick, 1 + sum(STAGE_COSTS.values()))
+        self.carry = 0.0
+        self.spent = deque()   # (monotonic 시각, 호출 수)
+
+    def used_last_hour(self, now=None):
+        now = time.monotonic() if now is None else now
+        while self.spent and now - self.spent[0][0] >= 3600:
+            self.spent.popleft()
+        return sum(calls for _, calls in self.spent)
+
+    def allowance(self, now=None):
+        """이번 틱에 쓸 수 있는 호출 수"""
+        share = self.per_tick + self.carry
+        return max(0, int(min(share, self.hourly - self.used_last_hour(now))))
+
+    def spend(self, calls, now=None):
+        """실제 사용량 기록 (남은 몫은 이월, 초과분은 다음 틱에서 차감)"""
+        self.spent.append((time.monotonic() if now is None else now, calls))
+        self.carry = min(self.max_carry, self.per_tick + self.carry - calls)
+
+
+class RefreshPlanner:
+    """레코드별 기한 지난 단계 계산 + 우선순위 큐에서 예산만큼 선택"""
+
+    def __init__(self, ttls=None, batch_size=30):
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.batch_size = max(1, batch_size)
+
+    def due_stages(self, record, times, now):
+        """{stage: 경과 시간 / TTL} (1 이상인 단계만)"""
+        updated_at = _parse_ts(record.get('updated_at'))
+        due = {}
+        for stage in REFRESH_STAGES:
+            last = _parse_ts(times.get(STAGE_TIME_FIELDS[stage])) or updated_at
+            if last is None:
+                due[stage] = float('inf')
+                continue
+            ratio = (now - last) / datetime.timedelta(days=self.ttls[stage])
+            if ratio >= 1:
+                due[stage] = ratio
+        return due
+
+    def build_queue(self, records, stage_times, now=None):
+        """기한 지난 단계가 있는 레코드의 힙 (가장 오래 밀린 단계 x 인기도 가중치 순)"""
+        now = now or _now()
+        queue = []
+        for record in records:
+            name = record.get('name')
+            slug = record.get('slug')
+            if not name or not slug:
+                continue
+            due = self.due_stages(record, stage_times.get(slug, {}), now)
+            if not due:
+                continue
+            popularity = record.get('popularity') or 0
+            priority = min(max(due.values()), 1e9) * (1 + popularity / 100)
+            queue.append((-priority, record.get('updated_at') or '', slug, name, frozenset(due)))
+        heapq.heapify(queue)
+        return queue
+
+    def plan(self, queue, allowance):
+        """우선순위 순으로 예상 호출 수가 allowance 안에 들어가는 만큼 꺼냄 -> ({이름: 단계 집합}, 예상 호출 수)
+
+        점수는 배치 호출이므로 batch_size개마다 1회로 계산합니다.
+        """
+        plan = {}
+        cost = 0
+        scored = 0
+        while queue:
+            _, _, _, name, due = queue[0]
+            item_cost = sum(STAGE_COSTS.get(stage, 0) for stage in due)
+            if 'score' in due and scored % self.batch_size == 0:
+                item_cost += 1
+            if cost + item_cost > allowance:
+                break
+            heapq.heappop(queue)
+            plan[name] = set(due)
+            cost += item_cost
+            scored += 'score' in due
+        return plan, cost
+
+
+class RefreshDaemon:
+    """schedule로 틱마다 갱신 계획을 세우고 refresh(plan) 코루틴으로 실행
+
+    refresh(plan)은 {기술 이름: 다시 실행할 단계 집합}을 받아 실제로 사용한 API 호출 수를 반환합니다.
+    """
+
+    def __init__(self, refresh, load_records, load_stage_times, planner, budget, tick_minutes=DEFAULT_TICK_MINUTES):
+        self.refresh = refresh
+        self.load_records = load_records
+        self.load_stage_times = load_stage_times
+        self.planner = planner
+        self.budget = budget
+        self.tick_minutes = tick_minutes
+        self.ticks = 0
+        self._tick_due = False
+
+    async def tick(self):
+        self.ticks += 1
+        queue = self.planner.build_queue(self.load_records(), self.load_stage_times())
+        backlog = len(queue)
+        allowance = self.budget.allowance()
+        plan, estimate = self.planner.plan(queue, allowance)
+        if not plan:
+            self.budget.spend(0)
+            if not backlog:
+                print(f"[DAEMON] Tick {self.ticks}: catalog is fresh, nothing due")
+                return
+            print(f"[DAEMON] Tick {self.ticks}: {backlog} records due, nothing fits the budget "
+                  f"(allowance {allowance}, used {self.budget.used_last_hour()}/{self.budget.hourly} in the last hour)")
+            return
+
+        counts = {stage: sum(stage in stages for stages in plan.values()) for stage in REFRESH_STAGES}
+        print(f"[DAEMON] Tick {self.ticks}: {backlog} records due, refreshing {len(plan)} "
+              f"({', '.join(f'{k}={v}' for k, v in counts.items())}), estimated {estimate}/{allowance} calls")
+        calls = 0
+        try:
+            calls = await self.refresh(plan)
+        finally:
+            self.budget.spend(calls)
+            print(f"[DAEMON] Tick {self.ticks} done: {calls} API calls, "
+                  f"{self.budget.used_last_hour()}/{self.budget.hourly} in the last hour")
+
+    def _mark_due(self):
+        self._tick_due = True
+
+    async def run_forever(self):
+        """첫 틱은 바로 실행하고 이후 tick_minutes마다 실행 (Ctrl+C로 종료)"""
+        import schedule
+
+        scheduler = schedule.Scheduler()
+        scheduler.every(self.tick_minutes).minutes.do(self._mark_due)
+        print(f"[DAEMON] Started: {self.budget.hourly} calls/hour, tick every {self.tick_minutes} min, "
+              f"TTL(days) {', '.join(f'{k}={v}' for k, v in self.planner.ttls.items())}")
+        self._tick_due = True
+        while True:
+            scheduler.run_pending()
+            if self._tick_due:
+                self._tick_due = False
+                try:
+                    await self.tick()
+                except Exception as e:
+                    # 한 틱의 실패로 데몬이 멈추지 않도록 기록만 하고 다음 틱에서 다시 시도
+                    print(f"[ERROR] Refresh tick failed: {e}")
+            await asyncio.sleep(1)
@@ -0,0 +1,141 @@
+"""
+Gemini 응답 캐시
+
+모델 + 프롬프트 해시를 키로 응답 텍스트를 SQLite 파일에 저장합니다.
+호출 종류(kind)별 TTL, 전체 크기 기반 LRU 제거, 적중/미스 카운터를 지원합니다.
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+
+DAY = 24 * 60 * 60
+
+# 호출 종류별 기본 TTL (초)
+DEFAULT_TTLS = {
+    'discovery': 1 * DAY,
+    'search': 30 * DAY,
+    'logo': 30 * DAY,
+    'popularity': 3 * DAY,
+    'popularity_batch': 3 * DAY,
+    'enhance': 14 * DAY,
+}
+DEFAULT_TTL = 1 * DAY
+
+DEFAULT_MAX_BYTES = 50 * 1024 * 1024
+
+
+class ResponseCache:
+    """SQLite 기반 Gemini 응답 캐시 (TTL + LRU)"""
+
+    def __init__(self, path, ttls=None, max_bytes=DEFAULT_MAX_BYTES, refresh=False):
+        self.path = path
+        self.ttls = dict(DEFAULT_TTLS)
+        if ttls:
+            self.ttls.update(ttls)
+        self.max_bytes = max_bytes
+        self.refresh = refresh  # True면 읽기는 건너뛰고 새 응답으로 덮어씀
+        self.hits = {}
+        self.misses = {}
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                kind TEXT NOT NULL,
+                model TEXT NOT NULL,
+                response TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_last_access ON responses(last_access)")
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(kind, model, prompt):
+        digest = hashlib.sha256(f"{kind}\0{model}\0{prompt}".encode('utf-8')).hexdigest()
+        return f"{model}:{digest}"
+
+    def ttl_for(self, kind):
+        return self.ttls.get(kind, DEFAULT_TTL)
+
+    def get(self, kind, model, prompt):
+        """캐시된 응답 반환 (없거나 만료되었으면 None)"""
+        if self.refresh:
+            self.misses[kind] = self.misses.get(kind, 0) + 1
+            return None
+
+        key = self.make_key(kind, model, prompt)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row and now - row[1] <= self.ttl_for(kind):
+                self._conn.execute("UPDATE responses SET last_access = ? WHERE key = ?", (now, key))
+                self._conn.commit()
+                self.hits[kind] = self.hits.get(kind, 0) + 1
+                return row[0]
+            if row:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._conn.commit()
+
+        self.misses[kind] = self.misses.get(kind, 0) + 1
+        return None
+
+    def put(self, kind, model, prompt, response):
+        """응답 저장 후 크기 한도를 넘으면 오래 사용하지 않은 항목부터 제거"""
+        key = self.make_key(kind, model, prompt)
+        now = time.time()
+        size = len(response.encode('utf-8'))
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, kind, model, response, size, created_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, kind, model, response, size, now, now)
+            )
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self):
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        rows = self._conn.execute("SELECT key, size FROM responses ORDER BY last_access ASC").fetchall()
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total -= size
+            self.evictions += 1
+
+    def stats(self):
+        """종류별 적중/미스 카운터와 저장 현황"""
+        with self._lock:
+            entries, total = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+        return {
+            'hits': sum(self.hits.values()),
+            'misses': sum(self.misses.values()),
+            'by_kind': {
+                kind: {'hits': self.hits.get(kind, 0), 'misses': self.misses.get(kind, 0)}
+                for kind in sorted(set(self.hits) | set(self.misses))
+            },
+            'entries': entries,
+            'bytes': total,
+            'evictions': self.evictions,
+        }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,124 @@
+"""
+수집 실행 매니페스트 (체크포인트 / 재개)
+
+실행마다 .stackload/runs/<run-id>.ndjson 파일에 처리 대상 기술 목록과
+기술별 완료 단계의 중간 결과(검색 결과, 크롤링 요약, 점수, AI JSON, 로고)를 한 줄씩 추가합니다.
+--resume <run-id>로 다시 실행하면 완료된 단계는 저장된 결과를 그대로 사용합니다.
+"""
+
+import datetime
+import json
+import os
+import secrets
+import threading
+
+# enhance 프롬프트가 사용하는 길이만큼만 크롤링 결과를 저장
+CRAWL_DIGEST_CHARS = 5000
+
+
+# 같은 id로 파일을 만들지 못하면 새 id로 다시 시도하는 횟수
+CREATE_ATTEMPTS = 5
+
+
+def new_run_id():
+    """시각 + 임의 접미사 (같은 초에 시작한 실행도 서로 다른 매니페스트 사용)"""
+    return f"{datetime.datetime.now().strftime('%Y%m%d-%H%M%S')}-{secrets.token_hex(2)}"
+
+
+class RunManifest:
+    """NDJSON 기반 실행 매니페스트"""
+
+    def __init__(self, path, run_id, techs=None, stages=None, popularity=None):
+        self.path = path
+        self.run_id = run_id
+        self.techs = techs or []
+        self.stages = stages or {}          # tech -> {stage: output}
+        self.popularity = popularity or {}  # 배치 점수
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def path_for(state_dir, run_id):
+        return os.path.join(state_dir, 'runs', f"{run_id}.ndjson")
+
+    @classmethod
+    def create(cls, state_dir, techs, run_id=None):
+        """새 실행 매니페스트 생성 (헤더에 기술 목록 기록)
+
+        파일은 'x' 모드로 만들어 기존 실행의 매니페스트에 이어 쓰지 않습니다.
+        run_id를 지정했는데 이미 있으면 FileExistsError.
+        """
+        os.makedirs(os.path.join(state_dir, 'runs'), exist_ok=True)
+        for attempt in range(CREATE_ATTEMPTS):
+            candidate = run_id or new_run_id()
+            path = cls.path_for(state_dir, candidate)
+            try:
+                open(path, 'x', encoding='utf-8').close()
+                break
+            except FileExistsError:
+                if run_id or attempt == CREATE_ATTEMPTS - 1:
+                    raise
+        run_id = candidate
+        manifest = cls(path, run_id, techs=list(techs))
+        manifest._append({
+            'type': 'run',
+            'run_id': run_id,
+            'created_at': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            'techs': manifest.techs,
+        })
+        return manifest
+
+    @classmethod
+    def load(cls, state_dir, run_id):
+        """기존 매니페스트 로드 (없으면 FileNotFoundError)"""
+        path = cls.path_for(state_dir, run_id)
+        manifest = cls(path, run_id)
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # 중단 시점에 잘린 마지막 줄은 무시
+                    continue
+                if entry.get('type') == 'run':
+                    manifest.techs = entry.get('techs', [])
+                elif entry.get('type') == 'stage':
+                    manifest.stages.setdefault(entry['tech'], {})[entry['stage']] = entry.get('output')
+                elif entry.get('type') == 'popularity':
+                    manifest.popularity.update(entry.get('scores', {}))
+        return manifest
+
+    def _append(self, entry):
+        line = json.dumps(entry, ensure_ascii=False)
+        with self._lock:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(line + '\n')
+                f.flush()
+
+    # --- Stage outputs ---
+    def has_stage(self, tech, stage):
+        return stage in self.stages.get(tech, {})
+
+    def get_stage(self, tech, stage):
+        return self.stages.get(tech, {}).get(stage)
+
+    def record_stage(self, tech, stage, output):
+        """단계 완료 기록 (crawl은 enhance에 쓰이는 길이만 저장)"""
+        if stage == 'crawl' and output:
+            output = output[:CRAWL_DIGEST_CHARS]
+        self.stages.setdefault(tech, {})[stage] = output
+        self._append({'type': 'stage', 'tech': tech, 'stage': stage, 'output': output})
+
+    def record_popularity(self, scores):
+        if not scores:
+            return
+        self.popularity.update(scores)
+        self._append({'type': 'popularity', 'scores': scores})
+
+    def is_done(self, tech):
+        return bool(self.get_stage(tech, 'persist'))
+
+    def pending_techs(self):
+        return [tech for tech in self.techs if not self.is_done(tech)]
@@ -0,0 +1,306 @@
+"""
+카탈로그 검색 인덱스
+
+레코드의 모든 텍스트 필드를 메모리 인덱스로 만들어 입력할 때마다 전체를 훑지 않고 검색합니다.
+
+- 짧은 필드(name, slug, category): 1-gram / 2-gram 역색인으로 부분 문자열 검색
+- 긴 필드(description, ai_explanation 등): 토큰 역색인 + 정렬된 어휘 목록으로 접두어 검색
+  (한글 토큰은 조사를 뗀 형태도 함께 색인)
+- 초성 검색: 'ㅍㄹㅇㅇㅋ' -> '프레임워크' (한글 토큰의 초성 역색인 + 접두어 검색)
+레코드가 바뀌면 해당 레코드만 다시 색인하고(많으면 apply로 나눠서), 결과는 필드 가중치로 정렬합니다.
+"""
+
+import bisect
+import functools
+import re
+import time
+import unicodedata
+
+CHOSUNG = [
+    'ㄱ', 'ㄲ', 'ㄴ', 'ㄷ', 'ㄸ', 'ㄹ', 'ㅁ', 'ㅂ', 'ㅃ', 'ㅅ',
+    'ㅆ', 'ㅇ', 'ㅈ', 'ㅉ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ',
+]
+_CHOSUNG_SET = set(CHOSUNG)
+_HANGUL_START, _HANGUL_END = 0xAC00, 0xD7A3
+
+# 토큰 끝에서 떼어 함께 색인할 조사 (긴 것부터)
+JOSA = sorted([
+    '은', '는', '이', '가', '을', '를', '의', '에', '와', '과', '도', '로', '으로', '에서',
+    '에게', '까지', '부터', '보다', '처럼', '이다', '입니다', '하는', '하고', '한',
+], key=len, reverse=True)
+
+# 필드별 가중치 (짧은 필드는 부분 문자열, 긴 필드는 토큰 접두어로 검색)
+SHORT_FIELDS = {'name': 10, 'slug': 6, 'category': 4}
+LONG_FIELDS = {
+    'description': 3, 'ai_explanation': 1, 'project_suitability': 2,
+    'learning_difficulty': 1, 'homepage': 1, 'repo': 1,
+}
+
+_TOKEN_PATTERN = re.compile(r'[0-9a-z가-힣ㄱ-ㅎ#+.]+')
+
+
+def normalize(text):
+    """검색용 정규화 (NFC + 소문자 + 공백 정리)"""
+    if text is None:
+        return ''
+    return ' '.join(unicodedata.normalize('NFC', str(text)).lower().split())
+
+
+def chosung(text):
+    """한글 음절을 초성으로 변환 (그 외 문자는 그대로)"""
+    out = []
+    for ch in text:
+        code = ord(ch)
+        if _HANGUL_START <= code <= _HANGUL_END:
+            out.append(CHOSUNG[(code - _HANGUL_START) // 588])
+        else:
+            out.append(ch)
+    return ''.join(out)
+
+
+def is_chosung_query(text):
+    return bool(text) and all(ch in _CHOSUNG_SET for ch in text)
+
+
+def is_hangul(text):
+    """모든 문자가 한글 음절인지"""
+    return bool(text) and all(_HANGUL_START <= ord(ch) <= _HANGUL_END for ch in text)
+
+
+@functools.lru_cache(maxsize=65536)
+def _hangul_chosung(token):
+    """한글로만 된 토큰의 초성 (아니면 None)"""
+    return chosung(token) if is_hangul(token) else None
+
+
+def _add_posting(index, vocab, term, key):
+    postings = index.get(term)
+    if postings is None:
+        postings = index[term] = set()
+        bisect.insort(vocab, term)
+    postings.add(key)
+
+
+def _remove_posting(index, vocab, term, key):
+    postings = index.get(term)
+    if postings:
+        postings.discard(key)
+        if not postings:
+            del index[term]
+            i = bisect.bisect_left(vocab, term)
+            if i < len(vocab) and vocab[i] == term:
+                del vocab[i]
+
+
+def _match_prefix(index, vocab, term, weights):
+    """정렬된 어휘에서 term으로 시작하는 항목의 문서 점수 (정확히 같으면 가중치 2배)"""
+    scores = {}
+    i = bisect.bisect_left(vocab, term)
+    while i < len(vocab) and vocab[i].startswith(term):
+        entry = vocab[i]
+        exact = entry == term
+        for key in index[entry]:
+            weight = weights(key, entry) * (2 if exact else 1)
+            scores[key] = max(scores.get(key, 0), weight)
+        i += 1
+    return scores
+
+
+_JOSA_PATTERN = re.compile(r'^(.+?)(?:' + '|'.join(JOSA) + r')$')
+
+
+@functools.lru_cache(maxsize=65536)
+def _stem(token):
+    """한글 토큰에서 조사를 뗀 형태 (없으면 None)"""
+    if not _HANGUL_START <= ord(token[-1]) <= _HANGUL_END:
+        return None
+    match = _JOSA_PATTERN.match(token)
+    return match.group(1) if match else None
+
+
+def tokenize(text):
+    """토큰 목록 (한글 토큰은 조사를 뗀 형태도 포함)"""
+    tokens = []
+    for token in _TOKEN_PATTERN.findall(normalize(text)):
+        token = token.strip('.')
+        if not token:
+            continue
+        tokens.append(token)
+        stem = _stem(token)
+        if stem:
+            tokens.append(stem)
+    return tokens
+
+
+def ngrams(text):
+    """1-gram + 2-gram 집합"""
+    grams = set(text)
+    grams.update(text[i:i + 2] for i in range(len(text) - 1))
+    return grams
+
+
+def field_text(record, field):
+    """필드 값을 검색용 문자열로 변환 (리스트/딕셔너리 값 포함)"""
+    value = record.get(field)
+    if isinstance(value, dict):
+        value = ' '.join(str(v) for v in value.values() if isinstance(v, str))
+    elif isinstance(value, list):
+        value = ' '.join(str(v.get('title', '')) if isinstance(v, dict) else str(v) for v in value)
+    return normalize(value)
+
+
+class SearchIndex:
+    """n-gram + 토큰 역색인 (레코드 키 단위로 증분 갱신)"""
+
+    def __init__(self):
+        self.docs = {}          # key -> {'short': {field: text}, 'chosung': {초성: weight}, 'tokens': {token: weight}, 'sig': ...}
+        self.popularity = {}
+        self._grams = {}        # gram -> set(key)
+        self._tokens = {}       # token -> set(key)
+        self._vocab = []        # 정렬된 토큰 목록 (접두어 검색용)
+        self._chosung = {}      # 한글 토큰의 초성 -> set(key)
+        self._chosung_vocab = []
+
+    def __len__(self):
+        return len(self.docs)
+
+    # --- Indexing ---
+    @staticmethod
+    def signature(record):
+        return tuple(field_text(record, f) for f in list(SHORT_FIELDS) + list(LONG_FIELDS)) + (record.get('popularity'),)
+
+    def add(self, key, record, sig=None):
+        """레코드 색인 (이미 있으면 교체)"""
+        if key in self.docs:
+            self.remove(key)
+        short = {field: field_text(record, field) for field in SHORT_FIELDS}
+        tokens = {}
+        # 가중치 낮은 필드부터 채워 같은 토큰은 높은 가중치로 덮어씀
+        for field, weight in sorted(LONG_FIELDS.items(), key=lambda item: item[1]):
+            tokens.update(dict.fromkeys(tokenize(field_text(record, field)), weight))
+        # 초성은 한글 토큰(긴 필드)과 짧은 필드의 한글 단어에서 만듦
+        chosungs = {}
+        for token, weight in tokens.items():
+            cho = _hangul_chosung(token)
+            if cho and weight > chosungs.get(cho, 0):
+                chosungs[cho] = weight
+        for field, text in short.items():
+            for word in text.split():
+                cho = _hangul_chosung(word)
+                if cho:
+                    chosungs[cho] = max(chosungs.get(cho, 0), SHORT_FIELDS[field] * 3)
+        doc = {
+            'short': short,
+            'chosung': chosungs,
+            'tokens': tokens,
+            'sig': sig or self.signature(record),
+        }
+        self.docs[key] = doc
+        self.popularity[key] = record.get('popularity') or 0
+
+        for text in short.values():
+            for gram in ngrams(text):
+                self._grams.setdefault(gram, set()).add(key)
+        for token in tokens:
+            _add_posting(self._tokens, self._vocab, token, key)
+        for cho in chosungs:
+            _add_posting(self._chosung, self._chosung_vocab, cho, key)
+
+    def remove(self, key):
+        doc = self.docs.pop(key, None)
+        if doc is None:
+            return
+        self.popularity.pop(key, None)
+        for text in doc['short'].values():
+            for gram in ngrams(text):
+                postings = self._grams.get(gram)
+                if postings:
+                    postings.discard(key)
+                    if not postings:
+                        del self._grams[gram]
+        for token in doc['tokens']:
+            _remove_posting(self._tokens, self._vocab, token, key)
+        for cho in doc['chosung']:
+            _remove_posting(self._chosung, self._chosung_vocab, cho, key)
+
+    def apply(self, pending, budget=None):
+        """대기 중인 변경 {key: 레코드 또는 None(삭제)}을 앞에서부터 색인, 남은 수 반환
+
+        budget(초)을 주면 그 시간이 지난 뒤 멈추므로 UI 스레드에서 나눠 호출할 수 있습니다.
+        """
+        started = time.monotonic()
+        while pending:
+            key = next(iter(pending))
+            record = pending.pop(key)
+            if record is None:
+                self.remove(key)
+            else:
+                self.add(key, record)
+            if budget is not None and time.monotonic() - started >= budget:
+                break
+        return len(pending)
+
+    # --- Search ---
+    def _match_substring(self, term):
+        """짧은 필드 부분 문자열 일치 (n-gram 후보 -> 실제 포함 여부 확인)"""
+        grams = [term[i:i + 2] for i in range(len(term) - 1)] or [term]
+        candidates = None
+        for gram in sorted(grams, key=lambda g: len(self._grams.get(g, ()))):
+            postings = self._grams.get(gram)
+            if not postings:
+                return {}
+            candidates = set(postings) if candidates is None else candidates & postings
+            if not candidates:
+                return {}
+
+        scores = {}
+        for key in candidates:
+            score = 0
+            for field, text in self.docs[key]['short'].items():
+                if term not in text:
+                    continue
+                weight = SHORT_FIELDS[field]
+                if text == term:
+                    score += weight * 10
+                elif text.startswith(term):
+                    score += weight * 6
+                else:
+                    score += weight * 3
+            if score:
+                scores[key] = score
+        return scores
+
+    def _match_tokens(self, term):
+        """긴 필드 토큰 접두어 일치 (정확히 같은 토큰은 가중치 2배)"""
+        return _match_prefix(self._tokens, self._vocab, term, lambda key, token: self.docs[key]['tokens'][token])
+
+    def _match_chosung(self, term):
+        """한글 토큰 초성 접두어 일치 ('ㅍㄹㅇㅇㅋ' -> '프레임워크')"""
+        return _match_prefix(self._chosung, self._chosung_vocab, term, lambda key, cho: self.docs[key]['chosung'][cho])
+
+    def search(self, query, limit=None):
+        """질의어와 일치하는 레코드 키를 점수 순으로 반환 (빈 질의어면 None)
+
+        공백으로 나뉜 모든 단어가 어딘가에 일치해야 하며(AND), 점수가 같으면 인기도 순입니다.
+        """
+        terms = normalize(query).split()
+        if not terms:
+            return None
+
+        total = None
+        for term in terms:
+            if is_chosung_query(term):
+                scores = self._match_chosung(term)
+            else:
+                scores = self._match_substring(term)
+                for key, score in self._match_tokens(term).items():
+                    scores[key] = scores.get(key, 0) + score
+            if total is None:
+                total = scores
+            else:
+                total = {key: total[key] + score for key, score in scores.items() if key in total}
+            if not total:
+                return []
+
+        ranked = sorted(total, key=lambda key: (-total[key], -self.popularity.get(key, 0), self.docs[key]['short']['name']))
+        return ranked[:limit] if limit else ranked
@@ -0,0 +1,150 @@
+"""
+기존 기술 slug 인덱스
+
+Supabase techs 테이블을 키셋 페이지네이션으로 끝까지 읽고 로컬 stacks.json과 합쳐
+O(1) 멤버십 조회를 제공합니다. 결과는 로컬 스냅샷으로 저장해 다음 실행에서는
+updated_at 워터마크 이후에 바뀐 행만 가져옵니다. Supabase에 연결할 수 없으면
+스냅샷과 로컬 카탈로그만으로 동작합니다.
+"""
+
+import json
+import os
+import time
+
+from pipeline_events import log
+from stack_store import create_slug, load_stacks
+
+DEFAULT_PAGE_SIZE = 1000
+FULL_REFRESH_AGE = 24 * 60 * 60  # 삭제 반영을 위해 하루에 한 번은 전체 재조회
+
+
+class SlugIndex:
+    """원격 + 로컬 카탈로그의 slug 집합"""
+
+    def __init__(self, client, snapshot_path, stacks_path='stacks.json', slugify=None, page_size=DEFAULT_PAGE_SIZE):
+        self.client = client
+        self.snapshot_path = snapshot_path
+        self.stacks_path = stacks_path
+        self.slugify = slugify or create_slug
+        self.page_size = page_size
+        self.remote_slugs = set()
+        self.local_slugs = set()
+        self.watermark = None      # 원격에서 본 가장 최근 updated_at
+        self.last_cursor_slug = ''  # 같은 updated_at을 가진 행 사이의 위치
+        self.full_synced_at = 0
+        self.pages_fetched = 0
+
+    def __contains__(self, slug):
+        return slug in self.remote_slugs or slug in self.local_slugs
+
+    def __len__(self):
+        return len(self.remote_slugs | self.local_slugs)
+
+    def __iter__(self):
+        return iter(self.remote_slugs | self.local_slugs)
+
+    # --- Snapshot ---
+    def _load_snapshot(self):
+        try:
+            with open(self.snapshot_path, 'r', encoding='utf-8') as f:
+                snapshot = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return
+        self.remote_slugs = set(snapshot.get('slugs', []))
+        self.watermark = snapshot.get('watermark')
+        self.last_cursor_slug = snapshot.get('cursor_slug', '')
+        self.full_synced_at = snapshot.get('full_synced_at', 0)
+
+    def _save_snapshot(self):
+        directory = os.path.dirname(self.snapshot_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.snapshot_path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'slugs': sorted(self.remote_slugs),
+                'watermark': self.watermark,
+                'cursor_slug': self.last_cursor_slug,
+                'full_synced_at': self.full_synced_at,
+            }, f)
+        os.replace(tmp_path, self.snapshot_path)
+
+    # --- Remote ---
+    def _track_watermark(self, rows):
+        for row in rows:
+            updated_at = row.get('updated_at')
+            if not updated_at:
+                continue
+            key = (updated_at, row['slug'])
+            if self.watermark is None or key > (self.watermark, self.last_cursor_slug):
+                self.watermark, self.last_cursor_slug = key
+
+    def _fetch_all(self):
+        """slug 기준 키셋 페이지네이션으로 전체 slug 조회"""
+        slugs = set()
+        self.watermark = None
+        self.last_cursor_slug = ''
+        last_slug = None
+        while True:
+            query = self.client.table('techs').select('slug,updated_at').order('slug').limit(self.page_size)
+            if last_slug is not None:
+                query = query.gt('slug', last_slug)
+            rows = query.execute().data or []
+            self.pages_fetched += 1
+            slugs.update(row['slug'] for row in rows)
+            self._track_watermark(rows)
+            if len(rows) < self.page_size:
+                break
+            last_slug = rows[-1]['slug']
+        self.remote_slugs = slugs
+        self.full_synced_at = time.time()
+
+    def _fetch_changes(self):
+        """(updated_at, slug) 키셋으로 워터마크 이후 변경된 행만 조회"""
+        added = 0
+        while True:
+            ts, cursor = self.watermark, self.last_cursor_slug
+            rows = (
+                self.client.table('techs')
+                .select('slug,updated_at')
+                .or_(f'updated_at.gt."{ts}",and(updated_at.eq."{ts}",slug.gt."{cursor}")')
+                .order('updated_at')
+                .order('slug')
+                .limit(self.page_size)
+                .execute()
+                .data or []
+            )
+            self.pages_fetched += 1
+            for row in rows:
+                if row['slug'] not in self.remote_slugs:
+                    self.remote_slugs.add(row['slug'])
+                    added += 1
+            self._track_watermark(rows)
+            if len(rows) < self.page_size:
+                break
+        return added
+
+    # --- Public ---
+    def refresh(self, full=False):
+        """스냅샷 로드 -> 원격 변경분(또는 전체) 반영 -> 로컬 카탈로그 병합"""
+        self._load_snapshot()
+
+        if self.client:
+            try:
+                stale = time.time() - self.full_synced_at > FULL_REFRESH_AGE
+                if full or stale or self.watermark is None:
+                    self._fetch_all()
+                    log(f"[INFO] Slug index: full refresh, {len(self.remote_slugs)} remote slugs ({self.pages_fetched} pages)")
+                else:
+                    added = self._fetch_changes()
+                    log(f"[INFO] Slug index: incremental refresh, +{added} remote slugs ({self.pages_fetched} pages)")
+                self._save_snapshot()
+            except Exception as e:
+                log(f"[WARNING] Failed to refresh remote slugs: {e}. Using local snapshot ({len(self.remote_slugs)} slugs).")
+
+        self.local_slugs = {
+            stack.get('slug') or self.slugify(stack['name'])
+            for stack in load_stacks(self.stacks_path)
+            if stack.get('slug') or stack.get('name')
+        }
+        return self
@@ -0,0 +1,85 @@
+"""
+stacks.json 추가 전용 저널
+
+수집 결과를 NDJSON 저널에 한 줄씩 추가하고, N건마다 또는 실행 종료 시
+stacks.json으로 한 번에 압축(병합 + 인기도 정렬)합니다.
+압축은 임시 파일에 쓴 뒤 rename하므로 중간에 중단되어도 결과가 유실되지 않습니다.
+"""
+
+import json
+import os
+import threading
+
+from pipeline_events import log
+from stack_store import StackStore
+
+DEFAULT_COMPACT_EVERY = 25
+
+
+class StackJournal:
+    """NDJSON 저널 + 주기적 stacks.json 압축"""
+
+    def __init__(self, stacks_path='stacks.json', journal_path=None, compact_every=DEFAULT_COMPACT_EVERY):
+        self.stacks_path = stacks_path
+        self.journal_path = journal_path or os.path.join('.stackload', 'stacks.journal.ndjson')
+        self.compact_every = max(1, compact_every)
+        self.pending = 0
+        self.compactions = 0
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(self.journal_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # 이전 실행이 중단되어 남은 저널이 있으면 먼저 반영
+        if self._read_journal():
+            log(f"[JOURNAL] Recovering unfinished journal: {self.journal_path}")
+            self.compact()
+
+    def append(self, record):
+        """레코드 한 건을 저널에 추가 (compact_every건마다 압축)"""
+        line = json.dumps(record, ensure_ascii=False)
+        with self._lock:
+            with open(self.journal_path, 'a', encoding='utf-8') as f:
+                f.write(line + '\n')
+                f.flush()
+            self.pending += 1
+            should_compact = self.pending >= self.compact_every
+        if should_compact:
+            self.compact()
+
+    def _read_journal(self):
+        records = []
+        try:
+            with open(self.journal_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        records.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        # 중단 시점에 잘린 마지막 줄은 무시
+                        continue
+        except FileNotFoundError:
+            pass
+        return records
+
+    def compact(self):
+        """저널을 stacks.json에 병합 (slug 기준 최신 레코드 우선, 인기도 순 저장)"""
+        with self._lock:
+            records = self._read_journal()
+            if not records:
+                self.pending = 0
+                return 0
+
+            store = StackStore(self.stacks_path)
+            store.load()
+            store.put_many(records)
+            store.save()
+
+            # stacks.json 교체가 끝난 뒤에만 저널 비움 (중간 중단 시 재적용해도 결과 동일)
+            open(self.journal_path, 'w', encoding='utf-8').close()
+            self.pending = 0
+            self.compactions += 1
+            return len(records)
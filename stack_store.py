@@ -0,0 +1,218 @@
+"""
+stacks.json 레코드 저장소
+
+GUI와 수집 파이프라인이 같은 규칙(create_slug)으로 만든 slug를 키로 레코드를 관리합니다.
+get/put/delete는 dict 조회로 O(1)이고, 인기도 순서는 쓰기마다 해당 레코드 위치만
+이분 탐색으로 갱신하므로 전체 목록을 다시 정렬하지 않습니다. 변경 내용은 구독자에게
+StoreChange 목록으로 알립니다.
+"""
+
+import bisect
+import json
+import os
+import tempfile
+from collections import namedtuple
+
+# kind: 'put' | 'delete', previous: 변경 전 레코드 (새 레코드면 None)
+StoreChange = namedtuple('StoreChange', 'kind slug record previous')
+
+# 변경 건수가 전체의 이 비율을 넘으면 위치별 갱신 대신 한 번에 다시 정렬
+_RESORT_RATIO = 0.25
+
+
+def load_stacks(path):
+    """stacks.json 읽기 (없거나 깨졌으면 빈 목록)"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return []
+
+
+def write_stacks_atomic(path, stacks):
+    """임시 파일에 쓴 뒤 rename으로 stacks.json 교체"""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix='.stacks-', suffix='.json.tmp', dir=directory)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(stacks, f, ensure_ascii=False, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def create_slug(name):
+    """기술 이름 -> URL slug (GUI / 파이프라인 공통)"""
+    return name.lower().replace(' ', '-').replace('.', 'dot').replace('#', 'sharp').replace('+', 'plus')
+
+
+def key_for(record):
+    """레코드 키 (slug, 없으면 이름으로 만든 slug)"""
+    slug = record.get('slug')
+    if slug:
+        return slug
+    name = record.get('name')
+    return create_slug(name) if name else None
+
+
+class StackStore:
+    """slug -> 레코드 dict + 인기도 순 정렬 인덱스"""
+
+    def __init__(self, path='stacks.json'):
+        self.path = path
+        self._records = {}
+        self._order = []       # (-popularity, seq, slug) 정렬 목록
+        self._sort_keys = {}   # slug -> _order 안의 정렬 키
+        self._seq = 0          # 인기도가 같으면 먼저 들어온 레코드가 앞
+        self._listeners = []
+
+    def __len__(self):
+        return len(self._records)
+
+    def __contains__(self, slug):
+        return slug in self._records
+
+    def __iter__(self):
+        """인기도 순 레코드"""
+        return (self._records[slug] for _, _, slug in self._order)
+
+    # --- Notifications ---
+    def subscribe(self, callback):
+        """callback(changes) 등록 (changes: StoreChange 목록)"""
+        self._listeners.append(callback)
+        return callback
+
+    def unsubscribe(self, callback):
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def _notify(self, changes):
+        if not changes:
+            return
+        for callback in list(self._listeners):
+            callback(changes)
+
+    # --- Order index ---
+    def _sort_key(self, slug, record, previous_key=None):
+        popularity = record.get('popularity') or 0
+        if previous_key is not None and previous_key[0] == -popularity:
+            return previous_key
+        self._seq += 1
+        return (-popularity, self._seq, slug)
+
+    def _unlink(self, slug):
+        sort_key = self._sort_keys.pop(slug, None)
+        if sort_key is not None:
+            i = bisect.bisect_left(self._order, sort_key)
+            if i < len(self._order) and self._order[i] == sort_key:
+                del self._order[i]
+        return sort_key
+
+    def _resort(self):
+        self._order = sorted(self._sort_keys.values())
+
+    # --- Access ---
+    def get(self, slug, default=None):
+        return self._records.get(slug, default)
+
+    def keys(self):
+        """인기도 순 slug 목록"""
+        return [slug for _, _, slug in self._order]
+
+    def records(self):
+        """인기도 순 레코드 목록"""
+        return list(self)
+
+    def index_of(self, slug):
+        """인기도 순서에서의 위치 (없으면 None)"""
+        sort_key = self._sort_keys.get(slug)
+        if sort_key is None:
+            return None
+        return bisect.bisect_left(self._order, sort_key)
+
+    # --- Writes ---
+    def _apply_put(self, record, bulk):
+        slug = key_for(record)
+        if not slug:
+            return None
+        record['slug'] = slug
+        previous = self._records.get(slug)
+        old_key = self._sort_keys.get(slug)
+        new_key = self._sort_key(slug, record, old_key)
+        self._records[slug] = record
+        if new_key != old_key:
+            if not bulk:
+                self._unlink(slug)
+                bisect.insort(self._order, new_key)
+            self._sort_keys[slug] = new_key
+        return StoreChange('put', slug, record, previous)
+
+    def _apply_delete(self, slug, bulk):
+        record = self._records.pop(slug, None)
+        if record is None:
+            return None
+        if bulk:
+            self._sort_keys.pop(slug, None)
+        else:
+            self._unlink(slug)
+        return StoreChange('delete', slug, None, record)
+
+    def put(self, record):
+        """레코드 추가/교체 (slug가 없으면 이름으로 채움), 키 반환"""
+        change = self._apply_put(record, bulk=False)
+        if change is None:
+            return None
+        self._notify([change])
+        return change.slug
+
+    def delete(self, slug):
+        """레코드 삭제, 삭제된 레코드 반환 (없으면 None)"""
+        change = self._apply_delete(slug, bulk=False)
+        if change is None:
+            return None
+        self._notify([change])
+        return change.previous
+
+    def _apply_many(self, ops):
+        """(kind, arg) 목록 적용 후 알림 한 번 (변경이 많으면 정렬 인덱스를 한 번에 재구성)"""
+        bulk = len(ops) > max(16, len(self._records) * _RESORT_RATIO)
+        changes = []
+        for kind, arg in ops:
+            change = self._apply_put(arg, bulk) if kind == 'put' else self._apply_delete(arg, bulk)
+            if change is not None:
+                changes.append(change)
+        if bulk:
+            self._resort()
+        self._notify(changes)
+        return changes
+
+    def put_many(self, records):
+        return self._apply_many([('put', record) for record in records])
+
+    def delete_many(self, slugs):
+        return self._apply_many([('delete', slug) for slug in slugs])
+
+    # --- Persistence ---
+    def load(self):
+        """stacks.json과 맞춤 (바뀐 레코드만 put, 사라진 레코드는 delete), 변경 목록 반환"""
+        ops = []
+        seen = set()
+        for record in load_stacks(self.path):
+            slug = key_for(record)
+            if not slug or slug in seen:
+                continue
+            seen.add(slug)
+            if self._records.get(slug) != {**record, 'slug': slug}:
+                ops.append(('put', record))
+        ops.extend(('delete', slug) for slug in self._records if slug not in seen)
+        return self._apply_many(ops)
+
+    def save(self):
+        """인기도 순으로 stacks.json 저장 (임시 파일 + rename)"""
+        write_stacks_atomic(self.path, self.records())
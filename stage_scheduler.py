@@ -0,0 +1,153 @@
+"""
+기술별 단계(Stage) DAG 스케줄러
+
+각 기술의 처리 단계(search, crawl, score, enhance, logo, persist)를 의존성 그래프로
+실행합니다. 단계마다 독립적인 동시 실행 한도를 두어, 의존성이 없는 단계는 병렬로
+실행되고 여러 기술의 같은 단계가 서로 겹쳐 실행될 수 있습니다.
+단계별 대기열 길이와 사용률을 집계해 병목 단계를 확인할 수 있습니다.
+"""
+
+import asyncio
+import time
+
+from pipeline_events import log
+
+STAGES = ['search', 'crawl', 'score', 'enhance', 'logo', 'persist']
+
+
+def parse_stage_limits(spec):
+    """'search=4,crawl=2' 형식의 문자열을 {stage: limit}로 변환"""
+    limits = {}
+    if not spec:
+        return limits
+    for part in spec.split(','):
+        part = part.strip()
+        if not part:
+            continue
+        name, sep, value = part.partition('=')
+        name = name.strip()
+        if not sep or name not in STAGES:
+            raise ValueError(f"Invalid stage limit '{part}' (stages: {', '.join(STAGES)})")
+        limits[name] = max(1, int(value))
+    return limits
+
+
+class StageStats:
+    """단계별 실행 통계"""
+
+    def __init__(self, limit):
+        self.limit = limit
+        self.queued = 0
+        self.max_queued = 0
+        self.active = 0
+        self.completed = 0
+        self.failed = 0
+        self.busy_time = 0.0
+        self.wait_time = 0.0
+
+
+class StageScheduler:
+    """단계별 세마포어로 DAG 노드를 실행하는 스케줄러"""
+
+    def __init__(self, limits):
+        self.stats = {name: StageStats(limit) for name, limit in limits.items()}
+        self._semaphores = {name: asyncio.Semaphore(limit) for name, limit in limits.items()}
+        self._started_at = time.monotonic()
+
+    async def run_stage(self, name, func):
+        """단계 한도 안에서 func() 실행, (결과, 실행 시간) 반환"""
+        st = self.stats[name]
+        st.queued += 1
+        st.max_queued = max(st.max_queued, st.queued)
+        queued_at = time.monotonic()
+        async with self._semaphores[name]:
+            st.queued -= 1
+            st.active += 1
+            started_at = time.monotonic()
+            st.wait_time += started_at - queued_at
+            try:
+                result = await func()
+                st.completed += 1
+                return result, time.monotonic() - started_at
+            except BaseException:
+                st.failed += 1
+                raise
+            finally:
+                st.active -= 1
+                st.busy_time += time.monotonic() - started_at
+
+    async def run_graph(self, nodes, on_stage_done=None):
+        """의존성 그래프 실행
+
+        nodes: [(name, deps, func)] - func(results)는 의존 단계 결과 dict를 받는 코루틴 함수.
+        on_stage_done(name, result, duration)은 각 단계가 끝날 때마다 호출됩니다.
+        모든 단계 결과를 {name: result}로 반환합니다. 한 단계가 실패하면 나머지를 취소하고 예외를 전파합니다.
+        """
+        results = {}
+        tasks = {}
+
+        async def run_node(name, deps, func):
+            if deps:
+                await asyncio.gather(*(tasks[dep] for dep in deps))
+            result, duration = await self.run_stage(name, lambda: func(results))
+            results[name] = result
+            if on_stage_done:
+                on_stage_done(name, result, duration)
+            return result
+
+        # nodes는 의존 단계가 먼저 오도록 정렬되어 있어야 함
+        for name, deps, func in nodes:
+            missing = [dep for dep in deps if dep not in tasks]
+            if missing:
+                raise ValueError(f"Stage '{name}' depends on undefined stage(s): {', '.join(missing)}")
+            tasks[name] = asyncio.ensure_future(run_node(name, deps, func))
+
+        try:
+            await asyncio.gather(*tasks.values())
+        except BaseException:
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+            raise
+        return results
+
+    def snapshot(self):
+        """현재 단계별 상태 (대기열 길이, 실행 중, 사용률)"""
+        elapsed = max(time.monotonic() - self._started_at, 1e-9)
+        return {
+            name: {
+                'limit': st.limit,
+                'queued': st.queued,
+                'max_queued': st.max_queued,
+                'active': st.active,
+                'completed': st.completed,
+                'failed': st.failed,
+                'busy_time': st.busy_time,
+                'avg_wait': st.wait_time / max(st.completed + st.failed, 1),
+                'utilisation': st.busy_time / (st.limit * elapsed),
+            }
+            for name, st in self.stats.items()
+        }
+
+    def format_snapshot(self):
+        parts = []
+        for name, s in self.snapshot().items():
+            parts.append(f"{name} q={s['queued']} a={s['active']}/{s['limit']}")
+        return ' | '.join(parts)
+
+    def print_report(self):
+        """단계별 사용률 리포트 출력 (사용률이 가장 높은 단계가 병목)"""
+        snapshot = self.snapshot()
+        log("[STAGE] Stage report (utilisation = busy time / (limit x wall time))")
+        for name, s in snapshot.items():
+            log(f"[STAGE]   {name:<8} limit={s['limit']:<3} done={s['completed']:<4} failed={s['failed']:<3} "
+                f"max_queue={s['max_queued']:<4} avg_wait={s['avg_wait']:.2f}s util={s['utilisation'] * 100:.0f}%")
+        if snapshot:
+            bottleneck = max(snapshot, key=lambda n: snapshot[n]['utilisation'])
+            log(f"[STAGE] Bottleneck: {bottleneck}")
+
+    async def monitor(self, interval=10):
+        """주기적으로 단계별 대기열 상태 출력 (취소될 때까지)"""
+        while True:
+            await asyncio.sleep(interval)
+            log(f"[STAGE] {self.format_snapshot()}")
@@ -0,0 +1,386 @@
+"""
+Supabase 일괄 쓰기 도우미
+
+완료된 레코드를 버퍼에 모았다가 N건마다 또는 T초마다 한 번의 다중 행 upsert로
+techs 테이블에 반영합니다. 일괄 요청이 실패하면 행마다 따로 재시도합니다.
+PostgREST 호환 클라이언트(supabase.Client)라면 로컬 대체 서버에서도 동작합니다.
+
+WriteBehindQueue는 GUI용 백그라운드 쓰기 큐입니다. slug별 마지막 작업만 남겨
+upsert는 묶음으로, 삭제는 in_ 필터 한 번으로 보내고, 실패하면 백오프 후 재시도합니다.
+대기 중인 작업은 파일에 저장되므로 오프라인 상태에서 재시작해도 유지됩니다.
+"""
+
+import asyncio
+import json
+import os
+import threading
+import time
+
+from pipeline_events import log
+
+DEFAULT_BATCH_SIZE = 25
+DEFAULT_FLUSH_SECONDS = 5.0
+
+DEFAULT_WRITE_DELAY = 1.0       # 편집을 모으는 시간 (초)
+DEFAULT_RETRY_BASE = 2.0        # 첫 재시도 대기 (초, 실패할 때마다 2배)
+DEFAULT_RETRY_MAX = 300.0
+DEFAULT_MAX_ATTEMPTS = 8        # 서버는 응답하는데 계속 실패하는 행은 이 횟수 후 포기
+DELETE_CHUNK_SIZE = 100         # in_ 필터 URL 길이 제한
+
+
+# stacks.json 필드 -> techs 테이블 컬럼 (slug / updated_at 제외)
+SYNC_FIELDS = {
+    'name': 'name',
+    'category': 'category',
+    'description': 'description',
+    'logoUrl': 'logo_url',
+    'popularity': 'popularity',
+    'learning_resources': 'learning_resources',
+    'ai_explanation': 'ai_explanation',
+    'homepage': 'homepage',
+    'repo': 'repo',
+    'project_suitability': 'project_suitability',
+    'learning_difficulty': 'learning_difficulty',
+}
+
+
+def from_table_row(row):
+    """techs 테이블 행을 stacks.json 레코드로 변환 (조회하지 않은 컬럼은 제외)"""
+    record = {'slug': row.get('slug'), 'updated_at': row.get('updated_at')}
+    for field, column in SYNC_FIELDS.items():
+        if column in row:
+            record[field] = row[column]
+    return record
+
+
+def to_table_row(data):
+    """stacks.json 레코드를 techs 테이블 행으로 변환 (updated_at은 DB 트리거가 기록)"""
+    return {
+        'name': data['name'],
+        'slug': data['slug'],
+        'category': data.get('category'),
+        'description': data.get('description'),
+        'logo_url': data.get('logoUrl'),
+        'popularity': int(data.get('popularity') or 0),
+        'learning_resources': data.get('learning_resources', []),
+        'ai_explanation': data.get('ai_explanation'),
+        'homepage': data.get('homepage'),
+        'repo': data.get('repo'),
+        'project_suitability': data.get('project_suitability', []),
+        'learning_difficulty': data.get('learning_difficulty', {}),
+    }
+
+
+class BatchUpserter:
+    """버퍼링 + 주기적 다중 행 upsert"""
+
+    def __init__(self, client, table='techs', batch_size=DEFAULT_BATCH_SIZE, flush_seconds=DEFAULT_FLUSH_SECONDS,
+                 on_written=None):
+        self.client = client
+        self.on_written = on_written  # on_written(rows): 반영이 확인된 행 목록
+        self.table = table
+        self.batch_size = max(1, batch_size)
+        self.flush_seconds = flush_seconds
+        self.round_trips = 0
+        self.rows_written = 0
+        self.failed_rows = []
+        self.db_time = 0.0
+        self._buffer = {}  # slug -> row (같은 slug는 최신 값만 유지)
+        self._flush_lock = asyncio.Lock()
+        self._timer = None
+
+    def start(self):
+        """T초마다 버퍼를 비우는 백그라운드 타이머 시작"""
+        if self._timer is None and self.flush_seconds > 0:
+            self._timer = asyncio.create_task(self._periodic_flush())
+
+    async def _periodic_flush(self):
+        while True:
+            await asyncio.sleep(self.flush_seconds)
+            await self.flush()
+
+    async def add(self, data):
+        """레코드 추가 (버퍼가 batch_size에 도달하면 즉시 flush)"""
+        row = to_table_row(data)
+        self._buffer[row['slug']] = row
+        if len(self._buffer) >= self.batch_size:
+            await self.flush()
+
+    def _execute(self, rows):
+        started = time.monotonic()
+        try:
+            self.round_trips += 1
+            return self.client.table(self.table).upsert(rows, on_conflict='slug').execute()
+        finally:
+            self.db_time += time.monotonic() - started
+
+    def _written(self, rows):
+        if self.on_written:
+            self.on_written(rows)
+
+    async def flush(self):
+        """버퍼를 한 번의 upsert로 반영 (실패 시 행 단위 재시도)"""
+        async with self._flush_lock:
+            if not self._buffer:
+                return 0
+            rows = list(self._buffer.values())
+            self._buffer = {}
+
+            try:
+                await asyncio.to_thread(self._execute, rows)
+                self.rows_written += len(rows)
+                log(f"        [SUCCESS] Bulk upsert: {len(rows)} rows")
+                self._written(rows)
+                return len(rows)
+            except Exception as e:
+                log(f"        [WARNING] Bulk upsert failed ({len(rows)} rows): {e}. Retrying rows individually...")
+
+            written = 0
+            for row in rows:
+                try:
+                    await asyncio.to_thread(self._execute, [row])
+                    self.rows_written += 1
+                    written += 1
+                    self._written([row])
+                except Exception as e:
+                    log(f"        [ERROR] Upsert failed for '{row['name']}': {e}")
+                    self.failed_rows.append(row)
+            return written
+
+    async def close(self):
+        """타이머 중지 후 남은 버퍼 최종 반영"""
+        if self._timer:
+            self._timer.cancel()
+            try:
+                await self._timer
+            except asyncio.CancelledError:
+                pass
+            self._timer = None
+        await self.flush()
+
+    def stats(self):
+        return {
+            'round_trips': self.round_trips,
+            'rows_written': self.rows_written,
+            'failed_rows': len(self.failed_rows),
+            'db_time': self.db_time,
+        }
+
+
+# 인증/권한 오류 (만료된 JWT, 잘못된 키, 권한 없음): 행 문제가 아니므로 큐를 유지한 채 백오프
+AUTH_ERROR_CODES = {'401', '403', 'PGRST300', 'PGRST301', 'PGRST302', '42501'}
+
+
+def is_rejection(error):
+    """서버가 이 행(들)을 거부했는지 (False면 연결 실패 / 일시적 서버 오류 / 인증 오류)"""
+    code = getattr(error, 'code', None)
+    if code is None:
+        return False
+    code = str(code)
+    if code in AUTH_ERROR_CODES:
+        return False
+    if code.isdigit() and len(code) == 3:
+        # HTTP 상태 코드: 4xx만 거부로 봄 (408/429는 일시적)
+        return code.startswith('4') and code not in ('408', '429')
+    # Postgres / PostgREST 오류 코드 (23505, PGRST204 ...)
+    return True
+
+
+class WriteBehindQueue:
+    """GUI 쓰기용 백그라운드 큐 (slug별 최신 작업만 유지, 파일로 유지)"""
+
+    def __init__(self, client, path, table='techs', batch_size=DEFAULT_BATCH_SIZE, delay=DEFAULT_WRITE_DELAY,
+                 retry_base=DEFAULT_RETRY_BASE, retry_max=DEFAULT_RETRY_MAX, max_attempts=DEFAULT_MAX_ATTEMPTS,
+                 on_change=None, log=print):
+        self.client = client
+        self.path = path
+        self.table = table
+        self.batch_size = max(1, batch_size)
+        self.delay = delay
+        self.retry_base = retry_base
+        self.retry_max = retry_max
+        self.max_attempts = max_attempts
+        self.on_change = on_change  # on_change(pending_count), 작업 스레드에서 호출될 수 있음
+        self.log = log
+        self.round_trips = 0
+        self.failures = 0           # 연속 실패 횟수 (백오프 계산용)
+        self._retry_at = 0.0        # 실패 후 다시 보낼 수 있는 시각 (monotonic)
+        self._pending = {}          # slug -> {'op': 'upsert' | 'delete', 'row': dict | None, 'attempts': int}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+        self._load()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._pending)
+
+    # --- Persistence ---
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self._pending = json.load(f).get('pending', {})
+        except (FileNotFoundError, json.JSONDecodeError):
+            self._pending = {}
+
+    def _save(self):
+        """대기열 저장 (락을 잡은 상태에서 호출)"""
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'pending': self._pending}, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            self.log(f"[WARNING] Failed to persist sync queue: {e}")
+
+    def _changed(self):
+        count = len(self)
+        if self.on_change:
+            self.on_change(count)
+
+    # --- Enqueue ---
+    def upsert(self, row):
+        """행 upsert 예약 (같은 slug의 대기 중인 upsert와 필드 병합, 삭제는 덮어씀)"""
+        self.upsert_many([row])
+
+    def upsert_many(self, rows):
+        with self._lock:
+            for row in rows:
+                entry = self._pending.get(row['slug'])
+                if entry and entry['op'] == 'upsert':
+                    row = {**entry['row'], **row}
+                self._pending[row['slug']] = {'op': 'upsert', 'row': row, 'attempts': 0}
+            self._save()
+        self._changed()
+        self._wake.set()
+
+    def delete_many(self, slugs):
+        """삭제 예약 (대기 중인 upsert는 취소)"""
+        with self._lock:
+            for slug in slugs:
+                self._pending[slug] = {'op': 'delete', 'row': None, 'attempts': 0}
+            self._save()
+        self._changed()
+        self._wake.set()
+
+    def set_client(self, client):
+        """연결되면 대기 중인 작업을 바로 전송"""
+        self.client = client
+        self.failures = 0
+        self._retry_at = 0.0
+        self._wake.set()
+
+    # --- Worker ---
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+            if len(self):
+                self._wake.set()
+
+    def stop(self, timeout=5.0):
+        """남은 작업을 한 번 더 보내고 종료 (실패분은 파일에 남음)"""
+        self._stop.set()
+        self._wake.set()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def backoff(self):
+        return min(self.retry_max, self.retry_base * (2 ** max(0, self.failures - 1)))
+
+    def _run(self):
+        while not self._stop.is_set():
+            self._wake.wait(self.backoff() if self.failures else None)
+            # 백오프 중에 들어온 편집은 재시도 시각까지 모아 둠 (만료된 키로 편집마다 재요청하지 않도록)
+            while not self._stop.is_set() and time.monotonic() < self._retry_at:
+                self._wake.clear()
+                self._wake.wait(self._retry_at - time.monotonic())
+            if self._stop.is_set():
+                break
+            self._wake.clear()
+            # 연속 편집을 한 번에 보내도록 잠시 모음
+            self._stop.wait(self.delay)
+            self.flush()
+        self.flush()
+
+    def _send(self, chunk, request):
+        """묶음 전송 -> (성공 목록, 서버가 거부한 목록, 보내지 못한 목록)
+
+        서버가 요청을 거부하면 문제 행을 찾기 위해 행마다 다시 보내고,
+        연결 실패/5xx/429는 백오프 후 전체를 다시 보냅니다.
+        """
+        try:
+            self.round_trips += 1
+            request(chunk)
+            return chunk, [], []
+        except Exception as e:
+            if not is_rejection(e):
+                self.log(f"[WARNING] Sync request failed: {e}")
+                return [], [], chunk
+            if len(chunk) == 1:
+                self.log(f"[WARNING] Sync rejected for '{chunk[0][0]}': {e}")
+                return [], chunk, []
+
+        sent, rejected, unsent = [], [], []
+        for item in chunk:
+            item_sent, item_rejected, item_unsent = self._send([item], request)
+            sent += item_sent
+            rejected += item_rejected
+            unsent += item_unsent
+        return sent, rejected, unsent
+
+    def flush(self):
+        """대기 중인 작업 전송, 보낸 작업 수 반환"""
+        if not self.client:
+            return 0
+        with self._lock:
+            snapshot = dict(self._pending)
+        if not snapshot:
+            return 0
+
+        upserts = [(slug, entry) for slug, entry in snapshot.items() if entry['op'] == 'upsert']
+        deletes = [(slug, entry) for slug, entry in snapshot.items() if entry['op'] == 'delete']
+        done, rejected, unsent = [], [], []
+
+        def delete(items):
+            return self.client.table(self.table).delete().in_('slug', [slug for slug, _ in items]).execute()
+
+        def upsert(items):
+            return self.client.table(self.table).upsert([entry['row'] for _, entry in items], on_conflict='slug').execute()
+
+        chunks = [(deletes[i:i + DELETE_CHUNK_SIZE], delete) for i in range(0, len(deletes), DELETE_CHUNK_SIZE)]
+        chunks += [(upserts[i:i + self.batch_size], upsert) for i in range(0, len(upserts), self.batch_size)]
+        for chunk, request in chunks:
+            sent, chunk_rejected, chunk_unsent = self._send(chunk, request)
+            done += sent
+            rejected += chunk_rejected
+            unsent += chunk_unsent
+
+        with self._lock:
+            # 전송 중에 다시 바뀐 slug는 남겨 둠
+            for slug, entry in done:
+                if self._pending.get(slug) is entry:
+                    del self._pending[slug]
+            # 서버가 계속 거부하는 행은 max_attempts 후 포기 (나머지 작업을 막지 않도록)
+            for slug, entry in rejected:
+                if self._pending.get(slug) is entry:
+                    entry['attempts'] += 1
+                    if entry['attempts'] >= self.max_attempts:
+                        del self._pending[slug]
+                        self.log(f"[ERROR] Sync gave up on '{slug}' after {entry['attempts']} attempts")
+            failed = len(unsent) + sum(1 for slug, entry in rejected if slug in self._pending)
+            self._save()
+
+        self.failures = self.failures + 1 if failed else 0
+        self._retry_at = time.monotonic() + self.backoff() if failed else 0.0
+        if done:
+            self.log(f"[SUCCESS] Synced {len(done)} change(s) to Supabase")
+        if failed:
+            self.log(f"[WARNING] {failed} change(s) not synced, retrying in {self.backoff():.0f}s")
+        self._changed()
+        return len(done)
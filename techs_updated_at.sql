@@ -0,0 +1,16 @@
+-- techs.updated_at을 DB가 기록 (클라이언트 시계와 무관하게 delta_sync 워터마크가 앞으로만 이동)
+-- Supabase SQL Editor에서 한 번 실행
+
+alter table techs alter column updated_at set default now();
+
+create or replace function techs_set_updated_at() returns trigger as $$
+begin
+  new.updated_at = now();
+  return new;
+end;
+$$ language plpgsql;
+
+drop trigger if exists techs_set_updated_at on techs;
+create trigger techs_set_updated_at
+  before insert or update on techs
+  for each row execute function techs_set_updated_at();
@@ -0,0 +1,219 @@
+"""
+실행 텔레메트리 (JSON Lines)
+
+실행마다 .stackload/telemetry/<run-id>.jsonl 파일에 기술별·단계별 소요 시간과
+크롤링 바이트, 프롬프트/응답 크기, 재시도 횟수, 캐시 적중/미스를 한 줄씩 기록합니다.
+단계 안에서 일어난 호출은 contextvars로 현재 단계에 집계되므로 호출 지점에서는
+count()만 호출하면 됩니다. report()는 단계별 p50/p95/max와 분당 처리 기술 수를 요약하고
+두 실행을 비교합니다.
+"""
+
+import contextlib
+import contextvars
+import datetime
+import glob
+import json
+import os
+import threading
+
+from pipeline_events import RunStarted, StageFinished, RecordPersisted, TechFailed, RunFinished
+
+METRIC_FIELDS = ['bytes_crawled', 'prompt_bytes', 'response_bytes', 'gemini_calls', 'retries', 'cache_hits', 'cache_misses']
+
+_current = contextvars.ContextVar('stackload_stage_metrics', default=None)
+
+
+@contextlib.contextmanager
+def collect():
+    """블록 안(같은 태스크)에서 count()된 값을 모으는 dict를 반환"""
+    metrics = {}
+    token = _current.set(metrics)
+    try:
+        yield metrics
+    finally:
+        _current.reset(token)
+
+
+def count(field, amount=1):
+    """현재 단계의 지표 증가 (단계 밖에서 호출되면 무시)"""
+    metrics = _current.get()
+    if metrics is not None:
+        metrics[field] = metrics.get(field, 0) + amount
+
+
+def _now():
+    return datetime.datetime.now(datetime.timezone.utc).isoformat()
+
+
+def path_for(state_dir, run_id):
+    return os.path.join(state_dir, 'telemetry', f"{run_id}.jsonl")
+
+
+class TelemetryWriter:
+    """파이프라인 이벤트를 JSONL 텔레메트리로 기록하는 이벤트 구독자"""
+
+    def __init__(self, state_dir):
+        self.state_dir = state_dir
+        self.path = None
+        self.run_id = None
+        self._lock = threading.Lock()
+
+    def _append(self, entry):
+        if not self.path:
+            return
+        entry['ts'] = _now()
+        line = json.dumps(entry, ensure_ascii=False)
+        with self._lock:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(line + '\n')
+
+    def handle(self, event):
+        if isinstance(event, RunStarted):
+            self.run_id = event.run_id
+            self.path = path_for(self.state_dir, event.run_id)
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self._append({'type': 'run_start', 'run_id': event.run_id, 'techs': len(event.techs), 'resumed': event.resumed})
+        elif isinstance(event, StageFinished):
+            entry = {
+                'type': 'stage', 'tech': event.tech, 'stage': event.stage,
+                'duration': round(event.duration, 4), 'ok': event.ok, 'restored': event.restored,
+            }
+            for field in METRIC_FIELDS:
+                entry[field] = (event.metrics or {}).get(field, 0)
+            self._append(entry)
+        elif isinstance(event, RecordPersisted):
+            self._append({'type': 'tech', 'tech': event.tech, 'ok': True, 'duration': round(event.duration, 4)})
+        elif isinstance(event, TechFailed):
+            self._append({'type': 'tech', 'tech': event.tech, 'ok': False, 'reason': event.reason})
+        elif isinstance(event, RunFinished):
+            self._append({'type': 'run_end', 'run_id': event.run_id, 'processed': event.processed, 'failed': event.failed})
+            self.path = None
+
+
+# --- Report ---
+def resolve_path(state_dir, run):
+    """실행 id / 파일 경로 / 'latest'를 텔레메트리 파일 경로로 변환"""
+    if run in (None, 'latest'):
+        files = glob.glob(os.path.join(state_dir, 'telemetry', '*.jsonl'))
+        if not files:
+            raise FileNotFoundError(f"No telemetry files in {os.path.join(state_dir, 'telemetry')}")
+        return max(files, key=os.path.getmtime)
+    if os.path.exists(run):
+        return run
+    return path_for(state_dir, run)
+
+
+def percentile(values, pct):
+    """nearest-rank 백분위수"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
+
+
+def summarize(path):
+    """텔레메트리 파일 요약 (단계별 지연 분포, 처리량)"""
+    stages = {}
+    persisted = failed = 0
+    wall = 0.0
+    segment_start = last_ts = None
+
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            ts = datetime.datetime.fromisoformat(entry['ts'])
+            kind = entry.get('type')
+            if kind == 'run_start':
+                # 재개된 실행은 구간별 시간을 합산
+                if segment_start and last_ts:
+                    wall += (last_ts - segment_start).total_seconds()
+                segment_start = ts
+            elif kind == 'stage' and not entry.get('restored'):
+                st = stages.setdefault(entry['stage'], {'durations': [], 'ok': 0, **{k: 0 for k in METRIC_FIELDS}})
+                st['durations'].append(entry['duration'])
+                st['ok'] += 1 if entry.get('ok') else 0
+                for field in METRIC_FIELDS:
+                    st[field] += entry.get(field, 0)
+            elif kind == 'tech':
+                if entry.get('ok'):
+                    persisted += 1
+                else:
+                    failed += 1
+            last_ts = ts
+
+    if segment_start and last_ts:
+        wall += (last_ts - segment_start).total_seconds()
+
+    summary = {'path': path, 'persisted': persisted, 'failed': failed, 'wall': wall, 'stages': {}}
+    summary['techs_per_minute'] = persisted / (wall / 60) if wall > 0 else 0.0
+    for name, st in stages.items():
+        durations = st.pop('durations')
+        lookups = st['cache_hits'] + st['cache_misses']
+        summary['stages'][name] = {
+            'count': len(durations),
+            'p50': percentile(durations, 50),
+            'p95': percentile(durations, 95),
+            'max': max(durations),
+            'total': sum(durations),
+            'cache_hit_rate': st['cache_hits'] / lookups if lookups else None,
+            **st,
+        }
+    return summary
+
+
+def _format_rate(rate):
+    return '-' if rate is None else f"{rate * 100:.0f}%"
+
+
+def print_summary(summary):
+    print(f"[REPORT] {summary['path']}")
+    print(f"[REPORT] Persisted: {summary['persisted']}, failed: {summary['failed']}, "
+          f"wall: {summary['wall']:.1f}s, throughput: {summary['techs_per_minute']:.2f} techs/min")
+    print(f"[REPORT]   {'stage':<8} {'n':>5} {'p50':>8} {'p95':>8} {'max':>8} {'total':>9} "
+          f"{'crawl KB':>9} {'prompt KB':>10} {'resp KB':>8} {'calls':>6} {'retries':>7} {'cache':>6}")
+    for name, s in sorted(summary['stages'].items(), key=lambda item: item[1]['total'], reverse=True):
+        print(f"[REPORT]   {name:<8} {s['count']:>5} {s['p50']:>7.2f}s {s['p95']:>7.2f}s {s['max']:>7.2f}s {s['total']:>8.1f}s "
+              f"{s['bytes_crawled'] / 1024:>9.1f} {s['prompt_bytes'] / 1024:>10.1f} {s['response_bytes'] / 1024:>8.1f} "
+              f"{s['gemini_calls']:>6} {s['retries']:>7} {_format_rate(s['cache_hit_rate']):>6}")
+    if summary['stages']:
+        slowest = max(summary['stages'], key=lambda n: summary['stages'][n]['total'])
+        print(f"[REPORT] Most time spent in: {slowest}")
+
+
+def _delta(a, b):
+    if not a:
+        return '-'
+    return f"{(b - a) / a * 100:+.0f}%"
+
+
+def print_comparison(base, other):
+    """두 실행의 단계별 p50/p95/max와 처리량 비교 (base 대비 변화율)"""
+    print(f"[REPORT] A: {base['path']}")
+    print(f"[REPORT] B: {other['path']}")
+    print(f"[REPORT] Throughput: {base['techs_per_minute']:.2f} -> {other['techs_per_minute']:.2f} techs/min "
+          f"({_delta(base['techs_per_minute'], other['techs_per_minute'])})")
+    print(f"[REPORT]   {'stage':<8} {'p50 A':>8} {'p50 B':>8} {'':>6} {'p95 A':>8} {'p95 B':>8} {'':>6} {'max A':>8} {'max B':>8} {'':>6}")
+    for name in sorted(set(base['stages']) | set(other['stages'])):
+        a = base['stages'].get(name, {})
+        b = other['stages'].get(name, {})
+        cells = []
+        for key in ('p50', 'p95', 'max'):
+            va, vb = a.get(key), b.get(key)
+            cells.append(f"{'-' if va is None else f'{va:.2f}s':>8} {'-' if vb is None else f'{vb:.2f}s':>8} "
+                         f"{_delta(va, vb) if va is not None and vb is not None else '-':>6}")
+        print(f"[REPORT]   {name:<8} " + ' '.join(cells))
+
+
+def report(state_dir, run=None, compare=None):
+    """텔레메트리 요약 출력 (compare가 있으면 두 실행 비교)"""
+    base = summarize(resolve_path(state_dir, run))
+    if compare is None:
+        print_summary(base)
+        return base
+    other = summarize(resolve_path(state_dir, compare))
+    print_comparison(base, other)
+    return base, other
@@ -0,0 +1,252 @@
+"""
+가상화된 고정 높이 목록 위젯
+
+보이는 영역 + 위아래 여유(overscan) 만큼의 행 위젯만 만들고, 스크롤할 때는 위젯을
+새로 만들지 않고 다른 레코드를 다시 그려 재사용합니다. 레코드 수와 관계없이 위젯 수가
+일정하므로 수만 건의 카탈로그에서도 검색/새로고침/스크롤이 즉시 반영됩니다.
+"""
+
+import tkinter as tk
+
+import customtkinter as ctk
+
+
+def visible_range(offset, viewport_height, row_height, count, overscan=2):
+    """스크롤 위치(px)에서 그려야 할 (첫 인덱스, 끝 인덱스) 계산 (끝은 제외)"""
+    if count <= 0 or row_height <= 0:
+        return 0, 0
+    first = max(0, int(offset // row_height) - overscan)
+    last = min(count, int((offset + viewport_height) // row_height) + 1 + overscan)
+    return first, last
+
+
+class _RowSlot:
+    """재사용되는 행 위젯 묶음 (행 프레임 + 열별 셀/라벨 + 하단 구분선)"""
+
+    def __init__(self, frame, labels):
+        self.frame = frame
+        self.labels = labels
+        self.index = None       # 현재 표시 중인 view index
+        self.texts = None       # 마지막으로 그린 셀 텍스트 (변경 시에만 configure)
+        self.selected = None
+        self.hover = False
+
+
+class VirtualList:
+    """고정 높이 행을 재사용하는 가상 목록
+
+    columns: [(width, anchor, font)] - anchor는 'w' 또는 'center'
+    get_row(index): 해당 행의 셀 텍스트 튜플
+    is_selected(index): 선택 여부
+    on_click(index, event): 행 클릭 콜백
+    """
+
+    def __init__(self, parent, columns, get_row, is_selected, on_click, row_height=36, overscan=2,
+                 bg="#252526", hover_color="#2a2d2e", selected_color="#094771", separator_color="#2d2d2d",
+                 text_colors=("#e1e1e1", "#858585"), selected_text_colors=("white", "#d1d5db")):
+        self.columns = columns
+        self.get_row = get_row
+        self.is_selected = is_selected
+        self.on_click = on_click
+        self.row_height = row_height
+        self.overscan = overscan
+        self.bg = bg
+        self.hover_color = hover_color
+        self.selected_color = selected_color
+        self.separator_color = separator_color
+        self.text_colors = text_colors
+        self.selected_text_colors = selected_text_colors
+        self.count = 0
+        self.offset = 0
+        self._slots = []
+
+        self.container = ctk.CTkFrame(parent, fg_color=bg, corner_radius=0)
+        self.viewport = tk.Frame(self.container, bg=bg, highlightthickness=0, bd=0)
+        self.scrollbar = ctk.CTkScrollbar(self.container, command=self._on_scrollbar)
+        self.scrollbar.pack(side="right", fill="y")
+        self.viewport.pack(side="left", fill="both", expand=True)
+
+        self.viewport.bind("<Configure>", lambda e: self._layout())
+        self._bind_wheel(self.viewport)
+
+    # --- Geometry ---
+    def pack(self, **kwargs):
+        self.container.pack(**kwargs)
+
+    def grid(self, **kwargs):
+        self.container.grid(**kwargs)
+
+    @property
+    def viewport_height(self):
+        return max(1, self.viewport.winfo_height())
+
+    @property
+    def max_offset(self):
+        return max(0, self.count * self.row_height - self.viewport_height)
+
+    # --- Public API ---
+    def set_count(self, count, keep_scroll=False):
+        """표시할 행 수 변경 (keep_scroll=False면 맨 위로)"""
+        self.count = count
+        self.offset = min(self.offset, self.max_offset) if keep_scroll else 0
+        for slot in self._slots:
+            slot.index = None  # 같은 위치라도 다른 레코드일 수 있으므로 다시 그림
+        self._layout()
+
+    def refresh_rows(self):
+        """보이는 행의 내용/선택 상태를 다시 그림 (위젯은 재사용)"""
+        for slot in self._slots:
+            slot.index = None
+        self._render()
+
+    def refresh_row(self, index):
+        """index 행이 화면에 있으면 그 행만 다시 그림"""
+        for slot in self._slots:
+            if slot.index == index:
+                self._draw(slot, index, force=True)
+                return True
+        return False
+
+    def scroll_to(self, index):
+        """index 행이 보이도록 스크롤"""
+        top = index * self.row_height
+        if top < self.offset:
+            self._scroll_to_offset(top)
+        elif top + self.row_height > self.offset + self.viewport_height:
+            self._scroll_to_offset(top + self.row_height - self.viewport_height)
+
+    def visible_indices(self):
+        return [slot.index for slot in self._slots if slot.index is not None]
+
+    # --- Scrolling ---
+    def _scroll_to_offset(self, offset):
+        offset = min(max(0, offset), self.max_offset)
+        if offset != self.offset:
+            self.offset = offset
+            self._render()
+
+    def _on_scrollbar(self, *args):
+        if args[0] == "moveto":
+            self._scroll_to_offset(float(args[1]) * self.count * self.row_height)
+        elif args[0] == "scroll":
+            step = self.viewport_height if args[2] == "pages" else self.row_height
+            self._scroll_to_offset(self.offset + int(args[1]) * step)
+
+    def _on_wheel(self, event):
+        if getattr(event, 'num', None) == 4:
+            units = -1
+        elif getattr(event, 'num', None) == 5:
+            units = 1
+        else:
+            # Windows는 120 단위, macOS는 작은 정수
+            units = -int(event.delta / 120) if abs(event.delta) >= 120 else -event.delta
+        self._scroll_to_offset(self.offset + units * self.row_height * 3)
+        return "break"
+
+    def _bind_wheel(self, widget):
+        widget.bind("<MouseWheel>", self._on_wheel)
+        widget.bind("<Button-4>", self._on_wheel)
+        widget.bind("<Button-5>", self._on_wheel)
+
+    # --- Row pool ---
+    def _create_slot(self):
+        total_width = sum(width for width, _, _ in self.columns)
+        frame = ctk.CTkFrame(self.viewport, width=total_width, height=self.row_height, fg_color=self.bg, corner_radius=0)
+        frame.pack_propagate(False)
+        slot = _RowSlot(frame, [])
+
+        def on_enter(e):
+            slot.hover = True
+            self._paint(slot)
+        def on_leave(e):
+            slot.hover = False
+            self._paint(slot)
+        def on_click(e):
+            if slot.index is not None:
+                self.on_click(slot.index, e)
+
+        def bind(widget):
+            widget.bind("<Enter>", on_enter)
+            widget.bind("<Leave>", on_leave)
+            widget.bind("<Button-1>", on_click)
+            self._bind_wheel(widget)
+
+        bind(frame)
+        x = 0
+        for width, anchor, font in self.columns:
+            # 셀 프레임이 긴 텍스트를 열 너비로 자름
+            cell = ctk.CTkFrame(frame, width=width, height=self.row_height - 1, fg_color="transparent", corner_radius=0)
+            cell.place(x=x, y=0)
+            label = ctk.CTkLabel(cell, text="", font=font)
+            if anchor == "w":
+                label.place(relx=0, rely=0.5, anchor="w", x=10 if x == 0 else 5)
+            else:
+                label.place(relx=0.5, rely=0.5, anchor="center")
+            bind(cell)
+            bind(label)
+            slot.labels.append(label)
+            x += width
+
+        separator = ctk.CTkFrame(frame, height=1, fg_color=self.separator_color, corner_radius=0)
+        separator.place(x=0, rely=1.0, anchor="sw", relwidth=1.0)
+        return slot
+
+    def _layout(self):
+        """뷰포트 높이에 맞게 행 위젯 수 조정 후 다시 그림"""
+        needed = self.viewport_height // self.row_height + 2 + 2 * self.overscan
+        while len(self._slots) < needed:
+            self._slots.append(self._create_slot())
+        for slot in self._slots[needed:]:
+            slot.frame.place_forget()
+            slot.frame.destroy()
+        del self._slots[needed:]
+        self.offset = min(self.offset, self.max_offset)
+        self._render()
+
+    def _render(self):
+        first, last = visible_range(self.offset, self.viewport_height, self.row_height, self.count, self.overscan)
+        indices = range(first, last)
+        # 이미 같은 행을 그리고 있는 위젯은 위치만 옮기고, 나머지 위젯에 새 행을 그림
+        by_index = {slot.index: slot for slot in self._slots if slot.index in indices}
+        free = [slot for slot in self._slots if slot.index not in by_index or by_index[slot.index] is not slot]
+        for index in indices:
+            slot = by_index.get(index) or free.pop()
+            if slot.index != index:
+                self._draw(slot, index)
+            slot.frame.place(x=0, y=index * self.row_height - self.offset)
+        for slot in free:
+            slot.index = None
+            slot.frame.place_forget()
+        self._update_scrollbar()
+
+    def _draw(self, slot, index, force=False):
+        texts = tuple(self.get_row(index))
+        selected = bool(self.is_selected(index))
+        if force or texts != slot.texts:
+            for label, text in zip(slot.labels, texts):
+                label.configure(text=text)
+            slot.texts = texts
+        slot.index = index
+        if force or selected != slot.selected:
+            slot.selected = selected
+            colors = self.selected_text_colors if selected else self.text_colors
+            for i, label in enumerate(slot.labels):
+                label.configure(text_color=colors[0] if i == 0 else colors[1])
+        self._paint(slot)
+
+    def _paint(self, slot):
+        if slot.selected:
+            color = self.selected_color
+        elif slot.hover:
+            color = self.hover_color
+        else:
+            color = self.bg
+        if slot.frame.cget("fg_color") != color:
+            slot.frame.configure(fg_color=color)
+
+    def _update_scrollbar(self):
+        total = self.count * self.row_height
+        if total <= self.viewport_height:
+            self.scrollbar.set(0, 1)
+        else:
+            self.scrollbar.set(self.offset / total, (self.offset + self.viewport_height) / total)